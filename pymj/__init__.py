@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pymj.analysis.call_analyzer import (
+        analyze_call_options,
+        analyze_kan_options,
+    )
+    from pymj.analysis.discard_planner import plan_discard
+    from pymj.analysis.exact_win_probability import calculate_win_probability
+    from pymj.analysis.hand_state_cache import HandStateCache
+    from pymj.analysis.symmetric_hand_cache import SymmetricHandCache
+    from pymj.analysis.win_probability import estimate_win_probability
+    from pymj.corpus.hand_corpus import HandCorpus, HandCorpusWriter
+    from pymj.enums.score_data import ScoreData
+    from pymj.enums.scoring_context_data import ScoringContextData
+    from pymj.game.table import Table
+    from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+    from pymj.hand_checker.instrumented_normal_form_checker import (
+        InstrumentedNormalFormChecker,
+    )
+    from pymj.hand_checker.normal_form_checker import NormalFormChecker
+    from pymj.hand_checker.seven_pair_checker import SevenPairChecker
+    from pymj.hand_checker.thirteen_orphan_checker import ThirteenOrphanChecker
+    from pymj.logs.mjai import MjaiAdapter
+    from pymj.scoring.score import score_hand
+    from pymj.scoring.wait_value import wait_value_table
+    from pymj.tiles.hand import Hand
+    from pymj.tiles.hand_info import HandInfo
+    from pymj.tiles.hand_parser import HandParser
+    from pymj.tiles.tile import Tile
+    from pymj.tiles.tile_count import TileCount
+    from pymj.wall.wall import Wall
+
+# Module of each name of the public API. Names are imported from their modules on
+# first access, so importing pymj alone is cheap and a process only pays for the
+# subsystems it uses, such as the NumPy-based wall, game and feature modules.
+_API_MODULES = {
+    "analyze_call_options": "pymj.analysis.call_analyzer",
+    "analyze_kan_options": "pymj.analysis.call_analyzer",
+    "plan_discard": "pymj.analysis.discard_planner",
+    "calculate_win_probability": "pymj.analysis.exact_win_probability",
+    "HandStateCache": "pymj.analysis.hand_state_cache",
+    "SymmetricHandCache": "pymj.analysis.symmetric_hand_cache",
+    "estimate_win_probability": "pymj.analysis.win_probability",
+    "HandCorpus": "pymj.corpus.hand_corpus",
+    "HandCorpusWriter": "pymj.corpus.hand_corpus",
+    "ScoreData": "pymj.enums.score_data",
+    "ScoringContextData": "pymj.enums.scoring_context_data",
+    "Table": "pymj.game.table",
+    "CombinedHandChecker": "pymj.hand_checker.combined_hand_checker",
+    "InstrumentedNormalFormChecker": (
+        "pymj.hand_checker.instrumented_normal_form_checker"
+    ),
+    "NormalFormChecker": "pymj.hand_checker.normal_form_checker",
+    "SevenPairChecker": "pymj.hand_checker.seven_pair_checker",
+    "ThirteenOrphanChecker": "pymj.hand_checker.thirteen_orphan_checker",
+    "MjaiAdapter": "pymj.logs.mjai",
+    "score_hand": "pymj.scoring.score",
+    "wait_value_table": "pymj.scoring.wait_value",
+    "Hand": "pymj.tiles.hand",
+    "HandInfo": "pymj.tiles.hand_info",
+    "HandParser": "pymj.tiles.hand_parser",
+    "Tile": "pymj.tiles.tile",
+    "TileCount": "pymj.tiles.tile_count",
+    "Wall": "pymj.wall.wall",
+}
+
+__all__ = [
+    "CombinedHandChecker",
+    "Hand",
+    "HandCorpus",
+    "HandCorpusWriter",
+    "HandInfo",
+    "HandParser",
+    "HandStateCache",
+    "InstrumentedNormalFormChecker",
+    "MjaiAdapter",
+    "NormalFormChecker",
+    "ScoreData",
+    "ScoringContextData",
+    "SevenPairChecker",
+    "SymmetricHandCache",
+    "Table",
+    "ThirteenOrphanChecker",
+    "Tile",
+    "TileCount",
+    "Wall",
+    "analyze_call_options",
+    "analyze_kan_options",
+    "calculate_win_probability",
+    "estimate_win_probability",
+    "plan_discard",
+    "score_hand",
+    "wait_value_table",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a name of the public API on first access.
+
+    Args:
+        name (str): Name to look up.
+
+    Returns:
+        Any: Object of the name, cached in the module afterwards.
+
+    Raises:
+        AttributeError: If the name is not part of the public API.
+
+    """
+    module_name = _API_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(name)
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the names of the module including the lazily imported ones.
+
+    Returns:
+        list[str]: Names of the module.
+
+    """
+    return sorted({*globals(), *__all__})
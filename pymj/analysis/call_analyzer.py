@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from pymj.analysis.hand_state_cache import HandStateCache
+from pymj.enums.call_option import CallOption
+from pymj.enums.call_option_data import CallOptionData
+from pymj.enums.call_type import CallType
+from pymj.enums.kan_option_data import KanOptionData
+from pymj.enums.player_relation import PlayerRelation
+from pymj.game.seat import find_call_options, find_kan_options
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_mapping import TileMapping
+
+
+def _find_swap_discards(option: CallOption) -> set[int]:
+    """Find the discards forbidden right after a chii or pon (kuikae).
+
+    The called tile may not be discarded, nor the tile at the other end of a
+    sequence called from one of its ends.
+    """
+    tile = option.tiles[0]
+    forbidden = {tile}
+    if option.call_type is CallType.CHII:
+        others = option.tiles[1:]
+        if tile < min(others) and tile % 9 <= 5:
+            forbidden.add(tile + 3)
+        elif tile > max(others) and tile % 9 >= 3:
+            forbidden.add(tile - 3)
+    return forbidden
+
+
+def _to_tiles(mask: int) -> list[int]:
+    return [tile for tile in range(34) if mask >> tile & 1]
+
+
+def analyze_call_options(
+    hand_info: HandInfo,
+    discarded_tile: int,
+    relation: PlayerRelation,
+    can_kan: bool = True,
+    checker: BaseHandChecker | None = None,
+) -> list[CallOptionData]:
+    """Analyze every call a hand can make on a discarded tile.
+
+    Each chii, pon and big melded kan found by `find_call_options` is made on a
+    copy of the counts. After a chii or pon, the shanten numbers of all legal
+    discards are computed first, and ukeire only for the discards keeping the
+    lowest one, as most discards are ruled out by their shanten number alone.
+    After a kan, the hand is analyzed as it waits for the replacement draw.
+    Analyses of an option share one `HandStateCache`.
+
+    Args:
+        hand_info (HandInfo): Hand with 3n+1 concealed tiles and no winning tile.
+        discarded_tile (int): Index of the discarded tile.
+        relation (PlayerRelation): Relation to the player who discarded it.
+        can_kan (bool, optional): Whether a kan can still be declared. Defaults
+            to True.
+        checker (BaseHandChecker | None, optional): Checker that judges the hand.
+            Defaults to CombinedHandChecker.
+
+    Returns:
+        list[CallOptionData]: Analyses of the calls, ranked by shanten number and
+            then by number of ukeire.
+
+    Raises:
+        ValueError: If the hand is not 3n+1 tiles without a winning tile.
+
+    """
+    if hand_info.concealed_count.num_tiles % 3 != 1 or hand_info.agari_tile:
+        raise ValueError
+
+    checker = checker or CombinedHandChecker()
+    results = []
+    for option in find_call_options(
+        hand_info.concealed_count,
+        discarded_tile,
+        relation,
+        can_kan,
+    ):
+        counts = list(hand_info.concealed_count)
+        for tile in option.tiles[1:]:
+            counts[tile] -= 1
+        cache = HandStateCache(
+            [
+                *hand_info.call_counts,
+                (option.call_type, TileCount.create_from_indices(option.tiles)),
+            ],
+            checker,
+        )
+        packed = TileCount(counts).pack()
+
+        if option.call_type is CallType.BIG_MELDED_KAN:
+            shanten, ukeire_mask, num_ukeire = cache.analyze(packed)
+            results.append(
+                CallOptionData(
+                    option,
+                    shanten,
+                    None,
+                    _to_tiles(ukeire_mask),
+                    num_ukeire,
+                ),
+            )
+            continue
+
+        forbidden = _find_swap_discards(option)
+        shantens = {
+            tile: cache.shanten(packed - (1 << 3 * tile))
+            for tile in range(34)
+            if counts[tile] and tile not in forbidden
+        }
+        if not shantens:
+            continue
+        shanten = min(shantens.values())
+        discard_tile = max(
+            (tile for tile, value in shantens.items() if value == shanten),
+            key=lambda tile: (cache.analyze(packed - (1 << 3 * tile))[2], -tile),
+        )
+        _, ukeire_mask, num_ukeire = cache.analyze(packed - (1 << 3 * discard_tile))
+        results.append(
+            CallOptionData(
+                option,
+                shanten,
+                discard_tile,
+                _to_tiles(ukeire_mask),
+                num_ukeire,
+            ),
+        )
+
+    results.sort(key=lambda result: (result.shanten, -result.num_ukeire))
+    return results
+
+
+def _analyze_hand(
+    cache: HandStateCache,
+    counts: list[int],
+) -> tuple[int, list[int], int]:
+    """Calculate the shanten number, waits and ukeire of a hand of 3n+1 tiles."""
+    shanten, _, num_ukeire = cache.analyze(TileCount(counts).pack())
+    waits_mask = 0
+    if shanten == 0:
+        waits_mask = cache.checker.calculate_waits(
+            HandInfo(TileCount(counts), cache.call_counts),
+        )
+    return shanten, _to_tiles(waits_mask), num_ukeire
+
+
+def analyze_kan_options(
+    hand_info: HandInfo,
+    checker: BaseHandChecker | None = None,
+) -> list[KanOptionData]:
+    """Analyze every concealed and small melded kan a hand can declare.
+
+    Each kan found by `find_kan_options` compares the hand without one copy of
+    the kan tile with the hand after the kan, by shanten number, waits and
+    ukeire. The hands before the kans keep the calls of the hand, so their
+    analyses share one `HandStateCache`, and waits are only searched for tenpai
+    hands.
+
+    Args:
+        hand_info (HandInfo): Hand with 3n+1 concealed tiles and a drawn tile as
+            agari_tile.
+        checker (BaseHandChecker | None, optional): Checker that judges the hand.
+            Defaults to CombinedHandChecker.
+
+    Returns:
+        list[KanOptionData]: Analyses of the kans, concealed kans first.
+
+    Raises:
+        ValueError: If the hand is not 3n+1 tiles with a drawn tile.
+
+    """
+    if hand_info.concealed_count.num_tiles % 3 != 1 or hand_info.agari_tile is None:
+        raise ValueError
+
+    checker = checker or CombinedHandChecker()
+    drawn_tile = TileMapping.tile_to_index(hand_info.agari_tile)
+    counts = list(hand_info.concealed_count)
+    counts[drawn_tile] += 1
+    before_cache = HandStateCache(hand_info.call_counts, checker)
+
+    results = []
+    for option in find_kan_options(counts, hand_info.call_counts):
+        tile = option.tiles[0]
+        before_counts = counts[:]
+        before_counts[tile] -= 1
+        after_counts = counts[:]
+        kan_count = TileCount.create_from_indices(option.tiles)
+        if option.call_type is CallType.CONCEALED_KAN:
+            after_counts[tile] -= 4
+            call_counts = [*hand_info.call_counts, (option.call_type, kan_count)]
+        else:
+            after_counts[tile] -= 1
+            call_counts = [
+                (option.call_type, kan_count)
+                if call_type is CallType.PON and call_count[tile]
+                else (call_type, call_count)
+                for call_type, call_count in hand_info.call_counts
+            ]
+
+        shanten_before, waits_before, num_ukeire_before = _analyze_hand(
+            before_cache,
+            before_counts,
+        )
+        shanten_after, waits_after, num_ukeire_after = _analyze_hand(
+            HandStateCache(call_counts, checker),
+            after_counts,
+        )
+        results.append(
+            KanOptionData(
+                option=option,
+                shanten_before=shanten_before,
+                shanten_after=shanten_after,
+                waits_before=waits_before,
+                waits_after=waits_after,
+                num_ukeire_before=num_ukeire_before,
+                num_ukeire_after=num_ukeire_after,
+                is_riichi_legal=option.call_type is CallType.CONCEALED_KAN
+                and tile == drawn_tile
+                and shanten_before == 0
+                and waits_before == waits_after,
+            ),
+        )
+    return results
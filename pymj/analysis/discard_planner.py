@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import time
+
+from pymj.analysis.hand_state_cache import HandStateCache
+from pymj.enums.discard_plan_data import DiscardPlanData
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_mapping import TileMapping
+
+
+class _DeadlineError(Exception):
+    """Raised inside the search when the deadline has passed."""
+
+
+class _DiscardPlanner:
+    """Expectimax over draws and discards with a transposition table.
+
+    Positions are hands of 3n+1 tiles with a number of draws left, keyed by their
+    packed counts. A draw comes from the pool less the copies the hand gained over
+    the starting hand, so positions do not depend on the order of the draws. A
+    position that cannot win within its draws is worth 0 without expanding it,
+    and one with no draw to spare only expands its ukeire.
+    """
+
+    def __init__(
+        self,
+        cache: HandStateCache,
+        start: list[int],
+        pool: list[int],
+        deadline: float | None,
+    ) -> None:
+        self.cache = cache
+        self.start = start
+        self.pool = pool
+        self.deadline = deadline
+        self._values: dict[tuple[int, int], float] = {}
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self._values)
+
+    def is_past_deadline(self) -> bool:
+        return self.deadline is not None and time.perf_counter() > self.deadline
+
+    def value(self, packed: int, num_draws: int) -> float:
+        shanten = self.cache.shanten(packed)
+        if shanten >= num_draws:
+            return 0.0
+        key = (packed, num_draws)
+        value = self._values.get(key)
+        if value is not None:
+            return value
+        if self.is_past_deadline():
+            raise _DeadlineError
+
+        available = [
+            max(
+                0,
+                self.pool[tile]
+                - max(0, (packed >> 3 * tile & 0b111) - self.start[tile]),
+            )
+            for tile in range(34)
+        ]
+        num_unseen = sum(available)
+        draw_mask = (1 << 34) - 1
+        if shanten == num_draws - 1:
+            # Without a draw to spare, only ukeire draws can lead to a win.
+            draw_mask = self.cache.analyze(packed)[1]
+
+        value = 0.0
+        for tile in range(34):
+            if not available[tile] or not draw_mask >> tile & 1:
+                continue
+            if self.cache.shanten(packed, tile) == -1:
+                value += available[tile]
+            elif num_draws > 1:
+                value += available[tile] * self.best_value(
+                    packed + (1 << 3 * tile),
+                    num_draws - 1,
+                )
+
+        value = value / num_unseen if num_unseen else 0.0
+        self._values[key] = value
+        return value
+
+    def best_value(self, packed: int, num_draws: int) -> float:
+        return max(
+            self.value(packed - (1 << 3 * tile), num_draws)
+            for tile in range(34)
+            if packed >> 3 * tile & 0b111
+        )
+
+
+def plan_discard(
+    hand_info: HandInfo,
+    pool: TileCount | None = None,
+    depth: int = 3,
+    deadline_ms: float | None = None,
+    checker: BaseHandChecker | None = None,
+) -> DiscardPlanData:
+    """Recommend the discard with the best chance to win within some draws.
+
+    The search is an expectimax over the draws from the pool and the discards of
+    the player, deepened one draw at a time up to `depth`. Candidates are first
+    ordered by their shanten number and ukeire, as in `calculate_efficiency`, and
+    each completed depth reorders them by probability, keeping that order on ties.
+    When the deadline passes, the search stops and the best candidate of the last
+    completed depth is returned, or the first candidate if none completed.
+    Positions are memoized across depths in a transposition table.
+
+    Args:
+        hand_info (HandInfo): Hand with 3n+1 concealed tiles and a drawn tile as
+            agari_tile.
+        pool (TileCount | None, optional): Tiles that can still be drawn. Defaults
+            to None for all copies unseen by the hand.
+        depth (int, optional): Maximum number of draws to search. Defaults to 3.
+        deadline_ms (float | None, optional): Time budget in milliseconds, or None
+            to search to full depth. Defaults to None.
+        checker (BaseHandChecker | None, optional): Checker that judges the hand.
+            Defaults to CombinedHandChecker.
+
+    Returns:
+        DiscardPlanData: Recommended discard with the probabilities found.
+
+    Raises:
+        ValueError: If the hand is not 3n+1 tiles with a drawn tile, or depth is
+            negative.
+
+    """
+    if hand_info.concealed_count.num_tiles % 3 != 1 or hand_info.agari_tile is None:
+        raise ValueError
+    if depth < 0:
+        raise ValueError
+
+    deadline = None if deadline_ms is None else time.perf_counter() + deadline_ms / 1000
+    counts = list(hand_info.concealed_count)
+    counts[TileMapping.tile_to_index(hand_info.agari_tile)] += 1
+    if pool is None:
+        pool = TileCount([4 - count for count in hand_info.total_count])
+    cache = HandStateCache(hand_info.call_counts, checker or CombinedHandChecker())
+    planner = _DiscardPlanner(cache, counts, list(pool), deadline)
+    packed = TileCount(counts).pack()
+    candidates = [tile for tile in range(34) if counts[tile]]
+    plan = DiscardPlanData(discard_tile=candidates[0])
+
+    scores: dict[int, tuple[int, int]] = {}
+    for tile in candidates:
+        if planner.is_past_deadline():
+            break
+        shanten, _, num_ukeire = cache.analyze(packed - (1 << 3 * tile))
+        scores[tile] = (shanten, -num_ukeire)
+    unscored = (BaseHandChecker.INFINITE_SHANTEN, 0)
+    candidates.sort(key=lambda tile: scores.get(tile, unscored))
+    plan.discard_tile = candidates[0]
+
+    for num_draws in range(1, depth + 1):
+        try:
+            probabilities = {
+                tile: planner.value(packed - (1 << 3 * tile), num_draws)
+                for tile in candidates
+            }
+        except _DeadlineError:
+            break
+        candidates.sort(key=lambda tile: -probabilities[tile])
+        plan.discard_tile = candidates[0]
+        plan.probability = probabilities[candidates[0]]
+        plan.depth = num_draws
+        plan.probabilities = probabilities
+
+    plan.num_nodes = planner.num_nodes
+    return plan
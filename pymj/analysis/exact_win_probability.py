@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from pymj.analysis.hand_state_cache import HandStateCache
+from pymj.enums.exact_win_probability_data import ExactWinProbabilityData
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile_count import TileCount
+
+
+class _WinProbabilitySolver:
+    """Solve the probability of reaching a target by memoized recursion.
+
+    A state is the concealed hand, the unseen copies of relevant tiles, the number
+    of other unseen tiles and the number of remaining draws. Relevant tiles are the
+    ukeire of any hand reachable within the draws; the other tiles are always
+    discarded right away, so they are interchangeable and only their number
+    matters.
+    """
+
+    def __init__(self, cache: HandStateCache, target_shanten: int) -> None:
+        self.cache = cache
+        self.target_shanten = target_shanten
+        self.num_states = 0
+        self._probabilities: dict[tuple[int, int, int, int], float] = {}
+
+    def find_relevant_mask(self, packed: int, num_draws: int) -> int:
+        relevant_mask = 0
+        visited = set()
+        stack = [(packed, num_draws)]
+        while stack:
+            packed, num_draws = stack.pop()
+            shanten, ukeire_mask, _ = self.cache.analyze(packed)
+            if (packed, num_draws) in visited or not self._can_reach(
+                shanten,
+                num_draws,
+            ):
+                continue
+            visited.add((packed, num_draws))
+            relevant_mask |= ukeire_mask
+            if shanten > 0:
+                stack.extend(
+                    (self.cache.advance(packed, tile), num_draws - 1)
+                    for tile in range(34)
+                    if ukeire_mask >> tile & 1
+                )
+        return relevant_mask
+
+    def solve(
+        self,
+        packed: int,
+        pool: int,
+        num_others: int,
+        num_draws: int,
+    ) -> float:
+        shanten, ukeire_mask, _ = self.cache.analyze(packed)
+        if shanten <= self.target_shanten:
+            return 1.0
+        if not self._can_reach(shanten, num_draws):
+            return 0.0
+
+        key = (packed, pool, num_others, num_draws)
+        probability = self._probabilities.get(key)
+        if probability is not None:
+            return probability
+        self.num_states += 1
+
+        num_unseen = num_others + sum(pool >> 3 * tile & 0b111 for tile in range(34))
+        can_wait = self._can_reach(shanten, num_draws - 1)
+        probability = 0.0
+        if can_wait and num_others:
+            probability += num_others * self.solve(
+                packed,
+                pool,
+                num_others - 1,
+                num_draws - 1,
+            )
+        for tile in range(34):
+            count = pool >> 3 * tile & 0b111
+            if not count:
+                continue
+            next_pool = pool - (1 << 3 * tile)
+            if ukeire_mask >> tile & 1:
+                probability += count * (
+                    1.0
+                    if shanten == 0
+                    else self.solve(
+                        self.cache.advance(packed, tile),
+                        next_pool,
+                        num_others,
+                        num_draws - 1,
+                    )
+                )
+            elif can_wait:
+                probability += count * self.solve(
+                    packed,
+                    next_pool,
+                    num_others,
+                    num_draws - 1,
+                )
+
+        probability /= num_unseen
+        self._probabilities[key] = probability
+        return probability
+
+    def _can_reach(self, shanten: int, num_draws: int) -> bool:
+        return shanten - self.target_shanten <= num_draws
+
+
+def calculate_win_probability(
+    hand_info: HandInfo,
+    visible: TileCount | None = None,
+    draws: int = 1,
+    target_shanten: int = -1,
+    checker: BaseHandChecker | None = None,
+) -> ExactWinProbabilityData:
+    """Calculate the exact probability of reaching tenpai or agari within draws.
+
+    The play is the same as in `estimate_win_probability`: an ukeire draw is kept
+    and followed by the discard with the most ukeire, and any other draw is
+    discarded right away. Instead of sampling, every draw is weighted by its number
+    of unseen copies in a search over hand states with a transposition table.
+    States that need more shanten reductions than draws remain are pruned.
+
+    Args:
+        hand_info (HandInfo): Hand with 3n+1 concealed tiles and no winning tile.
+        visible (TileCount | None, optional): Tiles seen outside the hand, such as
+            discards, calls of other players and dora indicators. Defaults to None.
+        draws (int, optional): Number of draws k. Defaults to 1.
+        target_shanten (int, optional): Shanten number to reach, 0 for tenpai and
+            -1 for agari by self-draw. Defaults to -1.
+        checker (BaseHandChecker | None, optional): Checker that judges the hand.
+            Defaults to CombinedHandChecker.
+
+    Returns:
+        ExactWinProbabilityData: Probability of reaching the target within k draws
+            and the number of states explored.
+
+    Raises:
+        ValueError: If the hand is not 3n+1 tiles without a winning tile, more than
+            four copies of a tile are seen, fewer than k tiles are unseen, or the
+            target is neither 0 nor -1.
+
+    """
+    if hand_info.concealed_count.num_tiles % 3 != 1 or hand_info.agari_tile:
+        raise ValueError
+    if draws < 0 or target_shanten not in (0, -1):
+        raise ValueError
+
+    seen = hand_info.total_count + (visible or TileCount())
+    if any(count > 4 for count in seen):
+        raise ValueError
+    if 136 - seen.num_tiles < draws:
+        raise ValueError
+
+    cache = HandStateCache(hand_info.call_counts, checker or CombinedHandChecker())
+    solver = _WinProbabilitySolver(cache, target_shanten)
+    packed = TileCount(list(hand_info.concealed_count)).pack()
+    relevant_mask = solver.find_relevant_mask(packed, draws)
+
+    relevant_pool = TileCount()
+    for tile in range(34):
+        if relevant_mask >> tile & 1:
+            relevant_pool[tile] = 4 - seen[tile]
+    num_others = 136 - seen.num_tiles - relevant_pool.num_tiles
+
+    probability = solver.solve(packed, relevant_pool.pack(), num_others, draws)
+    return ExactWinProbabilityData(
+        probability=probability,
+        num_states=solver.num_states,
+    )
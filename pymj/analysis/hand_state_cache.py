@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from pymj.enums.call_type import CallType
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_mapping import TileMapping
+
+
+class HandStateCache:
+    """Memoize hand checker results for hands met while drawing and discarding.
+
+    Concealed hands are given as packed counts without red fives (see
+    `TileCount.pack`), while calls stay fixed. Analyses that visit the same hands
+    many times, such as simulations and searches over draws, share one cache to
+    compute shanten numbers, ukeire and best discards only once per hand.
+
+    Attributes:
+        call_counts (list[tuple[CallType, TileCount]]): Calls of the hands.
+        checker (BaseHandChecker): Checker that judges the hands.
+
+    """
+
+    def __init__(
+        self,
+        call_counts: list[tuple[CallType, TileCount]],
+        checker: BaseHandChecker,
+    ) -> None:
+        """Initialize an empty cache for hands with fixed calls.
+
+        Args:
+            call_counts (list[tuple[CallType, TileCount]]): Calls of the hands.
+            checker (BaseHandChecker): Checker that judges the hands.
+
+        """
+        self.call_counts = call_counts
+        self._called = list(sum((count for _, count in call_counts), TileCount()))
+        self.checker = checker
+        self._shantens: dict[int, int] = {}
+        self._analyses: dict[int, tuple[int, int, int]] = {}
+        self._transitions: dict[tuple[int, int], int] = {}
+
+    def shanten(self, packed: int, drawn_tile: int | None = None) -> int:
+        """Calculate the shanten number of a hand, optionally with a drawn tile.
+
+        Hands are keyed with the drawn tile included, so a hand of 3n+2 tiles is
+        computed once however it was reached.
+
+        Args:
+            packed (int): Packed counts of 3n+1 concealed tiles.
+            drawn_tile (int | None, optional): Index of a drawn tile. Defaults to
+                None.
+
+        Returns:
+            int: Shanten number of the hand.
+
+        """
+        key = packed if drawn_tile is None else packed + (1 << 3 * drawn_tile)
+        shanten = self._shantens.get(key)
+        if shanten is None:
+            hand_info = HandInfo(TileCount.unpack(packed), self.call_counts)
+            if drawn_tile is not None:
+                hand_info.agari_tile = TileMapping.index_to_tile(drawn_tile)
+            shanten = self.checker.calculate_shanten(hand_info)
+            self._shantens[key] = shanten
+        return shanten
+
+    def analyze(self, packed: int) -> tuple[int, int, int]:
+        """Calculate the shanten number and ukeire of a hand.
+
+        Args:
+            packed (int): Packed counts of 3n+1 concealed tiles.
+
+        Returns:
+            tuple[int, int, int]: Shanten number, bitmask of the ukeire tile
+                indices, and number of ukeire copies unseen by the hand, the latter
+                two as in `BaseHandChecker.calculate_ukeire`.
+
+        """
+        analysis = self._analyses.get(packed)
+        if analysis is None:
+            shanten = self.shanten(packed)
+            ukeire_mask = num_ukeire = 0
+            for tile in range(34):
+                num_unseen = 4 - (packed >> 3 * tile & 0b111) - self._called[tile]
+                if num_unseen and self.shanten(packed, tile) == shanten - 1:
+                    ukeire_mask |= 1 << tile
+                    num_ukeire += num_unseen
+            analysis = (shanten, ukeire_mask, num_ukeire)
+            self._analyses[packed] = analysis
+        return analysis
+
+    def advance(self, packed: int, drawn_tile: int) -> int:
+        """Find the hand after drawing an ukeire tile and making the best discard.
+
+        The best discard keeps the reduced shanten number with the most ukeire,
+        preferring lower tiles on ties, as ranked by `calculate_efficiency`.
+
+        Args:
+            packed (int): Packed counts of 3n+1 concealed tiles.
+            drawn_tile (int): Index of a drawn tile among the ukeire of the hand.
+
+        Returns:
+            int: Packed counts of the hand after the discard.
+
+        """
+        key = (packed, drawn_tile)
+        if key not in self._transitions:
+            shanten = self.analyze(packed)[0] - 1
+            drawn_packed = packed + (1 << 3 * drawn_tile)
+            candidates = [
+                drawn_packed - (1 << 3 * tile)
+                for tile in range(34)
+                if drawn_packed >> 3 * tile & 0b111
+            ]
+            self._transitions[key] = max(
+                (
+                    candidate
+                    for candidate in candidates
+                    if self.analyze(candidate)[0] == shanten
+                ),
+                key=lambda candidate: self.analyze(candidate)[2],
+            )
+        return self._transitions[key]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from pymj.enums.efficiency_data import EfficiencyData
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.symmetry import (
+    HandKey,
+    canonicalize,
+    create_hand_info,
+    invert_transform,
+)
+
+
+def _map_mask(mask: int, transform: tuple[int, ...]) -> int:
+    mapped = 0
+    for tile in range(34):
+        if mask >> tile & 1:
+            mapped |= 1 << transform[tile]
+    return mapped
+
+
+class SymmetricHandCache:
+    """Memoize hand checker results shared by suit symmetric hands.
+
+    Hands are looked up by their key from `canonicalize`, so a hand and the up to
+    11 hands obtained by permuting its suits or mirroring its numbers share one
+    entry. Results are computed on the canonical hand and mapped back to the tiles
+    of the asked hand through the inverse transform. Unlike `HandStateCache`, calls
+    may differ between hands, as they are part of the key.
+
+    Attributes:
+        checker (BaseHandChecker): Checker that judges the hands.
+
+    """
+
+    def __init__(self, checker: BaseHandChecker) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            checker (BaseHandChecker): Checker that judges the hands.
+
+        """
+        self.checker = checker
+        self._shantens: dict[HandKey, int] = {}
+        self._waits: dict[HandKey, int] = {}
+        self._efficiencies: dict[HandKey, list[EfficiencyData]] = {}
+
+    def calculate_shanten(self, hand_info: HandInfo) -> int:
+        """Calculate the shanten number of a hand, as `calculate_shanten`.
+
+        Args:
+            hand_info (HandInfo): Hand with 3n+1 concealed tiles and an optional
+                winning tile.
+
+        Returns:
+            int: Shanten number, where 0 means tenpai, -1 means winning hand.
+
+        """
+        key, _ = canonicalize(hand_info)
+        shanten = self._shantens.get(key)
+        if shanten is None:
+            shanten = self.checker.calculate_shanten(create_hand_info(key))
+            self._shantens[key] = shanten
+        return shanten
+
+    def calculate_waits(self, hand_info: HandInfo) -> int:
+        """Calculate the tiles that complete a hand, as `calculate_waits`.
+
+        Args:
+            hand_info (HandInfo): Hand with 3n+1 concealed tiles and no winning
+                tile.
+
+        Returns:
+            int: Bitmask with bit i set if tile index i completes the hand.
+
+        Raises:
+            ValueError: If hand tile count is not 3n+1 or winning tile is given.
+
+        """
+        if hand_info.concealed_count.num_tiles % 3 != 1 or hand_info.agari_tile:
+            raise ValueError
+
+        key, transform = canonicalize(hand_info)
+        waits_mask = self._waits.get(key)
+        if waits_mask is None:
+            waits_mask = self.checker.calculate_waits(create_hand_info(key))
+            self._waits[key] = waits_mask
+        return _map_mask(waits_mask, invert_transform(transform))
+
+    def calculate_efficiency(self, hand_info: HandInfo) -> list[EfficiencyData]:
+        """Calculate discard efficiency of a hand, as `calculate_efficiency`.
+
+        Efficiency only depends on the tiles of the hand, so hands differing in
+        which tile was drawn also share an entry.
+
+        Args:
+            hand_info (HandInfo): Hand with 3n+1 concealed tiles and a drawn tile
+                as agari_tile.
+
+        Returns:
+            list[EfficiencyData]: Efficiency of each discard keeping the shanten
+                number, in the tiles of the hand and in the same order.
+
+        Raises:
+            ValueError: If hand tile count is not 3n+1 + agari_tile.
+
+        """
+        if hand_info.concealed_count.num_tiles % 3 != 1 or hand_info.agari_tile is None:
+            raise ValueError
+
+        key, transform = canonicalize(hand_info)
+        efficiency = self._efficiencies.get(key)
+        if efficiency is None:
+            efficiency = self.checker.calculate_efficiency(create_hand_info(key))
+            self._efficiencies[key] = efficiency
+
+        inverse = invert_transform(transform)
+        mapped = [
+            EfficiencyData(
+                discard_tile=inverse[data.discard_tile],
+                ukeire=sorted(inverse[tile] for tile in data.ukeire),
+                num_ukeire=data.num_ukeire,
+            )
+            for data in efficiency
+        ]
+        mapped.sort(key=lambda x: (-x.num_ukeire, x.discard_tile))
+        return mapped
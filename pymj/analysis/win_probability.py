@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+import numpy.typing as npt
+
+from pymj.analysis.hand_state_cache import HandStateCache
+from pymj.enums.win_probability_data import WinProbabilityData
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile_count import TileCount
+
+BATCH_SIZE = 4096
+
+
+def _play(cache: HandStateCache, packed: int, draws: list[int]) -> tuple[int, int]:
+    """Play a draw sequence and return when tenpai and agari were reached.
+
+    Drawn tiles outside the ukeire are discarded right away (tsumogiri). The
+    returned numbers of draws are len(draws) + 1 for goals never reached.
+    """
+    never = len(draws) + 1
+    shanten, ukeire_mask, _ = cache.analyze(packed)
+    tenpai_at = 0 if shanten <= 0 else never
+    for num_draws, tile in enumerate(draws, start=1):
+        if not ukeire_mask >> tile & 1:
+            continue
+        if shanten == 0:
+            return tenpai_at, num_draws
+        packed = cache.advance(packed, tile)
+        shanten, ukeire_mask, _ = cache.analyze(packed)
+        if shanten == 0:
+            tenpai_at = num_draws
+    return tenpai_at, never
+
+
+def _simulate_batches(
+    hand_info: HandInfo,
+    pool: npt.NDArray[np.uint8],
+    num_draws: int,
+    batches: list[tuple[int, np.random.SeedSequence]],
+    checker: BaseHandChecker,
+) -> npt.NDArray[np.int64]:
+    cache = HandStateCache(hand_info.call_counts, checker)
+    packed = TileCount(list(hand_info.concealed_count)).pack()
+    shanten, ukeire_mask, _ = cache.analyze(packed)
+    is_ukeire = np.array([ukeire_mask >> tile & 1 for tile in range(34)], dtype=bool)
+
+    hits = np.zeros((2, num_draws + 2), dtype=np.int64)
+    for num_samples, seed in batches:
+        rng = np.random.default_rng(seed)
+        draws = rng.permuted(np.broadcast_to(pool, (num_samples, len(pool))), axis=1)
+        draws = draws[:, :num_draws]
+
+        # Sequences that never draw an ukeire tile of the starting hand keep it as
+        # is, so only the others have to be played one by one.
+        touched = is_ukeire[draws].any(axis=1)
+        num_untouched = num_samples - np.count_nonzero(touched)
+        hits[0, 0 if shanten <= 0 else num_draws + 1] += num_untouched
+        hits[1, num_draws + 1] += num_untouched
+        for row in draws[touched].tolist():
+            tenpai_at, agari_at = _play(cache, packed, row)
+            hits[0, tenpai_at] += 1
+            hits[1, agari_at] += 1
+    return hits
+
+
+def estimate_win_probability(
+    hand_info: HandInfo,
+    visible: TileCount | None = None,
+    draws: int = 1,
+    samples: int = 10000,
+    seed: int | None = None,
+    num_workers: int = 1,
+    checker: BaseHandChecker | None = None,
+) -> WinProbabilityData:
+    """Estimate the probability of reaching tenpai or agari within some draws.
+
+    Draws are sampled uniformly from the tiles unseen by the player, i.e. all tiles
+    except the hand and the visible tiles. A drawn tile that reduces the shanten
+    number is kept and the hand then discards the tile with the most ukeire (see
+    `BaseHandChecker.calculate_efficiency`); any other drawn tile is discarded
+    right away. Analyses of the hands met are memoized across samples.
+
+    Samples are simulated in batches of BATCH_SIZE with seeds spawned from `seed`,
+    so estimates for a seed do not depend on the number of workers.
+
+    Args:
+        hand_info (HandInfo): Hand with 3n+1 concealed tiles and no winning tile.
+        visible (TileCount | None, optional): Tiles seen outside the hand, such as
+            discards, calls of other players and dora indicators. Defaults to None.
+        draws (int, optional): Number of draws k. Defaults to 1.
+        samples (int, optional): Number of simulated draw sequences. Defaults to
+            10000.
+        seed (int | None, optional): Seed of the random draws. Defaults to None.
+        num_workers (int, optional): Number of processes to simulate batches in.
+            Defaults to 1 to simulate in the calling process.
+        checker (BaseHandChecker | None, optional): Checker that judges the hand.
+            Defaults to CombinedHandChecker.
+
+    Returns:
+        WinProbabilityData: Estimated probabilities within 0 to k draws.
+
+    Raises:
+        ValueError: If the hand is not 3n+1 tiles without a winning tile, more than
+            four copies of a tile are seen, or fewer than k tiles are unseen.
+
+    """
+    if hand_info.concealed_count.num_tiles % 3 != 1 or hand_info.agari_tile:
+        raise ValueError
+    if draws < 0 or samples <= 0 or num_workers <= 0:
+        raise ValueError
+
+    seen = hand_info.total_count + (visible or TileCount())
+    if any(count > 4 for count in seen):
+        raise ValueError
+    pool = np.repeat(np.arange(34, dtype=np.uint8), [4 - count for count in seen])
+    if len(pool) < draws:
+        raise ValueError
+
+    batch_sizes = [BATCH_SIZE] * (samples // BATCH_SIZE)
+    if samples % BATCH_SIZE:
+        batch_sizes.append(samples % BATCH_SIZE)
+    seeds = np.random.SeedSequence(seed).spawn(len(batch_sizes))
+    batches = list(zip(batch_sizes, seeds, strict=True))
+    checker = checker or CombinedHandChecker()
+
+    hits: npt.NDArray[np.int64]
+    if num_workers == 1:
+        hits = _simulate_batches(hand_info, pool, draws, batches, checker)
+    else:
+        with ProcessPoolExecutor(num_workers) as executor:
+            hits = np.sum(
+                list(
+                    executor.map(
+                        _simulate_batches,
+                        repeat(hand_info),
+                        repeat(pool),
+                        repeat(draws),
+                        [batches[worker::num_workers] for worker in range(num_workers)],
+                        repeat(checker),
+                    ),
+                ),
+                axis=0,
+            )
+
+    probabilities = np.cumsum(hits, axis=1)[:, : draws + 1] / samples
+    return WinProbabilityData(
+        num_samples=samples,
+        tenpai_probabilities=probabilities[0].tolist(),
+        agari_probabilities=probabilities[1].tolist(),
+    )
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from pymj.bench.compare import (
+    DEFAULT_CONFIDENCE,
+    DEFAULT_THRESHOLD,
+    compare_results,
+    render_table,
+)
+from pymj.bench.corpora import DEFAULT_SEED
+from pymj.bench.suite import run_suite
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Args:
+        argv (Sequence[str] | None, optional): Arguments without the program name.
+            Defaults to None for the arguments of the process.
+
+    Returns:
+        int: Exit status, 1 if a compared case regressed, else 0.
+
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] not in ("run", "compare", "-h", "--help"):
+        argv.insert(0, "run")
+
+    parser = argparse.ArgumentParser(
+        prog="python -m pymj.bench",
+        description="Run the benchmark suite of pymj, or compare two of its runs.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser(
+        "run",
+        help="run the benchmark suite",
+        description="Time every checker operation over the seeded corpora and "
+        "write the results as JSON, to standard output by default.",
+    )
+    run_parser.add_argument("--output", type=Path, help="file to write JSON to")
+    run_parser.add_argument("--size", type=int, default=64, help="hands per corpus")
+    run_parser.add_argument("--rounds", type=int, default=5, help="timed rounds")
+    run_parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    run_parser.add_argument("--filter", default="", help="substring of case names")
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="compare two runs",
+        description="Compare two result files case by case. Print a table and exit "
+        "with status 1 if a case regressed significantly.",
+    )
+    compare_parser.add_argument("old", type=Path, help="results of the baseline")
+    compare_parser.add_argument("new", type=Path, help="results to compare")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative change to ignore",
+    )
+    compare_parser.add_argument(
+        "--confidence",
+        type=float,
+        default=DEFAULT_CONFIDENCE,
+        help="confidence level of the speedup intervals",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return _compare(args.old, args.new, args.threshold, args.confidence)
+
+    results = run_suite(args.size, args.rounds, args.seed, args.filter)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+def _compare(
+    old_path: Path,
+    new_path: Path,
+    threshold: float,
+    confidence: float,
+) -> int:
+    old = json.loads(old_path.read_text())
+    new = json.loads(new_path.read_text())
+    if old["settings"] != new["settings"]:
+        print("warning: runs have different settings", file=sys.stderr)
+
+    rows = compare_results(old, new, threshold, confidence)
+    print(render_table(rows))
+    regressed = [row["name"] for row in rows if row["status"] == "regressed"]
+    if regressed:
+        print(f"{len(regressed)} case(s) regressed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import random
+import statistics
+from typing import Any
+
+# Rounds of one run share the state of the machine, so intervals from them are
+# narrower than the variation between runs, which the threshold has to absorb.
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_CONFIDENCE = 0.95
+NUM_RESAMPLES = 2000
+
+
+def bootstrap_speedup_interval(
+    old_samples: list[float],
+    new_samples: list[float],
+    confidence: float = DEFAULT_CONFIDENCE,
+    rng: random.Random | None = None,
+) -> tuple[float, float]:
+    """Estimate a confidence interval of the speedup of new over old samples.
+
+    The speedup is the ratio of the mean throughputs, and its interval is the
+    percentile interval of the ratios of NUM_RESAMPLES resamples of each side.
+    With one sample on both sides, the interval is the ratio itself.
+
+    Args:
+        old_samples (list[float]): Operations per second of each round of the
+            old run.
+        new_samples (list[float]): Operations per second of each round of the
+            new run.
+        confidence (float, optional): Confidence level of the interval. Defaults
+            to DEFAULT_CONFIDENCE.
+        rng (random.Random | None, optional): Generator of the resamples.
+            Defaults to None for a generator with a fixed seed, so reports are
+            reproducible.
+
+    Returns:
+        tuple[float, float]: Lower and upper bounds of the speedup.
+
+    """
+    rng = rng or random.Random(0)
+    ratios = sorted(
+        statistics.fmean(rng.choices(new_samples, k=len(new_samples)))
+        / statistics.fmean(rng.choices(old_samples, k=len(old_samples)))
+        for _ in range(NUM_RESAMPLES)
+    )
+    tail = (1 - confidence) / 2
+    return (
+        ratios[int(tail * (NUM_RESAMPLES - 1))],
+        ratios[round((1 - tail) * (NUM_RESAMPLES - 1))],
+    )
+
+
+def compare_results(
+    old: dict[str, Any],
+    new: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> list[dict[str, Any]]:
+    """Compare the cases of two runs of the benchmark suite.
+
+    A case regresses when the whole confidence interval of its speedup lies below
+    1 - threshold, and improves when it lies above 1 + threshold. Changes within
+    the threshold or the noise of the rounds are reported as unchanged.
+
+    Args:
+        old (dict[str, Any]): Results of the old run, as in `run_suite`.
+        new (dict[str, Any]): Results of the new run.
+        threshold (float, optional): Relative change to ignore. Defaults to
+            DEFAULT_THRESHOLD.
+        confidence (float, optional): Confidence level of the intervals. Defaults
+            to DEFAULT_CONFIDENCE.
+
+    Returns:
+        list[dict[str, Any]]: Comparison of each case of either run by name, with
+            throughputs, speedup and its interval, and a status of "regressed",
+            "improved", "unchanged", "added" or "removed".
+
+    """
+    old_cases = old["cases"]
+    new_cases = new["cases"]
+    rows = []
+    for name in sorted(old_cases.keys() | new_cases.keys()):
+        if name not in new_cases:
+            rows.append({"name": name, "status": "removed"})
+            continue
+        if name not in old_cases:
+            rows.append({"name": name, "status": "added"})
+            continue
+
+        old_samples = old_cases[name]["round_ops_per_sec"]
+        new_samples = new_cases[name]["round_ops_per_sec"]
+        lower, upper = bootstrap_speedup_interval(old_samples, new_samples, confidence)
+        if upper < 1 - threshold:
+            status = "regressed"
+        elif lower > 1 + threshold:
+            status = "improved"
+        else:
+            status = "unchanged"
+        rows.append(
+            {
+                "name": name,
+                "old_ops_per_sec": statistics.fmean(old_samples),
+                "new_ops_per_sec": statistics.fmean(new_samples),
+                "speedup": statistics.fmean(new_samples)
+                / statistics.fmean(old_samples),
+                "interval": (lower, upper),
+                "status": status,
+            },
+        )
+    return rows
+
+
+def render_table(rows: list[dict[str, Any]]) -> str:
+    """Render a comparison as a text table.
+
+    Args:
+        rows (list[dict[str, Any]]): Comparison from `compare_results`.
+
+    Returns:
+        str: Table with a line per case and a header.
+
+    """
+    lines = [("case", "old ops/s", "new ops/s", "speedup", "interval", "status")]
+    for row in rows:
+        if "speedup" not in row:
+            lines.append((row["name"], "-", "-", "-", "-", row["status"]))
+            continue
+        lower, upper = row["interval"]
+        lines.append(
+            (
+                row["name"],
+                f"{row['old_ops_per_sec']:.1f}",
+                f"{row['new_ops_per_sec']:.1f}",
+                f"{row['speedup']:.3f}x",
+                f"[{lower:.3f}, {upper:.3f}]",
+                row["status"],
+            ),
+        )
+
+    widths = [max(len(line[column]) for line in lines) for column in range(6)]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if column in (0, 5) else cell.rjust(width)
+            for column, (cell, width) in enumerate(zip(line, widths, strict=True))
+        ).rstrip()
+        for line in lines
+    )
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+
+from pymj.enums.call_type import CallType
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile_constants import Tiles
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_mapping import TileMapping
+
+DEFAULT_SEED = 2024
+
+
+def _create_hand_info(
+    tiles: list[int],
+    call_counts: list[tuple[CallType, TileCount]] | None = None,
+    agari_tile: int | None = None,
+) -> HandInfo:
+    return HandInfo(
+        TileCount.create_from_indices(tiles),
+        call_counts,
+        None if agari_tile is None else TileMapping.index_to_tile(agari_tile),
+    )
+
+
+def _draw_tiles(rng: random.Random, num_tiles: int) -> list[int]:
+    return rng.sample([tile for tile in Tiles.ALL for _ in range(4)], num_tiles)
+
+
+def _draw_complete_hand(rng: random.Random) -> list[list[int]]:
+    """Draw a head and four sets, each as its tiles, without a fifth copy."""
+    while True:
+        counts = [0] * 34
+        head = rng.choice(Tiles.ALL)
+        parts = [[head, head]]
+        counts[head] += 2
+        while len(parts) < 5:
+            if rng.random() < 0.6:
+                start = rng.choice(Tiles.SEQUENCE_STARTS)
+                part = [start, start + 1, start + 2]
+            else:
+                part = [rng.choice(Tiles.ALL)] * 3
+            if all(counts[tile] + part.count(tile) <= 4 for tile in part):
+                parts.append(part)
+                for tile in part:
+                    counts[tile] += 1
+            elif rng.random() < 0.1:
+                break
+        if len(parts) == 5:
+            return parts
+
+
+def random_hands(rng: random.Random, size: int) -> list[HandInfo]:
+    """Create hands of 13 random tiles."""
+    return [_create_hand_info(_draw_tiles(rng, 13)) for _ in range(size)]
+
+
+def random_drawn_hands(rng: random.Random, size: int) -> list[HandInfo]:
+    """Create hands of 13 random tiles with a random drawn tile."""
+    hands = []
+    for _ in range(size):
+        tiles = _draw_tiles(rng, 14)
+        hands.append(_create_hand_info(tiles[:13], agari_tile=tiles[13]))
+    return hands
+
+
+def tenpai_hands(rng: random.Random, size: int) -> list[HandInfo]:
+    """Create tenpai hands, complete hands missing one random tile."""
+    hands = []
+    for _ in range(size):
+        tiles = [tile for part in _draw_complete_hand(rng) for tile in part]
+        tiles.pop(rng.randrange(14))
+        hands.append(_create_hand_info(tiles))
+    return hands
+
+
+def winning_hands(rng: random.Random, size: int) -> list[HandInfo]:
+    """Create complete hands of a head and four sets won on a random tile."""
+    hands = []
+    for _ in range(size):
+        tiles = [tile for part in _draw_complete_hand(rng) for tile in part]
+        agari_tile = tiles.pop(rng.randrange(14))
+        hands.append(_create_hand_info(tiles, agari_tile=agari_tile))
+    return hands
+
+
+def nine_gates_hands(rng: random.Random, size: int) -> list[HandInfo]:
+    """Create nine gates shapes of a random suit won on each of its tiles.
+
+    These have the most divisions of any hand, up to four of them.
+    """
+    hands = []
+    for _ in range(size):
+        start = rng.choice((0, 9, 18))
+        tiles = [start] * 3 + list(range(start + 1, start + 8)) + [start + 8] * 3
+        hands.append(_create_hand_info(tiles, agari_tile=start + rng.randrange(9)))
+    return hands
+
+
+def called_hands(rng: random.Random, size: int) -> list[HandInfo]:
+    """Create complete hands with one to four of their sets called."""
+    hands = []
+    for index in range(size):
+        parts = _draw_complete_hand(rng)
+        num_calls = index % 4 + 1
+        call_counts = [
+            (
+                CallType.PON if part[0] == part[1] else CallType.CHII,
+                TileCount.create_from_indices(part),
+            )
+            for part in parts[5 - num_calls :]
+        ]
+        tiles = [tile for part in parts[: 5 - num_calls] for tile in part]
+        agari_tile = tiles.pop(rng.randrange(len(tiles)))
+        hands.append(_create_hand_info(tiles, call_counts, agari_tile))
+    return hands
+
+
+def seven_pairs_hands(rng: random.Random, size: int) -> list[HandInfo]:
+    """Create seven pairs hands won on a random pair."""
+    hands = []
+    for _ in range(size):
+        tiles = [tile for tile in rng.sample(Tiles.ALL, 7) for _ in range(2)]
+        agari_tile = tiles.pop(rng.randrange(14))
+        hands.append(_create_hand_info(tiles, agari_tile=agari_tile))
+    return hands
+
+
+def thirteen_orphans_hands(rng: random.Random, size: int) -> list[HandInfo]:
+    """Create thirteen orphans hands with a random pair, won on a random tile."""
+    hands = []
+    for _ in range(size):
+        tiles = [*Tiles.TERMINALS_AND_HONORS, rng.choice(Tiles.TERMINALS_AND_HONORS)]
+        agari_tile = tiles.pop(rng.randrange(14))
+        hands.append(_create_hand_info(tiles, agari_tile=agari_tile))
+    return hands
+
+
+# Corpus generators by name.
+CORPORA: dict[str, Callable[[random.Random, int], list[HandInfo]]] = {
+    "random": random_hands,
+    "random_drawn": random_drawn_hands,
+    "tenpai": tenpai_hands,
+    "winning": winning_hands,
+    "nine_gates": nine_gates_hands,
+    "called": called_hands,
+    "seven_pairs": seven_pairs_hands,
+    "thirteen_orphans": thirteen_orphans_hands,
+}
+
+
+def create_corpus(name: str, size: int, seed: int = DEFAULT_SEED) -> list[HandInfo]:
+    """Create a corpus of hands.
+
+    A corpus is a function of its name, seed and size only, so runs of different
+    pymj versions time the same hands.
+
+    Args:
+        name (str): Name of the corpus in CORPORA.
+        size (int): Number of hands.
+        seed (int, optional): Seed of the corpus, combined with its name so
+            corpora differ. Defaults to DEFAULT_SEED.
+
+    Returns:
+        list[HandInfo]: Hands of the corpus.
+
+    """
+    return CORPORA[name](random.Random(f"{seed}:{name}"), size)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+
+IMPORT_TARGETS = (
+    "pymj",
+    "pymj.tiles.hand_parser",
+    "pymj.hand_checker.combined_hand_checker",
+    "pymj.scoring.score",
+    "pymj.analysis.discard_planner",
+)
+BUDGET_PATH = Path(__file__).with_name("import_budget.json")
+# Budgets written by --update are the measured times times this factor, to leave
+# room for slower machines.
+BUDGET_FACTOR = 3
+
+
+def parse_import_times(output: str) -> dict[str, tuple[int, int]]:
+    """Parse the output of `python -X importtime`.
+
+    Args:
+        output (str): Standard error of the interpreter.
+
+    Returns:
+        dict[str, tuple[int, int]]: Self and cumulative time in microseconds by
+            module name.
+
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative_time, name = line[len("import time:") :].split("|")
+        if self_time.strip().isdigit():
+            times[name.strip()] = (int(self_time), int(cumulative_time))
+    return times
+
+
+def measure_import_time(
+    module: str,
+    repeat: int = 5,
+    pycache_prefix: str | None = None,
+) -> int:
+    """Measure the import time of a module in fresh interpreters.
+
+    Args:
+        module (str): Name of the module to import.
+        repeat (int, optional): Number of measured imports. Defaults to 5.
+        pycache_prefix (str | None, optional): Directory to cache bytecode in.
+            Defaults to None for a temporary directory.
+
+    Returns:
+        int: Smallest cumulative import time of the module in microseconds.
+
+    """
+    if pycache_prefix is None:
+        with tempfile.TemporaryDirectory() as directory:
+            return measure_import_time(module, repeat, directory)
+
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if name != "PYTHONDONTWRITEBYTECODE"
+    }
+    root = str(Path(__file__).resolve().parents[2])
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (root, env.get("PYTHONPATH")) if path
+    )
+    command = [sys.executable, "-X", f"pycache_prefix={pycache_prefix}"]
+    subprocess.run([*command, "-c", f"import {module}"], env=env, check=True)
+
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [*command, "-X", "importtime", "-c", f"import {module}"],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        times.append(parse_import_times(result.stderr)[module][1])
+    return min(times)
+
+
+def find_over_budget(times: dict[str, int], budget: dict[str, int]) -> list[str]:
+    """Find the modules importing slower than their budget.
+
+    Args:
+        times (dict[str, int]): Import time in microseconds by module name.
+        budget (dict[str, int]): Budget in microseconds by module name.
+
+    Returns:
+        list[str]: Modules over budget, and modules without one.
+
+    """
+    return [
+        module
+        for module, time in times.items()
+        if module not in budget or time > budget[module]
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and print the import times as JSON.
+
+    Args:
+        argv (Sequence[str] | None, optional): Arguments without the program name.
+            Defaults to None for the arguments of the process.
+
+    Returns:
+        int: Exit status, 1 if --check finds a module over budget, else 0.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m pymj.bench.import_time",
+        description="Import each target module in fresh interpreters with "
+        "python -X importtime and report its smallest cumulative time over the "
+        "repeats in microseconds. Bytecode is written to a temporary cache first, "
+        "so the times are those of a warm installation.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--check", action="store_true", help="compare to budget")
+    parser.add_argument("--update", action="store_true", help="rewrite budget")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        times = {
+            module: measure_import_time(module, args.repeat, directory)
+            for module in IMPORT_TARGETS
+        }
+    print(json.dumps(times, indent=2))
+
+    if args.update:
+        budget = {module: time * BUDGET_FACTOR for module, time in times.items()}
+        BUDGET_PATH.write_text(json.dumps(budget, indent=2) + "\n")
+    if args.check:
+        over_budget = find_over_budget(
+            times,
+            json.loads(BUDGET_PATH.read_text()),
+        )
+        for module in over_budget:
+            print(f"over budget: {module}", file=sys.stderr)
+        return 1 if over_budget else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from copy import deepcopy
+from typing import Any
+
+from pymj.bench.corpora import CORPORA, DEFAULT_SEED, create_corpus
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.hand_checker.normal_form_checker import NormalFormChecker
+from pymj.hand_checker.seven_pair_checker import SevenPairChecker
+from pymj.hand_checker.thirteen_orphan_checker import ThirteenOrphanChecker
+from pymj.tiles.hand_info import HandInfo
+
+RESULT_VERSION = 1
+PERCENTILES = (50, 90, 99)
+
+CHECKERS: dict[str, Callable[[], BaseHandChecker]] = {
+    "normal": NormalFormChecker,
+    "seven_pairs": SevenPairChecker,
+    "thirteen_orphans": ThirteenOrphanChecker,
+    "combined": CombinedHandChecker,
+}
+
+_WINNING_CORPORA = (
+    "winning",
+    "nine_gates",
+    "called",
+    "seven_pairs",
+    "thirteen_orphans",
+)
+_DRAWN_CORPORA = ("random_drawn", *_WINNING_CORPORA)
+
+# Corpora of each operation, as check_agari and calculate_efficiency need a drawn
+# tile, and calculate_divisions a complete hand.
+OPERATIONS: dict[str, tuple[str, ...]] = {
+    "calculate_shanten": tuple(CORPORA),
+    "check_agari": _DRAWN_CORPORA,
+    "calculate_divisions": _WINNING_CORPORA,
+    "calculate_efficiency": _DRAWN_CORPORA,
+}
+
+# Sizes of the corpora of each operation relative to the requested size, as
+# efficiency calls shanten for every discard and draw.
+_SIZE_DIVISORS = {"calculate_efficiency": 8}
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    """Calculate a percentile of sorted values by linear interpolation."""
+    position = (len(values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def time_case(
+    operation: Callable[[HandInfo], object],
+    hands: list[HandInfo],
+    rounds: int,
+) -> dict[str, Any]:
+    """Time an operation on every hand of a corpus over several rounds.
+
+    Each call gets a fresh copy of its hand, made outside the timed region, as
+    some operations modify the hand while they run. A first round is run
+    untimed to warm caches.
+
+    Args:
+        operation (Callable[[HandInfo], object]): Operation to time.
+        hands (list[HandInfo]): Hands of the corpus.
+        rounds (int): Number of timed rounds.
+
+    Returns:
+        dict[str, Any]: Number of hands, operations per second over all rounds
+            and of each round, and mean and percentile latencies in
+            microseconds.
+
+    """
+    for hand_info in deepcopy(hands):
+        operation(hand_info)
+
+    latencies = []
+    round_ops_per_sec = []
+    for _ in range(rounds):
+        copies = deepcopy(hands)
+        round_ns = 0
+        for hand_info in copies:
+            start = time.perf_counter_ns()
+            operation(hand_info)
+            elapsed = time.perf_counter_ns() - start
+            round_ns += elapsed
+            latencies.append(elapsed / 1000)
+        round_ops_per_sec.append(len(hands) * 1e9 / max(round_ns, 1))
+
+    latencies.sort()
+    total_us = sum(latencies)
+    return {
+        "num_hands": len(hands),
+        "ops_per_sec": len(latencies) * 1e6 / max(total_us, 1e-3),
+        "round_ops_per_sec": round_ops_per_sec,
+        "latency_us": {
+            "mean": statistics.fmean(latencies),
+            **{
+                f"p{percent}": _percentile(latencies, percent)
+                for percent in PERCENTILES
+            },
+        },
+    }
+
+
+def _is_supported(
+    operation: Callable[[HandInfo], object],
+    hands: list[HandInfo],
+) -> bool:
+    try:
+        for hand_info in deepcopy(hands):
+            operation(hand_info)
+    except ValueError:
+        return False
+    return True
+
+
+def run_suite(
+    size: int = 64,
+    rounds: int = 5,
+    seed: int = DEFAULT_SEED,
+    case_filter: str = "",
+) -> dict[str, Any]:
+    """Run every case of the suite.
+
+    Cases are named "checker/operation/corpus". A case is skipped when the
+    operation raises ValueError on a hand of the corpus, such as divisions of a
+    form the checker does not judge.
+
+    Args:
+        size (int, optional): Number of hands of each corpus, divided by 8 for
+            calculate_efficiency. Defaults to 64.
+        rounds (int, optional): Number of timed rounds of each case. Defaults to
+            5.
+        seed (int, optional): Seed of the corpora. Defaults to DEFAULT_SEED.
+        case_filter (str, optional): Substring of the names of the cases to run.
+            Defaults to "" for all cases.
+
+    Returns:
+        dict[str, Any]: Settings and environment of the run, results of the cases
+            by name as in `time_case`, and names of the skipped cases.
+
+    """
+    corpora: dict[tuple[str, int], list[HandInfo]] = {}
+    cases = {}
+    skipped = []
+    for checker_name, create_checker in CHECKERS.items():
+        checker = create_checker()
+        for operation_name, corpus_names in OPERATIONS.items():
+            operation = getattr(checker, operation_name)
+            corpus_size = max(1, size // _SIZE_DIVISORS.get(operation_name, 1))
+            for corpus_name in corpus_names:
+                name = f"{checker_name}/{operation_name}/{corpus_name}"
+                if case_filter not in name:
+                    continue
+                key = (corpus_name, corpus_size)
+                if key not in corpora:
+                    corpora[key] = create_corpus(corpus_name, corpus_size, seed)
+                if not _is_supported(operation, corpora[key]):
+                    skipped.append(name)
+                    continue
+                cases[name] = time_case(operation, corpora[key], rounds)
+
+    return {
+        "version": RESULT_VERSION,
+        "settings": {"size": size, "rounds": rounds, "seed": seed},
+        "environment": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+        },
+        "cases": cases,
+        "skipped": skipped,
+    }
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from itertools import pairwise
+from types import TracebackType
+from typing import Any, BinaryIO
+
+import numpy as np
+import numpy.typing as npt
+
+from pymj.enums.call_type import CallType
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile import Tile
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_mapping import TileMapping
+
+MAGIC = b"PYMJCORP"
+FORMAT_VERSION = 1
+MAX_CALLS = 4
+NO_TILE = 255
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("concealed", np.uint8, (34,)),
+        ("concealed_red_mask", np.uint8),
+        ("calls", np.uint8, (MAX_CALLS, 3)),
+        ("agari_tile", np.uint8),
+        ("flags", np.uint8),
+        ("meta", "<u8"),
+    ],
+)
+HEADER_DTYPE = np.dtype(
+    [("magic", "S8"), ("version", "<u4"), ("record_size", "<u4")],
+)
+
+FLAG_TSUMO = 0b01
+FLAG_RED_AGARI_TILE = 0b10
+
+
+def encode_hand_info(hand_info: HandInfo, meta: int = 0) -> np.void:
+    """Encode a hand into a fixed-width corpus record.
+
+    Args:
+        hand_info (HandInfo): Hand to encode.
+        meta (int, optional): User-defined 64-bit metadata such as a game id.
+            Defaults to 0.
+
+    Returns:
+        np.void: Record of RECORD_DTYPE.
+
+    Raises:
+        ValueError: If the hand has more than MAX_CALLS calls.
+
+    """
+    if len(hand_info.call_counts) > MAX_CALLS:
+        raise ValueError
+
+    record: np.void = np.zeros(1, dtype=RECORD_DTYPE)[0]
+    record["concealed"] = list(hand_info.concealed_count)
+    record["concealed_red_mask"] = hand_info.concealed_count.red_mask
+    for position, (call_type, call_count) in enumerate(hand_info.call_counts):
+        record["calls"][position] = (
+            call_type.value,
+            call_count.find_earliest_nonzero_index(),
+            call_count.red_mask,
+        )
+
+    flags = FLAG_TSUMO if hand_info.is_tsumo else 0
+    if hand_info.agari_tile:
+        record["agari_tile"] = TileMapping.tile_to_index(hand_info.agari_tile)
+        if hand_info.agari_tile.is_red:
+            flags |= FLAG_RED_AGARI_TILE
+    else:
+        record["agari_tile"] = NO_TILE
+    record["flags"] = flags
+    record["meta"] = meta
+    return record
+
+
+def decode_hand_info(record: np.void) -> HandInfo:
+    """Decode a corpus record into a hand.
+
+    Args:
+        record (np.void): Record of RECORD_DTYPE.
+
+    Returns:
+        HandInfo: Decoded hand.
+
+    """
+    call_counts = []
+    for call_type_value, tile, red_mask in record["calls"].tolist():
+        if call_type_value == 0:
+            break
+        call_type = CallType(call_type_value)
+        match call_type:
+            case CallType.CHII:
+                indices = [tile, tile + 1, tile + 2]
+            case CallType.PON:
+                indices = [tile] * 3
+            case _:
+                indices = [tile] * 4
+        call_count = TileCount.create_from_indices(indices)
+        call_count.red_mask = red_mask
+        call_counts.append((call_type, call_count))
+
+    flags = int(record["flags"])
+    agari_tile_index = int(record["agari_tile"])
+    agari_tile = None
+    if agari_tile_index != NO_TILE:
+        agari_tile = TileMapping.index_to_tile(agari_tile_index)
+        if flags & FLAG_RED_AGARI_TILE:
+            agari_tile = Tile(agari_tile.tile_type, 5, is_red=True)
+
+    return HandInfo(
+        concealed_count=TileCount(
+            record["concealed"].tolist(),
+            int(record["concealed_red_mask"]),
+        ),
+        call_counts=call_counts,
+        agari_tile=agari_tile,
+        is_tsumo=bool(flags & FLAG_TSUMO),
+    )
+
+
+class HandCorpusWriter:
+    """Write hands to a corpus file as a stream of fixed-width records.
+
+    Records are buffered and appended in chunks, so corpora of any size can be
+    written with constant memory. The writer should be closed, preferably by using
+    it as a context manager, to flush the last chunk.
+
+    Attributes:
+        path (str | os.PathLike[str]): Path of the corpus file.
+        num_records (int): Number of records written so far.
+
+    """
+
+    def __init__(self, path: str | os.PathLike[str], buffer_size: int = 4096):
+        """Create a corpus file and write its header.
+
+        Args:
+            path (str | os.PathLike[str]): Path of the corpus file to create.
+            buffer_size (int, optional): Number of records buffered before they
+                are written. Defaults to 4096.
+
+        """
+        self.path = path
+        self.num_records = 0
+        self._buffer = np.zeros(buffer_size, dtype=RECORD_DTYPE)
+        self._num_buffered = 0
+        self._file: BinaryIO = open(path, "wb")  # noqa: SIM115
+        header = np.array(
+            (MAGIC, FORMAT_VERSION, RECORD_DTYPE.itemsize),
+            dtype=HEADER_DTYPE,
+        )
+        self._file.write(header.tobytes())
+
+    def __enter__(self) -> HandCorpusWriter:
+        """Return the writer itself for use in a with statement."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the writer at the end of a with statement."""
+        self.close()
+
+    def append(self, hand_info: HandInfo, meta: int = 0) -> None:
+        """Append a hand to the corpus.
+
+        Args:
+            hand_info (HandInfo): Hand to append.
+            meta (int, optional): User-defined 64-bit metadata. Defaults to 0.
+
+        """
+        self._buffer[self._num_buffered] = encode_hand_info(hand_info, meta)
+        self._num_buffered += 1
+        self.num_records += 1
+        if self._num_buffered == len(self._buffer):
+            self.flush()
+
+    def extend(self, hand_infos: Iterable[HandInfo], meta: int = 0) -> None:
+        """Append hands to the corpus.
+
+        Args:
+            hand_infos (Iterable[HandInfo]): Hands to append.
+            meta (int, optional): User-defined 64-bit metadata for all hands.
+                Defaults to 0.
+
+        """
+        for hand_info in hand_infos:
+            self.append(hand_info, meta)
+
+    def write_records(self, records: npt.NDArray[np.void]) -> None:
+        """Append records that are already encoded, e.g. by vectorized code.
+
+        Args:
+            records (npt.NDArray[np.void]): Array of RECORD_DTYPE.
+
+        Raises:
+            ValueError: If the dtype of records is not RECORD_DTYPE.
+
+        """
+        if records.dtype != RECORD_DTYPE:
+            raise ValueError
+        self.flush()
+        self._file.write(np.ascontiguousarray(records).tobytes())
+        self.num_records += len(records)
+
+    def flush(self) -> None:
+        """Write the buffered records to the file."""
+        self._file.write(self._buffer[: self._num_buffered].tobytes())
+        self._num_buffered = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush the buffered records and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class HandCorpus:
+    """Read-only, memory-mapped view of a corpus file.
+
+    Records are mapped with `numpy.memmap`, so opening a corpus is O(1), any hand
+    can be accessed randomly, and slices of counts are views that can be passed to
+    the batch APIs (e.g. `pymj.features.encode_counts`) without copying. Several
+    processes may open the same corpus and read disjoint chunks of it in parallel;
+    a pickled corpus is reopened by path in the receiving process.
+
+    Attributes:
+        path (str | os.PathLike[str]): Path of the corpus file.
+        records (npt.NDArray[np.void]): Memory-mapped records of RECORD_DTYPE.
+
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """Open a corpus file.
+
+        Args:
+            path (str | os.PathLike[str]): Path of the corpus file.
+
+        Raises:
+            ValueError: If the file is not a corpus of the supported version.
+
+        """
+        self.path = path
+        header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+        if (
+            len(header) != 1
+            or header["magic"][0] != MAGIC
+            or header["version"][0] != FORMAT_VERSION
+            or header["record_size"][0] != RECORD_DTYPE.itemsize
+        ):
+            raise ValueError
+
+        body_size = os.path.getsize(path) - HEADER_DTYPE.itemsize
+        if body_size % RECORD_DTYPE.itemsize:
+            raise ValueError
+
+        self.records: npt.NDArray[np.void] = (
+            np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_DTYPE.itemsize)
+            if body_size
+            else np.zeros(0, dtype=RECORD_DTYPE)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of hands in the corpus."""
+        return len(self.records)
+
+    def __getitem__(self, index: int) -> HandInfo:
+        """Decode the hand at an index.
+
+        Args:
+            index (int): Index of the hand, negative values count from the end.
+
+        Returns:
+            HandInfo: Decoded hand.
+
+        """
+        return decode_hand_info(self.records[index])
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the corpus by path only, so that workers map it themselves."""
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Reopen the corpus from its path after unpickling."""
+        self.__init__(state["path"])  # type: ignore[misc]
+
+    @property
+    def concealed_counts(self) -> npt.NDArray[np.uint8]:
+        """Concealed tile counts of all hands as an (N, 34) view.
+
+        Returns:
+            npt.NDArray[np.uint8]: Zero-copy view of the concealed counts.
+
+        """
+        concealed: npt.NDArray[np.uint8] = self.records["concealed"]
+        return concealed
+
+    @property
+    def agari_tiles(self) -> npt.NDArray[np.int16]:
+        """Winning tile indices of all hands, where -1 means no winning tile.
+
+        Returns:
+            npt.NDArray[np.int16]: Array of shape (N,).
+
+        """
+        agari_tiles = self.records["agari_tile"].astype(np.int16)
+        agari_tiles[agari_tiles == NO_TILE] = -1
+        return agari_tiles
+
+    @property
+    def metas(self) -> npt.NDArray[np.uint64]:
+        """User-defined metadata of all hands as an (N,) view.
+
+        Returns:
+            npt.NDArray[np.uint64]: Zero-copy view of the metadata.
+
+        """
+        metas: npt.NDArray[np.uint64] = self.records["meta"]
+        return metas
+
+    def chunks(self, num_chunks: int) -> list[tuple[int, int]]:
+        """Split the corpus into contiguous ranges for parallel readers.
+
+        Args:
+            num_chunks (int): Number of ranges to split into.
+
+        Returns:
+            list[tuple[int, int]]: Start and stop indices of nonempty ranges.
+
+        """
+        bounds = np.linspace(0, len(self), num_chunks + 1).astype(int).tolist()
+        return [(start, stop) for start, stop in pairwise(bounds) if start < stop]
+
+    def sample(self, num_samples: int, rng: np.random.Generator) -> list[HandInfo]:
+        """Decode hands sampled uniformly with replacement.
+
+        Args:
+            num_samples (int): Number of hands to sample.
+            rng (np.random.Generator): Random number generator.
+
+        Returns:
+            list[HandInfo]: Sampled hands.
+
+        """
+        indices = rng.integers(len(self), size=num_samples)
+        return [decode_hand_info(record) for record in self.records[indices]]
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from pymj.enums.call_type import CallType
+from pymj.enums.defense_state_data import DefenseStateData
+from pymj.game.table import NUM_PLAYERS, Table
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_mapping import TileMapping
+
+NUM_OPPONENTS = NUM_PLAYERS - 1
+
+# Deal-in weights of the wait shapes. A live two-sided wait on a tile weighs
+# RYANMEN, a closed or edge wait KANCHAN or PENCHAN, and pair and single waits
+# weigh by the number of unseen copies of the tile. Together they roughly follow
+# deal-in rates against riichi: about 10% for a middle tile with no information,
+# 6-7% for one suji, and 2-5% for double suji, terminals and honors.
+RYANMEN = 0.035
+KANCHAN = 0.012
+PENCHAN = 0.012
+PAIR_BY_UNSEEN = np.array([0.0, 0.004, 0.008, 0.014, 0.02])
+HONOR_BY_UNSEEN = np.array([0.0, 0.005, 0.015, 0.03, 0.05])
+
+# Opponents without riichi are weighted by how far the round has gone, reaching
+# NON_RIICHI_WEIGHT after TENPAI_DISCARDS discards.
+NON_RIICHI_WEIGHT = 0.5
+TENPAI_DISCARDS = 18
+
+_VALUES = np.arange(9)
+_HAS_LEFT_RYANMEN = _VALUES >= 3
+_HAS_RIGHT_RYANMEN = _VALUES <= 5
+
+
+def defense_state(table: Table, player: int) -> DefenseStateData:
+    """Collect what a player sees of the opponents at a table.
+
+    Visible tiles are the hand of the player, the rivers and calls of all players
+    and the dora indicators. Called discards are counted once.
+
+    Args:
+        table (Table): Table of the game.
+        player (int): Seat of the player.
+
+    Returns:
+        DefenseStateData: State of the opponents in turn order after the player.
+
+    """
+    seat = table.seats[player]
+    counts = list(seat.concealed_count)
+    if seat.drawn_tile is not None:
+        counts[seat.drawn_tile] += 1
+    if table.wall is not None:
+        for tile in table.wall.dora_indicators:
+            counts[tile] += 1
+    for other in table.seats:
+        for tile in other.river:
+            counts[tile] += 1
+        for call in other.calls:
+            for call_tile in call.tiles:
+                counts[TileMapping.tile_to_index(call_tile)] += 1
+            if call.call_type is not CallType.CONCEALED_KAN:
+                counts[TileMapping.tile_to_index(call.tiles[0])] -= 1
+
+    opponents = [
+        table.seats[(player + offset) % NUM_PLAYERS] for offset in range(1, NUM_PLAYERS)
+    ]
+    return DefenseStateData(
+        safe_masks=[opponent.river.safe_mask for opponent in opponents],
+        is_riichi=[opponent.river.riichi_index is not None for opponent in opponents],
+        num_discards=[len(opponent.river) for opponent in opponents],
+        visible=TileCount(counts),
+    )
+
+
+def danger_matrix(state: DefenseStateData) -> npt.NDArray[np.float64]:
+    """Estimate the deal-in risk of discarding each tile against each opponent.
+
+    Args:
+        state (DefenseStateData): What the player sees of the opponents.
+
+    Returns:
+        npt.NDArray[np.float64]: Array of shape (3, 34) with the risk of each
+            tile index against each opponent, see `danger_matrix_batch`.
+
+    """
+    matrix: npt.NDArray[np.float64] = danger_matrix_batch([state])[0]
+    return matrix
+
+
+def danger_matrix_batch(
+    states: Sequence[DefenseStateData],
+) -> npt.NDArray[np.float64]:
+    """Estimate deal-in risks for many game states at once.
+
+    Risks add up the weights of the waits that remain possible on each tile:
+
+    - Genbutsu, tiles the opponent cannot ron on, are safe.
+    - A two-sided wait is ruled out by suji, when the tile three apart is safe,
+      and by kabe, when a tile of the shape is all visible. It is halved by
+      one-chance, when three copies of a tile of the shape are visible.
+    - Closed and edge waits are ruled out and halved by kabe and one-chance
+      alike, and pair and single waits, including all honor waits, shrink with
+      the visible copies of the tile.
+
+    The risks against an opponent are scaled by the chance that it is tenpai:
+    fully for riichi, and otherwise growing with its number of discards.
+
+    Args:
+        states (Sequence[DefenseStateData]): What the player sees in each state.
+
+    Returns:
+        npt.NDArray[np.float64]: Array of shape (len(states), 3, 34).
+
+    """
+    safe_masks = np.array([state.safe_masks for state in states], dtype=np.int64)
+    safe = (safe_masks[..., None] >> np.arange(34) & 1).astype(bool)
+    visible = np.array([list(state.visible) for state in states], dtype=np.int64)
+    unseen = np.clip(4 - visible, 0, 4)
+
+    # Chances that a tile is held in a shape: 0 if all copies are visible, 0.5
+    # for one copy left, and 0 outside the suit thanks to the padding.
+    chance = np.where(visible >= 4, 0.0, np.where(visible == 3, 0.5, 1.0))
+    chance = np.pad(
+        chance[:, :27].reshape(-1, 1, 3, 9),
+        ((0, 0), (0, 0), (0, 0), (2, 2)),
+    )
+    left1, left2 = chance[..., 1:10], chance[..., 0:9]
+    right1, right2 = chance[..., 3:12], chance[..., 4:13]
+
+    # Suji are looked up three tiles apart within the suit.
+    suit_safe = np.pad(
+        safe[..., :27].reshape(-1, NUM_OPPONENTS, 3, 9),
+        ((0, 0), (0, 0), (0, 0), (3, 3)),
+    )
+    left_ryanmen = _HAS_LEFT_RYANMEN * left1 * left2 * ~suit_safe[..., 0:9]
+    right_ryanmen = _HAS_RIGHT_RYANMEN * right1 * right2 * ~suit_safe[..., 6:15]
+    kanchan = left1 * right1
+    penchan = (_VALUES == 2) * left1 * left2 + (_VALUES == 6) * right1 * right2
+
+    numbers = (
+        PAIR_BY_UNSEEN[unseen[:, :27]].reshape(-1, 1, 3, 9)
+        + KANCHAN * kanchan
+        + PENCHAN * penchan
+        + RYANMEN * (left_ryanmen + right_ryanmen)
+    )
+    danger = np.empty(safe.shape)
+    danger[..., :27] = numbers.reshape(-1, NUM_OPPONENTS, 27)
+    danger[..., 27:] = HONOR_BY_UNSEEN[unseen[:, None, 27:]]
+    danger[safe] = 0.0
+
+    is_riichi = np.array([state.is_riichi for state in states], dtype=bool)
+    num_discards = np.array([state.num_discards for state in states])
+    weights = np.where(
+        is_riichi,
+        1.0,
+        NON_RIICHI_WEIGHT * np.minimum(num_discards / TENPAI_DISCARDS, 1.0),
+    )
+    result: npt.NDArray[np.float64] = danger * weights[..., None]
+    return result
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pymj.enums.call_type import CallType
+
+
+@dataclass(frozen=True)
+class CallOption:
+    """A call that a player can make.
+
+    Attributes:
+        call_type (CallType): Type of the call.
+        tiles (tuple[int, ...]): Tile indices of the call. For calls of a discard,
+            the called tile comes first.
+
+    """
+
+    call_type: CallType
+    tiles: tuple[int, ...]
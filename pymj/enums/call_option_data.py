@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pymj.enums.call_option import CallOption
+
+
+@dataclass
+class CallOptionData:
+    """Store how a hand stands after making a call.
+
+    Attributes:
+        option (CallOption): Call made.
+        shanten (int): Shanten number after the call and the best discard.
+        discard_tile (int | None): Index of the best discard after the call, or
+            None for a kan, which is followed by a replacement draw instead.
+        ukeire (list[int]): Indices of the tiles that reduce the shanten number of
+            the hand after the discard.
+        num_ukeire (int): Number of unseen copies of the ukeire tiles.
+
+    """
+
+    option: CallOption
+    shanten: int
+    discard_tile: int | None
+    ukeire: list[int]
+    num_ukeire: int
@@ -0,0 +1,21 @@
+from enum import Enum, auto
+
+
+class DecisionType(Enum):
+    """Types of decisions that a game asks players to make.
+
+    Attributes:
+        DISCARD: Choose a tile to discard.
+        CALL: Choose whether and how to call another player's discard.
+        KAN: Choose whether to declare a concealed or small melded kan on the
+            player's own turn.
+        TSUMO: Choose whether to win with the drawn tile.
+        RON: Choose whether to win with another player's discard.
+
+    """
+
+    DISCARD = auto()
+    CALL = auto()
+    KAN = auto()
+    TSUMO = auto()
+    RON = auto()
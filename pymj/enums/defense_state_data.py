@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pymj.tiles.tile_count import TileCount
+
+
+@dataclass
+class DefenseStateData:
+    """Store what a player sees of the opponents to judge the danger of tiles.
+
+    Opponents are listed in turn order after the player.
+
+    Attributes:
+        safe_masks (list[int]): Bitmask of the tiles each opponent cannot ron on,
+            as `River.safe_mask`.
+        is_riichi (list[bool]): Whether each opponent has declared riichi.
+        num_discards (list[int]): Number of discards of each opponent.
+        visible (TileCount): Tiles visible to the player, including its own hand.
+
+    """
+
+    safe_masks: list[int]
+    is_riichi: list[bool]
+    num_discards: list[int]
+    visible: TileCount
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class DiscardPlanData:
+    """Store the discard recommended by a search over draws and discards.
+
+    Attributes:
+        discard_tile (int): Index of the recommended discard.
+        probability (float): Probability of winning within `depth` draws after the
+            discard, with best play.
+        depth (int): Number of draws searched to completion, 0 if the deadline
+            hit before the first search finished.
+        probabilities (dict[int, float]): Probability of each discard candidate
+            at the completed depth.
+        num_nodes (int): Number of distinct positions evaluated.
+
+    """
+
+    discard_tile: int
+    probability: float = 0.0
+    depth: int = 0
+    probabilities: dict[int, float] = field(default_factory=dict)
+    num_nodes: int = 0
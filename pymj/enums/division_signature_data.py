@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class DivisionSignatureData:
+    """Store the features of a division that scoring depends on.
+
+    Masks have bit i set for tile index i. Signatures are immutable and hashable,
+    so that equal divisions can share scoring results.
+
+    Attributes:
+        features (int): Bitmask of the shape `YakuFeature` values of the division.
+        triplet_mask (int): Bitmask of the tiles of triplets and quads.
+        head_mask (int): Bitmask of the tiles of heads, seven of them for seven
+            pairs.
+        fu (int): Fu of the parts and the wait, without the head and the way of
+            winning.
+
+    """
+
+    features: int
+    triplet_mask: int
+    head_mask: int
+    fu: int
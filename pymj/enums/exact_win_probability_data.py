@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ExactWinProbabilityData:
+    """Store an exact probability of improving a hand within a number of draws.
+
+    Attributes:
+        probability (float): Probability of reaching the target shanten number.
+        num_states (int): Number of distinct states of hand, unseen tiles and
+            remaining draws explored to compute the probability.
+
+    """
+
+    probability: float
+    num_states: int
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pymj.enums.round_result_data import RoundResultData
+
+
+@dataclass
+class GameResultData:
+    """Store the outcome of a game.
+
+    Attributes:
+        rounds (list[RoundResultData]): Outcomes of the rounds in playing order,
+            including repeated rounds of the same dealer.
+
+    """
+
+    rounds: list[RoundResultData]
+
+    @property
+    def num_rounds(self) -> int:
+        """Number of rounds played."""
+        return len(self.rounds)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class HostStatsData:
+    """Store throughput and latency counters of a table host.
+
+    Attributes:
+        num_games (int): Number of finished games.
+        num_rounds (int): Number of finished rounds.
+        num_decisions (int): Number of decisions answered, including timeouts.
+        num_timeouts (int): Number of decisions answered with the default option
+            because the agent did not answer in time.
+        num_invalid_answers (int): Number of decisions answered with the default
+            option because the agent answered an index out of the options.
+        total_latency (float): Sum of the decision latencies in seconds.
+        max_latency (float): Largest decision latency in seconds.
+        elapsed (float): Seconds spent running games.
+
+    """
+
+    num_games: int = 0
+    num_rounds: int = 0
+    num_decisions: int = 0
+    num_timeouts: int = 0
+    num_invalid_answers: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean decision latency in seconds."""
+        return self.total_latency / self.num_decisions if self.num_decisions else 0.0
+
+    @property
+    def decisions_per_second(self) -> float:
+        """Decisions answered per second of running."""
+        return self.num_decisions / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """Games finished per second of running."""
+        return self.num_games / self.elapsed if self.elapsed else 0.0
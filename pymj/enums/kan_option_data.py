@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pymj.enums.call_option import CallOption
+
+
+@dataclass
+class KanOptionData:
+    """Store how a hand changes by declaring a kan.
+
+    The hand before the kan is the hand without one copy of the kan tile, i.e.
+    the hand before drawing it when the drawn tile completes the kan. The hand
+    after the kan waits for the replacement draw.
+
+    Attributes:
+        option (CallOption): Kan declared.
+        shanten_before (int): Shanten number before the kan.
+        shanten_after (int): Shanten number after the kan.
+        waits_before (list[int]): Indices of the winning tiles before the kan.
+        waits_after (list[int]): Indices of the winning tiles after the kan.
+        num_ukeire_before (int): Number of unseen ukeire copies before the kan.
+        num_ukeire_after (int): Number of unseen ukeire copies after the kan.
+        is_riichi_legal (bool): Whether the kan may be declared in riichi: a
+            concealed kan of the drawn tile that keeps the waits of the tenpai
+            hand.
+
+    """
+
+    option: CallOption
+    shanten_before: int
+    shanten_after: int
+    waits_before: list[int]
+    waits_after: list[int]
+    num_ukeire_before: int
+    num_ukeire_after: int
+    is_riichi_legal: bool
+
+    @property
+    def ukeire_delta(self) -> int:
+        """Change of the number of ukeire copies by the kan."""
+        return self.num_ukeire_after - self.num_ukeire_before
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from pymj.tiles.hand_info import HandInfo
+
+
+@dataclass
+class RoundResultData:
+    """Store the outcome of a round.
+
+    Attributes:
+        dealer (int): Seat of the dealer of the round.
+        winner (int | None): Seat of the winner, or None for an exhaustive draw.
+        loser (int | None): Seat that dealt the winning tile, or None for a win by
+            self-draw or an exhaustive draw.
+        hand_info (HandInfo | None): Winning hand with its winning tile.
+        tenpai (list[bool]): Whether each seat was tenpai at an exhaustive draw.
+
+    """
+
+    dealer: int
+    winner: int | None = None
+    loser: int | None = None
+    hand_info: HandInfo | None = None
+    tenpai: list[bool] = field(default_factory=list)
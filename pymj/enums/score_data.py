@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from pymj.enums.yaku import Yaku
+
+
+@dataclass(frozen=True)
+class ScoreData:
+    """Store the score of a winning hand.
+
+    Attributes:
+        yaku (tuple[tuple[Yaku, int], ...]): Yaku of the hand with their han.
+        han (int): Han of the yaku and the dora, 0 without yaku.
+        fu (int): Fu of the hand.
+        payments (tuple[int, int]): Payment of the discarder for a ron, or of the
+            dealer for a tsumo, and payment of each non-dealer for a tsumo.
+        points (int): Points received by the winner, without honba and riichi
+            sticks.
+
+    """
+
+    yaku: tuple[tuple[Yaku, int], ...]
+    han: int
+    fu: int
+    payments: tuple[int, int]
+    points: int
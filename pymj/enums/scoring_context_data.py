@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ScoringContextData:
+    """Store the situation of a win that scoring depends on besides the hand.
+
+    Attributes:
+        round_wind (int): Tile index of the round wind. Defaults to east.
+        seat_wind (int): Tile index of the seat wind, east for the dealer.
+            Defaults to east.
+        is_riichi (bool): Whether riichi was declared. Defaults to False.
+        is_double_riichi (bool): Whether riichi was declared on the first
+            uninterrupted discard. Defaults to False.
+        is_ippatsu (bool): Whether the win came within one uninterrupted turn
+            after riichi. Defaults to False.
+        is_last_tile (bool): Whether the win came on the last tile of the wall or
+            its discard. Defaults to False.
+        is_after_kan (bool): Whether the winning tile was the replacement tile of
+            a kan. Defaults to False.
+        is_robbing_kan (bool): Whether the winning tile was added to a pon for a
+            kan. Defaults to False.
+        is_first_draw (bool): Whether the win came on the first uninterrupted
+            draw. Defaults to False.
+        num_dora (int): Number of dora, red fives and ura dora in the hand,
+            counted only for hands with a yaku. Defaults to 0.
+
+    """
+
+    round_wind: int = 27
+    seat_wind: int = 27
+    is_riichi: bool = False
+    is_double_riichi: bool = False
+    is_ippatsu: bool = False
+    is_last_tile: bool = False
+    is_after_kan: bool = False
+    is_robbing_kan: bool = False
+    is_first_draw: bool = False
+    num_dora: int = 0
+
+    @property
+    def is_dealer(self) -> bool:
+        """Whether the player is the dealer."""
+        return self.seat_wind == 27
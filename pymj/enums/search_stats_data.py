@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class SearchStatsData:
+    """Store statistics of one shanten search of the normal form.
+
+    Attributes:
+        shanten (int): Shanten number found.
+        num_heads (int): Number of head candidates tried, besides the search
+            without a fixed head.
+        num_set_nodes (int): Number of nodes visited while taking complete sets.
+        num_partial_nodes (int): Number of nodes visited while taking partial
+            sets.
+        num_pruned (int): Number of complete set splits pruned by the bound on
+            the shanten number, before taking partial sets.
+        max_depth (int): Maximum recursion depth over both phases.
+        elapsed_ns (int): Time spent in nanoseconds.
+
+    """
+
+    shanten: int = 0
+    num_heads: int = 0
+    num_set_nodes: int = 0
+    num_partial_nodes: int = 0
+    num_pruned: int = 0
+    max_depth: int = 0
+    elapsed_ns: int = 0
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class WinProbabilityData:
+    """Store estimated probabilities of improving a hand within a number of draws.
+
+    Attributes:
+        num_samples (int): Number of simulated draw sequences.
+        tenpai_probabilities (list[float]): Probability of being tenpai within i
+            draws at index i, for i from 0 to the number of draws.
+        agari_probabilities (list[float]): Probability of winning by self-draw
+            within i draws at index i, for i from 0 to the number of draws.
+
+    """
+
+    num_samples: int
+    tenpai_probabilities: list[float]
+    agari_probabilities: list[float]
+
+    @property
+    def tenpai_probability(self) -> float:
+        """Probability of being tenpai within all draws."""
+        return self.tenpai_probabilities[-1]
+
+    @property
+    def agari_probability(self) -> float:
+        """Probability of winning by self-draw within all draws."""
+        return self.agari_probabilities[-1]
@@ -0,0 +1,99 @@
+from enum import Enum, auto
+
+
+class Yaku(Enum):
+    """Define the standard yaku of riichi mahjong.
+
+    Attributes:
+        RIICHI: Riichi declared with a concealed tenpai hand.
+        DOUBLE_RIICHI: Riichi declared on the first uninterrupted discard.
+        IPPATSU: Win within one uninterrupted turn after riichi.
+        MENZEN_TSUMO: Self-drawn win with a concealed hand.
+        PINFU: Four sequences, a valueless head and a two-sided wait.
+        IIPEIKOU: Two identical sequences in a concealed hand.
+        HAITEI: Self-drawn win on the last tile of the wall.
+        HOUTEI: Win on the discard of the last tile.
+        RINSHAN: Self-drawn win on the replacement tile of a kan.
+        CHANKAN: Win on a tile added to a pon for a kan.
+        TANYAO: Only simple tiles.
+        SEAT_WIND: Triplet of the seat wind.
+        ROUND_WIND: Triplet of the round wind.
+        WHITE_DRAGON: Triplet of white dragons.
+        GREEN_DRAGON: Triplet of green dragons.
+        RED_DRAGON: Triplet of red dragons.
+        CHANTA: Terminal or honor in every part, with a sequence.
+        SANSHOKU_DOUJUN: Same sequence in the three suits.
+        ITTSU: Sequences 123, 456 and 789 of one suit.
+        TOITOI: Four triplets or quads.
+        SANANKOU: Three concealed triplets or quads.
+        SANSHOKU_DOUKOU: Same triplet in the three suits.
+        SANKANTSU: Three quads.
+        CHIITOITSU: Seven pairs.
+        HONROUTOU: Only terminal and honor tiles.
+        SHOUSANGEN: Two dragon triplets and a dragon head.
+        HONITSU: One suit with honors.
+        JUNCHAN: Terminal in every part, with a sequence.
+        RYANPEIKOU: Two pairs of identical sequences in a concealed hand.
+        CHINITSU: One suit without honors.
+        KOKUSHI_MUSOU: Thirteen orphans.
+        KOKUSHI_MUSOU_13_WAIT: Thirteen orphans waiting on all thirteen tiles.
+        SUUANKOU: Four concealed triplets or quads.
+        SUUANKOU_TANKI: Four concealed triplets or quads on a single wait.
+        DAISANGEN: Three dragon triplets.
+        SHOUSUUSHII: Three wind triplets and a wind head.
+        DAISUUSHII: Four wind triplets.
+        TSUUIISOU: Only honor tiles.
+        CHINROUTOU: Only terminal tiles.
+        RYUUIISOU: Only green tiles.
+        CHUUREN_POUTOU: Nine gates, 1112345678999 and one more tile of a suit.
+        SUUKANTSU: Four quads.
+        TENHOU: Dealer win on the initial draw.
+        CHIIHOU: Non-dealer win on the first uninterrupted draw.
+
+    """
+
+    RIICHI = auto()
+    DOUBLE_RIICHI = auto()
+    IPPATSU = auto()
+    MENZEN_TSUMO = auto()
+    PINFU = auto()
+    IIPEIKOU = auto()
+    HAITEI = auto()
+    HOUTEI = auto()
+    RINSHAN = auto()
+    CHANKAN = auto()
+    TANYAO = auto()
+    SEAT_WIND = auto()
+    ROUND_WIND = auto()
+    WHITE_DRAGON = auto()
+    GREEN_DRAGON = auto()
+    RED_DRAGON = auto()
+    CHANTA = auto()
+    SANSHOKU_DOUJUN = auto()
+    ITTSU = auto()
+    TOITOI = auto()
+    SANANKOU = auto()
+    SANSHOKU_DOUKOU = auto()
+    SANKANTSU = auto()
+    CHIITOITSU = auto()
+    HONROUTOU = auto()
+    SHOUSANGEN = auto()
+    HONITSU = auto()
+    JUNCHAN = auto()
+    RYANPEIKOU = auto()
+    CHINITSU = auto()
+
+    KOKUSHI_MUSOU = auto()
+    KOKUSHI_MUSOU_13_WAIT = auto()
+    SUUANKOU = auto()
+    SUUANKOU_TANKI = auto()
+    DAISANGEN = auto()
+    SHOUSUUSHII = auto()
+    DAISUUSHII = auto()
+    TSUUIISOU = auto()
+    CHINROUTOU = auto()
+    RYUUIISOU = auto()
+    CHUUREN_POUTOU = auto()
+    SUUKANTSU = auto()
+    TENHOU = auto()
+    CHIIHOU = auto()
@@ -0,0 +1,107 @@
+from enum import IntFlag, auto
+
+
+class YakuFeature(IntFlag):
+    """Define the features of a winning hand that yaku are tested against.
+
+    Shape features depend only on the division of the hand and are stored in its
+    `DivisionSignatureData`. Situation features depend on the scoring context and
+    are added when the yaku are evaluated.
+
+    Attributes:
+        CONCEALED: No part was formed by calling a discard.
+        TSUMO: The winning tile was self-drawn.
+        SEVEN_PAIRS: The hand is seven pairs.
+        THIRTEEN_ORPHANS: The hand is thirteen orphans.
+        SIDE_WAIT: The hand won on a two-sided wait.
+        SINGLE_WAIT: The hand won on a single wait.
+        THIRTEEN_WAIT: The thirteen orphans waited on all thirteen tiles.
+        ALL_SEQUENCES: The four bodies are sequences.
+        ALL_TRIPLETS: The four bodies are triplets or quads.
+        HAS_SEQUENCE: Some part is a sequence.
+        HAS_HONOR: Some tile is an honor.
+        OUTSIDE: Every part holds a terminal or an honor.
+        ONE_SUIT: All number tiles are of one suit.
+        SIMPLES_ONLY: All tiles are simples.
+        TERMINALS_AND_HONORS_ONLY: All tiles are terminals or honors.
+        TERMINALS_ONLY: All tiles are terminals.
+        HONORS_ONLY: All tiles are honors.
+        GREENS_ONLY: All tiles are green.
+        ONE_IDENTICAL_SEQUENCES: One pair of identical concealed sequences.
+        TWO_IDENTICAL_SEQUENCES: Two pairs of identical concealed sequences.
+        THREE_COLOR_SEQUENCES: Same sequence in the three suits.
+        THREE_COLOR_TRIPLETS: Same triplet in the three suits.
+        STRAIGHT: Sequences 123, 456 and 789 of one suit.
+        THREE_CONCEALED_TRIPLETS: Exactly three concealed triplets or quads.
+        FOUR_CONCEALED_TRIPLETS: Four concealed triplets or quads.
+        THREE_QUADS: Exactly three quads.
+        FOUR_QUADS: Four quads.
+        WHITE_DRAGON: Triplet of white dragons.
+        GREEN_DRAGON: Triplet of green dragons.
+        RED_DRAGON: Triplet of red dragons.
+        LITTLE_THREE_DRAGONS: Two dragon triplets and a dragon head.
+        BIG_THREE_DRAGONS: Three dragon triplets.
+        LITTLE_FOUR_WINDS: Three wind triplets and a wind head.
+        BIG_FOUR_WINDS: Four wind triplets.
+        NINE_GATES: 1112345678999 and one more tile of a suit, concealed.
+        RIICHI: Riichi was declared, but not double riichi.
+        DOUBLE_RIICHI: Double riichi was declared.
+        IPPATSU: The win came within one turn of riichi.
+        LAST_TILE: The win came on the last tile of the wall.
+        AFTER_KAN: The winning tile was the replacement tile of a kan.
+        ROBBING_KAN: The winning tile was added to a pon for a kan.
+        FIRST_DRAW: The win came on the first uninterrupted draw.
+        DEALER: The player is the dealer.
+        SEAT_WIND: Triplet of the seat wind.
+        ROUND_WIND: Triplet of the round wind.
+        VALUE_HEAD: The head is a dragon, the seat wind or the round wind.
+
+    """
+
+    CONCEALED = auto()
+    TSUMO = auto()
+    SEVEN_PAIRS = auto()
+    THIRTEEN_ORPHANS = auto()
+    SIDE_WAIT = auto()
+    SINGLE_WAIT = auto()
+    THIRTEEN_WAIT = auto()
+    ALL_SEQUENCES = auto()
+    ALL_TRIPLETS = auto()
+    HAS_SEQUENCE = auto()
+    HAS_HONOR = auto()
+    OUTSIDE = auto()
+    ONE_SUIT = auto()
+    SIMPLES_ONLY = auto()
+    TERMINALS_AND_HONORS_ONLY = auto()
+    TERMINALS_ONLY = auto()
+    HONORS_ONLY = auto()
+    GREENS_ONLY = auto()
+    ONE_IDENTICAL_SEQUENCES = auto()
+    TWO_IDENTICAL_SEQUENCES = auto()
+    THREE_COLOR_SEQUENCES = auto()
+    THREE_COLOR_TRIPLETS = auto()
+    STRAIGHT = auto()
+    THREE_CONCEALED_TRIPLETS = auto()
+    FOUR_CONCEALED_TRIPLETS = auto()
+    THREE_QUADS = auto()
+    FOUR_QUADS = auto()
+    WHITE_DRAGON = auto()
+    GREEN_DRAGON = auto()
+    RED_DRAGON = auto()
+    LITTLE_THREE_DRAGONS = auto()
+    BIG_THREE_DRAGONS = auto()
+    LITTLE_FOUR_WINDS = auto()
+    BIG_FOUR_WINDS = auto()
+    NINE_GATES = auto()
+
+    RIICHI = auto()
+    DOUBLE_RIICHI = auto()
+    IPPATSU = auto()
+    LAST_TILE = auto()
+    AFTER_KAN = auto()
+    ROBBING_KAN = auto()
+    FIRST_DRAW = auto()
+    DEALER = auto()
+    SEAT_WIND = auto()
+    ROUND_WIND = auto()
+    VALUE_HEAD = auto()
@@ -0,0 +1,8 @@
+from pymj.features.encoder import (
+    NUM_BASE_PLANES,
+    encode_batch,
+    encode_counts,
+    num_planes,
+)
+
+__all__ = ["NUM_BASE_PLANES", "encode_batch", "encode_counts", "num_planes"]
@@ -0,0 +1,202 @@
+from collections.abc import Sequence
+from itertools import chain
+
+import numpy as np
+import numpy.typing as npt
+
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile_mapping import TileMapping
+
+NUM_BASE_PLANES = 9
+_COUNT_THRESHOLDS = np.arange(4).reshape(1, 4, 1)
+
+
+def num_planes(with_shanten: bool = False, with_ukeire: bool = False) -> int:
+    """Calculate the number of feature planes produced by the encoders.
+
+    Args:
+        with_shanten (bool, optional): Whether the shanten plane is included.
+            Defaults to False.
+        with_ukeire (bool, optional): Whether the ukeire plane is included.
+            Defaults to False.
+
+    Returns:
+        int: Number of planes C in encoded arrays of shape (N, C, 34).
+
+    """
+    return NUM_BASE_PLANES + int(with_shanten) + int(with_ukeire)
+
+
+def encode_counts(
+    concealed_counts: npt.ArrayLike,
+    called_counts: npt.ArrayLike | None = None,
+    agari_tiles: npt.ArrayLike | None = None,
+    out: npt.NDArray[np.generic] | None = None,
+) -> npt.NDArray[np.generic]:
+    """Encode tile count matrices into feature planes.
+
+    The base planes are laid out as follows:
+        0-3: Concealed tiles, plane k is set where the count exceeds k.
+        4-7: Called tiles, plane k is set where the count exceeds k.
+        8  : The winning (drawn) tile.
+
+    Only the base planes of `out` are written, so extra planes after them are left
+    for the caller.
+
+    Args:
+        concealed_counts (npt.ArrayLike): Concealed tile counts of shape (N, 34).
+        called_counts (npt.ArrayLike | None, optional): Called tile counts of shape
+            (N, 34). Defaults to None for hands without calls.
+        agari_tiles (npt.ArrayLike | None, optional): Winning tile index of each
+            hand of shape (N,), where negative values mean no winning tile.
+            Defaults to None.
+        out (npt.NDArray[np.generic] | None, optional): Preallocated array of shape
+            (N, C, 34) with C >= NUM_BASE_PLANES to write into. Defaults to None
+            to allocate a float32 array with the base planes only.
+
+    Returns:
+        npt.NDArray[np.generic]: Feature planes of shape (N, C, 34).
+
+    Raises:
+        ValueError: If the shapes of the arguments do not match.
+
+    """
+    concealed = np.asarray(concealed_counts)
+    if concealed.ndim != 2 or concealed.shape[1] != 34:
+        raise ValueError
+
+    num_hands = concealed.shape[0]
+    if out is None:
+        out = np.empty((num_hands, NUM_BASE_PLANES, 34), dtype=np.float32)
+    elif (
+        out.shape[0] != num_hands
+        or out.shape[1] < NUM_BASE_PLANES
+        or out.shape[2] != 34
+    ):
+        raise ValueError
+
+    np.greater(concealed[:, np.newaxis, :], _COUNT_THRESHOLDS, out=out[:, 0:4])
+    if called_counts is None:
+        out[:, 4:8] = 0
+    else:
+        called = np.asarray(called_counts)
+        if called.shape != concealed.shape:
+            raise ValueError
+        np.greater(called[:, np.newaxis, :], _COUNT_THRESHOLDS, out=out[:, 4:8])
+
+    out[:, 8] = 0
+    if agari_tiles is not None:
+        agari = np.asarray(agari_tiles)
+        if agari.shape != (num_hands,):
+            raise ValueError
+        rows = np.flatnonzero(agari >= 0)
+        out[rows, 8, agari[rows]] = 1
+
+    return out
+
+
+def encode_batch(
+    hand_infos: Sequence[HandInfo],
+    out: npt.NDArray[np.generic] | None = None,
+    with_shanten: bool = False,
+    with_ukeire: bool = False,
+    checker: BaseHandChecker | None = None,
+) -> npt.NDArray[np.generic]:
+    """Encode hands into feature planes for training models.
+
+    Concealed planes include the winning tile, which is also marked on its own
+    plane (see `encode_counts`). Optional planes follow the base planes:
+        shanten: Filled with the shanten number of the hand.
+        ukeire : Set at tiles that reduce the shanten number of the concealed
+            tiles without the winning tile, for hands with 3n+1 of them.
+
+    The optional planes run the hand checker for every hand and are therefore much
+    slower than the base planes.
+
+    Args:
+        hand_infos (Sequence[HandInfo]): Hands to encode.
+        out (npt.NDArray[np.generic] | None, optional): Preallocated array of shape
+            (N, C, 34) with C >= num_planes(with_shanten, with_ukeire) to write
+            into. Defaults to None to allocate a float32 array.
+        with_shanten (bool, optional): Whether to add the shanten plane.
+            Defaults to False.
+        with_ukeire (bool, optional): Whether to add the ukeire plane.
+            Defaults to False.
+        checker (BaseHandChecker | None, optional): Checker for the optional
+            planes. Defaults to CombinedHandChecker.
+
+    Returns:
+        npt.NDArray[np.generic]: Feature planes of shape (N, C, 34).
+
+    Raises:
+        ValueError: If the shape of out does not fit the hands and planes.
+
+    """
+    num_hands = len(hand_infos)
+    total_planes = num_planes(with_shanten, with_ukeire)
+    if out is None:
+        out = np.empty((num_hands, total_planes, 34), dtype=np.float32)
+    elif out.shape[1] < total_planes:
+        raise ValueError
+
+    concealed = np.fromiter(
+        chain.from_iterable(hand_info.concealed_count for hand_info in hand_infos),
+        dtype=np.uint8,
+        count=34 * num_hands,
+    ).reshape(num_hands, 34)
+    agari_tiles = np.fromiter(
+        (
+            TileMapping.tile_to_index(hand_info.agari_tile)
+            if hand_info.agari_tile
+            else -1
+            for hand_info in hand_infos
+        ),
+        dtype=np.int64,
+        count=num_hands,
+    )
+    rows = np.flatnonzero(agari_tiles >= 0)
+    concealed[rows, agari_tiles[rows]] += 1
+
+    called = np.zeros((num_hands, 34), dtype=np.uint8)
+    for row, hand_info in enumerate(hand_infos):
+        for _, call_count in hand_info.call_counts:
+            called[row] += np.fromiter(call_count, dtype=np.uint8, count=34)
+
+    encode_counts(concealed, called, agari_tiles, out)
+
+    if with_shanten or with_ukeire:
+        _encode_checker_planes(
+            hand_infos,
+            out,
+            with_shanten,
+            with_ukeire,
+            checker or CombinedHandChecker(),
+        )
+    return out
+
+
+def _encode_checker_planes(
+    hand_infos: Sequence[HandInfo],
+    out: npt.NDArray[np.generic],
+    with_shanten: bool,
+    with_ukeire: bool,
+    checker: BaseHandChecker,
+) -> None:
+    shanten_plane = NUM_BASE_PLANES
+    ukeire_plane = NUM_BASE_PLANES + int(with_shanten)
+    if with_ukeire:
+        out[:, ukeire_plane] = 0
+
+    for row, hand_info in enumerate(hand_infos):
+        if with_shanten:
+            out[row, shanten_plane] = checker.calculate_shanten(hand_info)
+
+        if with_ukeire and hand_info.concealed_count.num_tiles % 3 == 1:
+            concealed_hand_info = HandInfo(
+                concealed_count=hand_info.concealed_count,
+                call_counts=hand_info.call_counts,
+            )
+            ukeire, _ = checker.calculate_ukeire(concealed_hand_info)
+            out[row, ukeire_plane, ukeire] = 1
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+import numpy as np
+
+from pymj.game.decision import Decision
+
+
+class Agent(ABC):
+    """Define the interface of players that answer decisions of a game."""
+
+    @abstractmethod
+    def decide(self, decision: Decision) -> int:
+        """Answer a decision.
+
+        Args:
+            decision (Decision): Decision to make.
+
+        Returns:
+            int: Index of the chosen option.
+
+        """
+
+    def decide_batch(self, decisions: Sequence[Decision]) -> list[int]:
+        """Answer decisions of many tables at once.
+
+        Agents that evaluate decisions in batches, e.g. with a model, override
+        this method.
+
+        Args:
+            decisions (Sequence[Decision]): Decisions to make.
+
+        Returns:
+            list[int]: Index of the chosen option of each decision.
+
+        """
+        return [self.decide(decision) for decision in decisions]
+
+
+class TsumogiriAgent(Agent):
+    """Always choose the default option.
+
+    The agent discards every drawn tile, never calls and always wins.
+    """
+
+    def decide(self, decision: Decision) -> int:  # noqa: ARG002
+        """Choose the default option.
+
+        Args:
+            decision (Decision): Decision to make.
+
+        Returns:
+            int: Always 0.
+
+        """
+        return 0
+
+
+class RandomAgent(Agent):
+    """Choose options uniformly at random.
+
+    Attributes:
+        rng (np.random.Generator): Random number generator.
+
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        """Initialize random agent.
+
+        Args:
+            seed (int | None, optional): Seed of the random choices. Defaults to
+                None.
+
+        """
+        self.rng = np.random.default_rng(seed)
+
+    def decide(self, decision: Decision) -> int:
+        """Choose a random option.
+
+        Args:
+            decision (Decision): Decision to make.
+
+        Returns:
+            int: Index of a random option.
+
+        """
+        return int(self.rng.integers(len(decision.options)))
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from typing import Any
+
+from pymj.enums.call_option import CallOption
+from pymj.game.agent import Agent
+from pymj.game.decision import Decision
+from pymj.tiles.tile_mapping import TileMapping
+
+
+def decision_to_message(decision: Decision) -> dict[str, Any]:
+    """Convert a decision to a JSON-serializable message for out-of-process agents.
+
+    The message holds what the deciding player can see: its own hand, the
+    discards of every seat and the number of tiles left in the wall. Call options
+    become objects with the name of the call type and the tile indices.
+
+    Args:
+        decision (Decision): Decision to convert.
+
+    Returns:
+        dict[str, Any]: Message with the keys type, player, tile, options, hand,
+            calls, discards and remaining.
+
+    """
+    table = decision.table
+    seat = table.seats[decision.player]
+    return {
+        "type": decision.decision_type.name,
+        "player": decision.player,
+        "tile": decision.tile,
+        "options": [
+            {"call_type": option.call_type.name, "tiles": list(option.tiles)}
+            if isinstance(option, CallOption)
+            else option
+            for option in decision.options
+        ],
+        "hand": list(seat.concealed_count),
+        "calls": [
+            {
+                "call_type": call.call_type.name,
+                "tiles": [TileMapping.tile_to_index(tile) for tile in call.tiles],
+            }
+            for call in seat.calls
+        ],
+        "discards": [list(other.river) for other in table.seats],
+        "remaining": table.wall.num_remaining if table.wall else 0,
+    }
+
+
+class AsyncAgent(ABC):
+    """Define the interface of players that answer decisions asynchronously.
+
+    Async agents are driven by `pymj.game.host.TableHost`, which awaits the
+    decisions of many tables on one event loop.
+    """
+
+    async def start(self) -> None:  # noqa: B027
+        """Acquire the resources of the agent, such as a process to talk to."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release the resources of the agent."""
+
+    @abstractmethod
+    async def decide(self, decision: Decision) -> int:
+        """Answer a decision.
+
+        Args:
+            decision (Decision): Decision to make.
+
+        Returns:
+            int: Index of the chosen option.
+
+        """
+
+
+class InProcessAgent(AsyncAgent):
+    """Answer decisions with a synchronous agent, in threads or inline.
+
+    In threads, the agent runs outside the event loop, so a slow answer neither
+    blocks the other tables nor escapes the timeout of the host. Each table has a
+    thread of its own, so the agent may be called from several threads at once,
+    and it sees a deep copy of the decision and its table, which the game cannot
+    change under it. A call that timed out keeps its thread until it returns, and
+    the next decisions of the table get a new thread.
+    Inline, the agent runs in the event loop, which saves the copy and the handoff
+    to the thread but cannot be interrupted by a timeout.
+
+    Attributes:
+        agent (Agent): Agent that answers the decisions.
+        use_thread (bool): Whether the agent runs in threads.
+
+    """
+
+    def __init__(self, agent: Agent, use_thread: bool = True) -> None:
+        """Initialize in-process agent.
+
+        Args:
+            agent (Agent): Agent that answers the decisions.
+            use_thread (bool, optional): Whether the agent runs in threads.
+                Defaults to True.
+
+        """
+        self.agent = agent
+        self.use_thread = use_thread
+        self._executors: dict[int, ThreadPoolExecutor] = {}
+
+    async def close(self) -> None:
+        """Shut down the threads of the agent."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
+
+    async def decide(self, decision: Decision) -> int:
+        """Answer a decision with the wrapped agent.
+
+        Args:
+            decision (Decision): Decision to make.
+
+        Returns:
+            int: Index of the chosen option.
+
+        """
+        if not self.use_thread:
+            return self.agent.decide(decision)
+
+        key = id(decision.table)
+        executor = self._executors.get(key)
+        if executor is None:
+            executor = self._executors[key] = ThreadPoolExecutor(1)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                executor,
+                self.agent.decide,
+                deepcopy(decision),
+            )
+        except asyncio.CancelledError:
+            # The call keeps running, so the thread is left to it.
+            executor.shutdown(wait=False)
+            if self._executors.get(key) is executor:
+                del self._executors[key]
+            raise
+
+
+class SubprocessAgent(AsyncAgent):
+    """Answer decisions with a local process speaking JSON lines over stdio.
+
+    Each decision is written to the standard input of the process as one line of
+    `decision_to_message` with an additional "id" key, and the process answers
+    with one line {"id": id, "answer": index} on its standard output. Answers are
+    matched by id, so the decisions of many tables can be pending at once and the
+    process may answer them in any order. See `pymj.game.stdio_bot` for a minimal
+    process.
+
+    Attributes:
+        args (Sequence[str]): Program and arguments of the process.
+
+    """
+
+    def __init__(self, args: Sequence[str]) -> None:
+        """Initialize subprocess agent without starting the process.
+
+        Args:
+            args (Sequence[str]): Program and arguments of the process.
+
+        """
+        self.args = args
+        self._process: asyncio.subprocess.Process | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._pending: dict[int, asyncio.Future[int]] = {}
+        self._next_id = 0
+
+    async def start(self) -> None:
+        """Start the process unless it is running."""
+        if self._process is not None:
+            return
+        self._process = await asyncio.create_subprocess_exec(
+            *self.args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        self._reader = asyncio.create_task(self._read_answers(self._process))
+
+    async def close(self) -> None:
+        """Close the standard input of the process and wait for it to exit."""
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        if process.stdin is not None:
+            process.stdin.close()
+        await process.wait()
+        if self._reader is not None:
+            await self._reader
+
+    async def decide(self, decision: Decision) -> int:
+        """Send a decision to the process and wait for its answer.
+
+        Args:
+            decision (Decision): Decision to make.
+
+        Returns:
+            int: Index of the chosen option.
+
+        Raises:
+            EOFError: If the process is not running or exits before answering.
+
+        """
+        if self._process is None or self._process.stdin is None:
+            raise EOFError
+        if self._reader is not None and self._reader.done():
+            raise EOFError
+
+        message_id = self._next_id
+        self._next_id += 1
+        answer: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = answer
+        message = decision_to_message(decision) | {"id": message_id}
+        try:
+            self._process.stdin.write(json.dumps(message).encode() + b"\n")
+            await self._process.stdin.drain()
+            return await answer
+        finally:
+            del self._pending[message_id]
+
+    async def _read_answers(self, process: asyncio.subprocess.Process) -> None:
+        if process.stdout is None:
+            return
+        async for line in process.stdout:
+            reply = json.loads(line)
+            answer = self._pending.get(reply["id"])
+            # Answers of decisions that timed out are dropped.
+            if answer is not None and not answer.done():
+                answer.set_result(int(reply["answer"]))
+        for answer in self._pending.values():
+            if not answer.done():
+                answer.set_exception(EOFError())
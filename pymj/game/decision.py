@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pymj.enums.call_option import CallOption
+from pymj.enums.decision_type import DecisionType
+
+if TYPE_CHECKING:
+    from pymj.game.table import Table
+
+
+@dataclass
+class Decision:
+    """A decision that a game asks a player to make.
+
+    A decision is answered with the index of the chosen option. Options are
+    ordered so that index 0 is always a sensible default: discarding the drawn
+    tile, passing on a call or kan, and winning when possible.
+
+    Tables update one decision in place for each of their decisions, so a
+    decision and its options are only valid until it is answered. Agents that
+    keep decisions, e.g. to record them, copy them with `dataclasses.replace`.
+
+    Attributes:
+        decision_type (DecisionType): Type of the decision.
+        player (int): Seat of the player to decide.
+        table (Table): Table of the game, to look at the seats and the wall.
+        tile (int | None): Index of the drawn tile for decisions on the player's
+            own turn, or of the discarded tile for calls and ron.
+        options (Sequence[int | CallOption | bool | None]): Tile indices to discard,
+            calls to make (None to pass), or whether to win.
+
+    """
+
+    decision_type: DecisionType
+    player: int
+    table: Table
+    tile: int | None
+    options: Sequence[int | CallOption | bool | None]
+
+    def choose(self, answer: int) -> int | CallOption | bool | None:
+        """Get the option of an answer.
+
+        Args:
+            answer (int): Index of the chosen option.
+
+        Returns:
+            int | CallOption | bool | None: The chosen option.
+
+        Raises:
+            ValueError: If the answer is not an index of the options.
+
+        """
+        if not 0 <= answer < len(self.options):
+            raise ValueError
+        return self.options[answer]
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import TypeVar
+
+import numpy as np
+
+from pymj.enums.decision_type import DecisionType
+from pymj.enums.game_result_data import GameResultData
+from pymj.enums.host_stats_data import HostStatsData
+from pymj.game.agent import Agent
+from pymj.game.async_agent import AsyncAgent, InProcessAgent
+from pymj.game.decision import Decision
+from pymj.game.runner import iter_walls
+from pymj.game.table import NUM_PLAYERS, Table
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_mapping import TileMapping
+
+# Tables whose agents answer without suspending give way to the other tables
+# after this many decisions.
+YIELD_INTERVAL = 64
+
+T = TypeVar("T")
+
+
+class TableHost:
+    """Host many tables on one asyncio event loop.
+
+    Every table runs as a task that drives `Table.play_game` and awaits the
+    decisions of its agents, so tables waiting for slow agents, such as local
+    processes (see `SubprocessAgent`), let the others go on. A decision that is not
+    answered within the timeout, or answered with an index out of its options, gets
+    the default option 0. Synchronous agents run in threads when there is a
+    timeout, so it can expire, and in the event loop without one, which is faster.
+    Heavy analyses are run in a process pool shared by all agents of the host with
+    `run_in_pool`.
+
+    Attributes:
+        agents (list[AsyncAgent]): Agents of the four seats, shared by all tables.
+        num_tables (int): Number of tables played concurrently.
+        num_winds (int): Number of round winds of the games.
+        timeout (float | None): Seconds to wait for an answer, or None to wait
+            forever.
+        stats (HostStatsData): Counters of the games and decisions so far.
+
+    """
+
+    def __init__(
+        self,
+        agents: Sequence[AsyncAgent | Agent],
+        num_tables: int = 256,
+        num_winds: int = 2,
+        timeout: float | None = 1.0,
+        seed: int | None = None,
+        num_workers: int | None = None,
+        checker: BaseHandChecker | None = None,
+    ) -> None:
+        """Initialize table host.
+
+        Args:
+            agents (Sequence[AsyncAgent | Agent]): Agents of the four seats.
+                Synchronous agents are wrapped in `InProcessAgent`, once for
+                each distinct agent.
+            num_tables (int, optional): Number of tables played concurrently.
+                Defaults to 256.
+            num_winds (int, optional): Number of round winds. Defaults to 2.
+            timeout (float | None, optional): Seconds to wait for an answer, or
+                None to wait forever. Defaults to 1.0.
+            seed (int | None, optional): Seed of the walls. Defaults to None.
+            num_workers (int | None, optional): Number of processes of the pool.
+                Defaults to None for the number of CPUs.
+            checker (BaseHandChecker | None, optional): Checker that judges the
+                hands. Defaults to CombinedHandChecker.
+
+        Raises:
+            ValueError: If there are not four agents or no tables.
+
+        """
+        if len(agents) != NUM_PLAYERS or num_tables <= 0:
+            raise ValueError
+
+        wrappers = {
+            id(agent): InProcessAgent(agent, use_thread=timeout is not None)
+            for agent in agents
+            if not isinstance(agent, AsyncAgent)
+        }
+        self.agents = [
+            agent if isinstance(agent, AsyncAgent) else wrappers[id(agent)]
+            for agent in agents
+        ]
+        self.num_tables = num_tables
+        self.num_winds = num_winds
+        self.timeout = timeout
+        self.stats = HostStatsData()
+        self._tables = [Table(checker) for _ in range(num_tables)]
+        self._num_workers = num_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._walls = iter_walls(np.random.default_rng(seed), num_tables)
+        self._num_started = 0
+        self._num_games = 0
+        self._started = False
+
+    async def __aenter__(self) -> TableHost:
+        """Start the agents."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Close the agents and the process pool."""
+        await self.close()
+
+    async def start(self) -> None:
+        """Start the agents unless they are started, each distinct agent once."""
+        if self._started:
+            return
+        self._started = True
+        await asyncio.gather(*(agent.start() for agent in self._distinct_agents()))
+
+    async def close(self) -> None:
+        """Close the agents and shut down the process pool."""
+        self._started = False
+        await asyncio.gather(*(agent.close() for agent in self._distinct_agents()))
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def run(self, num_games: int) -> list[GameResultData]:
+        """Play games on the tables until the given number of games are finished.
+
+        Args:
+            num_games (int): Number of games to play.
+
+        Returns:
+            list[GameResultData]: Results of the games in the order they finished.
+
+        Raises:
+            ExceptionGroup: If a table fails, e.g. because an agent raises, after
+                the other tables are cancelled.
+
+        """
+        await self.start()
+        results: list[GameResultData] = []
+        self._num_started = 0
+        self._num_games = num_games
+        start_time = time.perf_counter()
+        try:
+            async with asyncio.TaskGroup() as group:
+                for table in self._tables[:num_games]:
+                    group.create_task(self._run_table(table, results))
+        finally:
+            self.stats.elapsed += time.perf_counter() - start_time
+        return results
+
+    async def run_in_pool(self, function: Callable[..., T], *args: object) -> T:
+        """Run a function in the process pool shared by the agents.
+
+        Args:
+            function (Callable[..., T]): Picklable function to run.
+            *args (object): Picklable arguments of the function.
+
+        Returns:
+            T: Return value of the function.
+
+        """
+        if self._executor is None:
+            # Agents may run in threads, which forked workers would inherit in
+            # whatever state they are, so workers are spawned instead.
+            self._executor = ProcessPoolExecutor(
+                self._num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    def _distinct_agents(self) -> list[AsyncAgent]:
+        return list({id(agent): agent for agent in self.agents}.values())
+
+    async def _run_table(self, table: Table, results: list[GameResultData]) -> None:
+        while self._num_started < self._num_games:
+            self._num_started += 1
+            game = table.play_game(self._walls, self.num_winds)
+            try:
+                decision = next(game)
+                while True:
+                    decision = game.send(await self._decide(decision))
+            except StopIteration as stop:
+                result: GameResultData = stop.value
+            results.append(result)
+            self.stats.num_games += 1
+            self.stats.num_rounds += result.num_rounds
+
+    async def _decide(self, decision: Decision) -> int:
+        start_time = time.perf_counter()
+        try:
+            answer = await asyncio.wait_for(
+                self.agents[decision.player].decide(decision),
+                self.timeout,
+            )
+        except TimeoutError:
+            self.stats.num_timeouts += 1
+            answer = 0
+        if not 0 <= answer < len(decision.options):
+            self.stats.num_invalid_answers += 1
+            answer = 0
+
+        latency = time.perf_counter() - start_time
+        self.stats.num_decisions += 1
+        self.stats.total_latency += latency
+        self.stats.max_latency = max(self.stats.max_latency, latency)
+        if self.stats.num_decisions % YIELD_INTERVAL == 0:
+            await asyncio.sleep(0)
+        return answer
+
+
+def calculate_best_discard(hand_info: HandInfo) -> int | None:
+    """Find the discard with the most ukeire among those keeping the shanten.
+
+    Args:
+        hand_info (HandInfo): Hand with 3n+1 concealed tiles and a drawn tile.
+
+    Returns:
+        int | None: Index of the best discard, or None if there is none.
+
+    """
+    efficiency = CombinedHandChecker().calculate_efficiency(hand_info)
+    return efficiency[0].discard_tile if efficiency else None
+
+
+class EfficiencyAgent(AsyncAgent):
+    """Discard for the most ukeire, computed in the process pool of a host.
+
+    The agent always wins and never calls.
+
+    Attributes:
+        host (TableHost): Host whose process pool computes the discards.
+
+    """
+
+    def __init__(self, host: TableHost) -> None:
+        """Initialize efficiency agent.
+
+        Args:
+            host (TableHost): Host whose process pool computes the discards.
+
+        """
+        self.host = host
+
+    async def decide(self, decision: Decision) -> int:
+        """Choose the best discard, or the default option for other decisions.
+
+        Args:
+            decision (Decision): Decision to make.
+
+        Returns:
+            int: Index of the chosen option.
+
+        """
+        if decision.decision_type is not DecisionType.DISCARD:
+            return 0
+
+        seat = decision.table.seats[decision.player]
+        counts = list(seat.concealed_count)
+        # After a call the hand has no drawn tile, and any held tile stands in for
+        # it, since the analysis only depends on the tiles together.
+        drawn_tile = seat.drawn_tile
+        if drawn_tile is None:
+            drawn_tile = next(tile for tile, count in enumerate(counts) if count)
+            counts[drawn_tile] -= 1
+        hand_info = HandInfo(
+            TileCount(counts),
+            seat.hand_info.call_counts[:],
+            agari_tile=TileMapping.index_to_tile(drawn_tile),
+        )
+        tile = await self.host.run_in_pool(calculate_best_discard, hand_info)
+        return decision.options.index(tile) if tile in decision.options else 0
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+
+class River:
+    """Discards of a player with bitmasks of the tiles the player cannot ron on.
+
+    Discards are stored as tile indices in a byte array. Alongside, 34-bit masks
+    with bit i for tile index i are updated on every discard, so that furiten and
+    safe tile queries are single mask operations however long the river is:
+
+    - discard_mask: tiles the player has discarded (permanent furiten).
+    - passed_mask: tiles discarded by the others since the player's last discard
+      (temporary furiten), cleared when the player discards.
+    - riichi_passed_mask: tiles discarded by the others since the player declared
+      riichi, which the player can no longer ron on for the rest of the round.
+
+    Attributes:
+        tiles (bytearray): Indices of the discarded tiles in order.
+        discard_mask (int): Bitmask of the discarded tile indices.
+        passed_mask (int): Bitmask of tiles discarded by the others since the
+            player's last discard.
+        riichi_index (int | None): Position in the river of the riichi declaration
+            tile, or None without riichi.
+        riichi_passed_mask (int): Bitmask of tiles discarded by the others since
+            the riichi declaration.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty river."""
+        self.tiles = bytearray()
+        self.discard_mask = 0
+        self.passed_mask = 0
+        self.riichi_index: int | None = None
+        self.riichi_passed_mask = 0
+
+    def __len__(self) -> int:
+        """Count the discards."""
+        return len(self.tiles)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the indices of the discarded tiles in order."""
+        return iter(self.tiles)
+
+    @property
+    def furiten_mask(self) -> int:
+        """Bitmask of tiles the player cannot win on by ron."""
+        return self.discard_mask | self.passed_mask | self.riichi_passed_mask
+
+    @property
+    def safe_mask(self) -> int:
+        """Bitmask of tiles that cannot deal into the player (genbutsu)."""
+        return self.furiten_mask
+
+    def discard(self, tile: int) -> None:
+        """Record a discard of the player.
+
+        Args:
+            tile (int): Index of the discarded tile.
+
+        """
+        self.tiles.append(tile)
+        self.discard_mask |= 1 << tile
+        self.passed_mask = 0
+
+    def observe(self, tile: int) -> None:
+        """Record a discard of another player that the player did not ron on.
+
+        Args:
+            tile (int): Index of the discarded tile.
+
+        """
+        self.passed_mask |= 1 << tile
+        if self.riichi_index is not None:
+            self.riichi_passed_mask |= 1 << tile
+
+    def declare_riichi(self) -> None:
+        """Mark the next discard of the player as its riichi declaration.
+
+        Raises:
+            ValueError: If the player has already declared riichi.
+
+        """
+        if self.riichi_index is not None:
+            raise ValueError
+        self.riichi_index = len(self.tiles)
+
+    def is_furiten(self, waits_mask: int) -> bool:
+        """Check whether the player is furiten on its waits.
+
+        Args:
+            waits_mask (int): Bitmask of the winning tiles of the player, as
+                returned by `BaseHandChecker.calculate_waits`.
+
+        Returns:
+            bool: True if any winning tile cannot be won on by ron.
+
+        """
+        return bool(waits_mask & self.furiten_mask)
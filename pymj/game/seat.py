@@ -0,0 +1,442 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from pymj.enums.call_option import CallOption
+from pymj.enums.call_type import CallType
+from pymj.enums.player_relation import PlayerRelation
+from pymj.game.river import River
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.tiles.call import Call
+from pymj.tiles.hand import Hand
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile import Tile
+from pymj.tiles.tile_constants import Tiles
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_ids import RED_FIVE_IDS136
+from pymj.tiles.tile_mapping import TileMapping
+
+_TILES = tuple(TileMapping.index_to_tile(index) for index in Tiles.ALL)
+_RED_TILES = {
+    index: Tile(_TILES[index].tile_type, 5, is_red=True) for index in Tiles.RED_FIVES
+}
+_RED_BITS = {index: 1 << bit for bit, index in enumerate(Tiles.RED_FIVES)}
+_SUIT_STARTS = (0, 9, 18, 27)
+_SUIT_MASK = (1 << 9) - 1
+# Tile indices of each bitmask of the nine tiles of a suit, by suit.
+_MASK_TILES = tuple(
+    tuple(
+        tuple(start + offset for offset in range(9) if bits >> offset & 1)
+        for bits in range(1 << 9)
+    )
+    for start in _SUIT_STARTS
+)
+
+
+def _to_tile(index: int, is_red: bool = False) -> Tile:
+    return _RED_TILES[index] if is_red else _TILES[index]
+
+
+def find_call_options(
+    concealed_count: TileCount,
+    tile: int,
+    relation: PlayerRelation,
+    can_kan: bool,
+) -> list[CallOption]:
+    """List the calls that a hand can make on a discarded tile.
+
+    Args:
+        concealed_count (TileCount): Concealed tiles of the hand.
+        tile (int): Index of the discarded tile.
+        relation (PlayerRelation): Relation to the player who discarded it.
+        can_kan (bool): Whether a kan can still be declared.
+
+    Returns:
+        list[CallOption]: Possible chii, pon and big melded kan calls.
+
+    """
+    count = concealed_count
+    options = []
+    if relation is PlayerRelation.PREV and tile < 27:
+        suit_start = tile - tile % 9
+        for start in range(
+            max(tile - 2, suit_start),
+            min(tile, suit_start + 6) + 1,
+        ):
+            others = [index for index in range(start, start + 3) if index != tile]
+            if count[others[0]] and count[others[1]]:
+                options.append(CallOption(CallType.CHII, (tile, *others)))
+    if count[tile] >= 2:
+        options.append(CallOption(CallType.PON, (tile,) * 3))
+    if count[tile] == 3 and can_kan:
+        options.append(CallOption(CallType.BIG_MELDED_KAN, (tile,) * 4))
+    return options
+
+
+def find_kan_options(
+    counts: list[int],
+    call_counts: list[tuple[CallType, TileCount]],
+) -> list[CallOption]:
+    """List the concealed and small melded kans that a hand can declare.
+
+    Args:
+        counts (list[int]): Counts of the concealed tiles with the drawn tile.
+        call_counts (list[tuple[CallType, TileCount]]): Calls of the hand.
+
+    Returns:
+        list[CallOption]: Possible kans, concealed ones first.
+
+    """
+    options = [
+        CallOption(CallType.CONCEALED_KAN, (index,) * 4)
+        for index in Tiles.ALL
+        if counts[index] == 4
+    ]
+    options.extend(
+        CallOption(CallType.SMALL_MELDED_KAN, (index,) * 4)
+        for call_type, call_count in call_counts
+        if call_type is CallType.PON
+        and counts[index := call_count.find_earliest_nonzero_index()]
+    )
+    return options
+
+
+class Seat:
+    """State of a player at a table, updated incrementally as the game goes on.
+
+    The drawn tile is held apart from the concealed tiles like in `Hand`, so the
+    concealed tiles only change when a tile other than the drawn one is discarded
+    or a call is made. The hand info shares the concealed count and call counts of
+    the seat, so it never has to be rebuilt, and the waits of the hand are updated
+    only when the concealed tiles change. So are bitmasks of the tiles the hand
+    could call or declare a kan with, which let most turns skip looking for calls
+    and kans.
+
+    Attributes:
+        concealed_count (TileCount): Concealed tiles without the drawn tile.
+        calls (list[Call]): Calls made by the player.
+        hand_info (HandInfo): Hand of the player, sharing concealed_count and the
+            counts of calls.
+        drawn_tile (int | None): Index of the drawn tile, if any.
+        is_drawn_red (bool): Whether the drawn tile is a red five.
+        river (River): Discards of the player and the tiles it cannot ron on.
+        waits_mask (int): Bitmask of tile indices that complete the hand.
+
+    """
+
+    def __init__(self, checker: BaseHandChecker) -> None:
+        """Initialize an empty seat.
+
+        Args:
+            checker (BaseHandChecker): Checker that finds the waits of the hand.
+
+        """
+        self.checker = checker
+        self.concealed_count = TileCount()
+        self.calls: list[Call] = []
+        self.hand_info = HandInfo(self.concealed_count)
+        self.drawn_tile: int | None = None
+        self.is_drawn_red = False
+        self.river = River()
+        self.waits_mask = 0
+        self._held_mask = 0
+        self._pair_mask = 0
+        self._triple_mask = 0
+        self._quad_mask = 0
+        self._chii_mask = 0
+        self._pon_call_mask = 0
+
+    def reset(self, tile_ids: list[int]) -> None:
+        """Start a round with a dealt hand.
+
+        Args:
+            tile_ids (list[int]): 136-tile ids of the dealt tiles.
+
+        """
+        self.concealed_count = TileCount()
+        for tile_id in tile_ids:
+            self.concealed_count[tile_id >> 2] += 1
+            if tile_id in RED_FIVE_IDS136:
+                self.concealed_count.red_mask |= _RED_BITS[tile_id >> 2]
+        self.calls = []
+        self.hand_info = HandInfo(self.concealed_count)
+        self.drawn_tile = None
+        self.is_drawn_red = False
+        self.river = River()
+        self._pon_call_mask = 0
+        self._update_call_masks()
+        self._update_waits()
+
+    @property
+    def is_furiten(self) -> bool:
+        """Whether the player cannot win on its waits by ron."""
+        return self.river.is_furiten(self.waits_mask)
+
+    def to_hand(self) -> Hand:
+        """Create a Hand with the tiles of the seat.
+
+        Returns:
+            Hand: Hand with the concealed tiles, calls and drawn tile.
+
+        """
+        hand = Hand()
+        for index in Tiles.ALL:
+            count = self.concealed_count[index]
+            is_red = bool(self.concealed_count.red_mask & _RED_BITS.get(index, 0))
+            hand.tiles.extend(
+                _to_tile(index, is_red and copy == 0) for copy in range(count)
+            )
+        hand.calls = self.calls[:]
+        if self.drawn_tile is not None:
+            hand.draw_tile(_to_tile(self.drawn_tile, self.is_drawn_red))
+        return hand
+
+    def draw(self, tile_id: int) -> None:
+        """Draw a tile.
+
+        Args:
+            tile_id (int): 136-tile id of the drawn tile.
+
+        """
+        self.drawn_tile = tile_id >> 2
+        self.is_drawn_red = tile_id in RED_FIVE_IDS136
+
+    def discard_options(self) -> list[int]:
+        """List the tiles that can be discarded.
+
+        Returns:
+            list[int]: Distinct tile indices, starting with the drawn tile if any.
+
+        """
+        held_mask = self._held_mask
+        drawn_tile = self.drawn_tile
+        if drawn_tile is not None:
+            held_mask &= ~(1 << drawn_tile)
+        man_tiles, pin_tiles, sou_tiles, honor_tiles = _MASK_TILES
+        options = [
+            *man_tiles[held_mask & _SUIT_MASK],
+            *pin_tiles[held_mask >> 9 & _SUIT_MASK],
+            *sou_tiles[held_mask >> 18 & _SUIT_MASK],
+            *honor_tiles[held_mask >> 27],
+        ]
+        if drawn_tile is not None:
+            options.insert(0, drawn_tile)
+        return options
+
+    def discard(self, tile: int) -> bool:
+        """Discard a tile, preferring the drawn tile and then ordinary fives.
+
+        Args:
+            tile (int): Index of the tile to discard.
+
+        Returns:
+            bool: Whether the discarded tile is a red five.
+
+        Raises:
+            ValueError: If the seat does not hold the tile.
+
+        """
+        if tile == self.drawn_tile:
+            is_red = self.is_drawn_red
+        else:
+            if not self.concealed_count[tile]:
+                raise ValueError
+            drawn_tile = self.drawn_tile
+            self._merge_drawn_tile()
+            is_red = self._remove(tile)
+            self._update_call_masks(
+                (tile,) if drawn_tile is None else (drawn_tile, tile),
+            )
+            self._update_waits()
+
+        self.drawn_tile = None
+        self.is_drawn_red = False
+        self.river.discard(tile)
+        return is_red
+
+    def can_claim(self, tile: int, relation: PlayerRelation) -> bool:
+        """Check cheaply whether a discarded tile might be won on or called.
+
+        Args:
+            tile (int): Index of the discarded tile.
+            relation (PlayerRelation): Relation to the player who discarded it.
+
+        Returns:
+            bool: False if the tile can be neither won on nor called, True if it
+                may be, to be settled by `is_furiten` and `call_options`.
+
+        """
+        mask = self.waits_mask | self._pair_mask
+        if relation is PlayerRelation.PREV:
+            mask |= self._chii_mask
+        return bool(mask >> tile & 1)
+
+    def call_options(
+        self,
+        tile: int,
+        relation: PlayerRelation,
+        can_kan: bool,
+    ) -> list[CallOption]:
+        """List the calls that can be made on a discarded tile.
+
+        Args:
+            tile (int): Index of the discarded tile.
+            relation (PlayerRelation): Relation to the player who discarded it.
+            can_kan (bool): Whether a kan can still be declared.
+
+        Returns:
+            list[CallOption]: Possible chii, pon and big melded kan calls.
+
+        """
+        mask = self._pair_mask
+        if relation is PlayerRelation.PREV:
+            mask |= self._chii_mask
+        if not mask >> tile & 1:
+            return []
+        return find_call_options(self.concealed_count, tile, relation, can_kan)
+
+    def kan_options(self) -> list[CallOption]:
+        """List the concealed and small melded kans that can be declared.
+
+        Returns:
+            list[CallOption]: Possible kans with the concealed and drawn tiles.
+
+        """
+        drawn_mask = 0 if self.drawn_tile is None else 1 << self.drawn_tile
+        if not (
+            self._quad_mask
+            or drawn_mask & self._triple_mask
+            or self._pon_call_mask & (self._held_mask | drawn_mask)
+        ):
+            return []
+        counts = list(self.concealed_count)
+        if self.drawn_tile is not None:
+            counts[self.drawn_tile] += 1
+        return find_kan_options(counts, self.hand_info.call_counts)
+
+    def call(
+        self,
+        option: CallOption,
+        is_red: bool = False,
+        relation: PlayerRelation = PlayerRelation.SELF,
+    ) -> Call:
+        """Make a call, validated by `Call`.
+
+        Args:
+            option (CallOption): Call to make, from `call_options` or
+                `kan_options`.
+            is_red (bool, optional): Whether the called tile is a red five.
+                Defaults to False.
+            relation (PlayerRelation, optional): Relation to the player whose tile
+                is called. Defaults to SELF for kans on the player's own turn.
+
+        Returns:
+            Call: The call made.
+
+        Raises:
+            ValueError: If the call is not valid.
+
+        """
+        self._merge_drawn_tile()
+        if option.call_type is CallType.SMALL_MELDED_KAN:
+            return self._add_to_pon(option.tiles[0])
+
+        if option.call_type is CallType.CONCEALED_KAN:
+            tiles = [_to_tile(index, self._remove(index)) for index in option.tiles]
+        else:
+            tiles = [_to_tile(option.tiles[0], is_red)]
+            tiles.extend(
+                _to_tile(index, self._remove(index)) for index in option.tiles[1:]
+            )
+
+        call = Call(tiles, option.call_type, relation)
+        self.calls.append(call)
+        self.hand_info.call_counts.append(
+            (call.call_type, TileCount.create_from_tiles(call.tiles)),
+        )
+        if call.call_type is CallType.PON:
+            self._pon_call_mask |= 1 << option.tiles[0]
+        self._update_call_masks()
+        # After a chii or pon the hand has 3n+2 tiles, and waits are updated with
+        # the discard that follows.
+        if len(tiles) == 4:
+            self._update_waits()
+        return call
+
+    def _add_to_pon(self, tile: int) -> Call:
+        position = next(
+            position
+            for position, call in enumerate(self.calls)
+            if call.call_type is CallType.PON
+            and TileMapping.tile_to_index(call.tiles[0]) == tile
+        )
+        pon = self.calls[position]
+        call = Call(
+            [*pon.tiles, _to_tile(tile, self._remove(tile))],
+            CallType.SMALL_MELDED_KAN,
+            pon.player_relation,
+        )
+        self.calls[position] = call
+        self.hand_info.call_counts[position] = (
+            call.call_type,
+            TileCount.create_from_tiles(call.tiles),
+        )
+        self._pon_call_mask &= ~(1 << tile)
+        self._update_call_masks()
+        self._update_waits()
+        return call
+
+    def _merge_drawn_tile(self) -> None:
+        if self.drawn_tile is None:
+            return
+        self.concealed_count[self.drawn_tile] += 1
+        if self.is_drawn_red:
+            self.concealed_count.red_mask |= _RED_BITS[self.drawn_tile]
+        self.drawn_tile = None
+        self.is_drawn_red = False
+
+    def _remove(self, tile: int) -> bool:
+        # The red five goes with the last copy of its tile, whose removal also drops
+        # it from the red mask.
+        is_red = self.concealed_count[tile] == 1 and bool(
+            self.concealed_count.red_mask & _RED_BITS.get(tile, 0),
+        )
+        self.concealed_count[tile] -= 1
+        return is_red
+
+    def _update_call_masks(self, tiles: Iterable[int] = Tiles.ALL) -> None:
+        # Only the bits of the tiles whose counts changed are updated.
+        held_mask = self._held_mask
+        pair_mask = self._pair_mask
+        triple_mask = self._triple_mask
+        quad_mask = self._quad_mask
+        for index in tiles:
+            count = self.concealed_count[index]
+            bit = 1 << index
+            held_mask = held_mask | bit if count else held_mask & ~bit
+            pair_mask = pair_mask | bit if count >= 2 else pair_mask & ~bit
+            triple_mask = triple_mask | bit if count >= 3 else triple_mask & ~bit
+            quad_mask = quad_mask | bit if count == 4 else quad_mask & ~bit
+
+        # A suit tile can be called for a chii if two tiles of a sequence with it
+        # are held. Suits are shifted one at a time so sequences do not cross them.
+        chii_mask = 0
+        for start in _SUIT_STARTS[:3]:
+            held = held_mask >> start & _SUIT_MASK
+            sequences = (
+                held << 1 & held << 2 | held >> 1 & held << 1 | held >> 1 & held >> 2
+            )
+            chii_mask |= (sequences & _SUIT_MASK) << start
+        self._held_mask = held_mask
+        self._pair_mask = pair_mask
+        self._triple_mask = triple_mask
+        self._quad_mask = quad_mask
+        self._chii_mask = chii_mask
+
+    def _update_waits(self) -> None:
+        # Hands of 3n+2 tiles without a drawn tile, as after a chii or pon, wait on
+        # nothing until they discard.
+        if self.concealed_count.num_tiles % 3 != 1:
+            self.waits_mask = 0
+            return
+        self.waits_mask = self.checker.calculate_waits(self.hand_info)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import json
+import sys
+from typing import TextIO
+
+
+def serve(stdin: TextIO, stdout: TextIO) -> None:
+    """Answer decisions read line by line until the end of the input.
+
+    This is a minimal bot for `SubprocessAgent`, always choosing the default
+    option, run with `python -m pymj.game.stdio_bot`. Bots in other languages or
+    environments are expected to speak the same JSON lines.
+
+    Args:
+        stdin (TextIO): Stream of decision messages.
+        stdout (TextIO): Stream to write answers to.
+
+    """
+    for line in stdin:
+        message = json.loads(line)
+        stdout.write(json.dumps({"id": message["id"], "answer": 0}) + "\n")
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    serve(sys.stdin, sys.stdout)
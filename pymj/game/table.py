@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+from collections.abc import Generator, Iterator, Sequence
+
+from pymj.enums.call_option import CallOption
+from pymj.enums.call_type import CallType
+from pymj.enums.decision_type import DecisionType
+from pymj.enums.game_result_data import GameResultData
+from pymj.enums.player_relation import PlayerRelation
+from pymj.enums.round_result_data import RoundResultData
+from pymj.game.decision import Decision
+from pymj.game.seat import Seat
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile import Tile
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_mapping import TileMapping
+from pymj.wall.wall import MAX_KANS, Wall
+
+NUM_PLAYERS = 4
+
+# Relations to the discarder of the players after it in turn order.
+_PLAYER_RELATIONS = {
+    1: PlayerRelation.PREV,
+    2: PlayerRelation.ACROSS,
+    3: PlayerRelation.NEXT,
+}
+
+# Options of tsumo and ron decisions, shared by all of them.
+_WIN_OPTIONS = (True, False)
+
+GameGenerator = Generator[Decision, int, GameResultData]
+RoundGenerator = Generator[Decision, int, RoundResultData]
+
+
+class Table:
+    """A table of four players running games as generators of decisions.
+
+    A game is a generator that yields a `Decision` whenever a player has to choose,
+    and expects the index of the chosen option to be sent back. It returns the
+    result of the game when it is over. Driving the generators from outside keeps
+    agents pluggable and lets many tables advance in lockstep, see
+    `pymj.game.runner`. Each table yields one `Decision` object over and over,
+    updated in place for every decision, so a decision is only valid until it is
+    answered.
+
+    Winning hands are judged with the checker only, and players cannot win by
+    ron while furiten; yaku, scores and riichi are not part of the rules played.
+
+    Attributes:
+        checker (BaseHandChecker): Checker that judges the hands.
+        seats (list[Seat]): Seats of the four players.
+        wall (Wall | None): Wall of the current round.
+        dealer (int): Seat of the dealer of the current round.
+
+    """
+
+    def __init__(self, checker: BaseHandChecker | None = None) -> None:
+        """Initialize table.
+
+        Args:
+            checker (BaseHandChecker | None, optional): Checker that judges the
+                hands. Defaults to CombinedHandChecker.
+
+        """
+        self.checker = checker or CombinedHandChecker()
+        self.seats = [Seat(self.checker) for _ in range(NUM_PLAYERS)]
+        self.wall: Wall | None = None
+        self.dealer = 0
+        self._decision = Decision(DecisionType.DISCARD, 0, self, None, [])
+
+    def play_game(self, walls: Iterator[Wall], num_winds: int = 2) -> GameGenerator:
+        """Play a game of east or east and south rounds.
+
+        The dealer keeps dealing after winning, or being tenpai at an exhaustive
+        draw, and otherwise passes the deal to the next seat.
+
+        Args:
+            walls (Iterator[Wall]): Walls for the rounds.
+            num_winds (int, optional): Number of round winds, 1 for an east game
+                and 2 for an east and south game. Defaults to 2.
+
+        Yields:
+            Decision: Decisions for the players to make.
+
+        Returns:
+            GameResultData: Results of the rounds played.
+
+        """
+        rounds = []
+        dealer = 0
+        round_index = 0
+        while round_index < NUM_PLAYERS * num_winds:
+            result = yield from self.play_round(next(walls), dealer)
+            rounds.append(result)
+            if result.winner != dealer and (
+                result.winner is not None or not result.tenpai[dealer]
+            ):
+                dealer = (dealer + 1) % NUM_PLAYERS
+                round_index += 1
+        return GameResultData(rounds)
+
+    def play_round(self, wall: Wall, dealer: int) -> RoundGenerator:
+        """Play a round from the deal until a win or an exhaustive draw.
+
+        Args:
+            wall (Wall): Shuffled wall of the round.
+            dealer (int): Seat of the dealer.
+
+        Yields:
+            Decision: Decisions for the players to make.
+
+        Returns:
+            RoundResultData: Result of the round.
+
+        """
+        self._deal(wall, dealer)
+        player = dealer
+        tile_id: int | None = wall.draw()
+        while True:
+            seat = self.seats[player]
+            if tile_id is not None:
+                seat.draw(tile_id)
+                # Most draws can neither win nor declare a kan, and skip asking.
+                if seat.waits_mask >> (tile_id >> 2) & 1 or seat.kan_options():
+                    result = yield from self._play_draw(player)
+                    if result:
+                        return result
+
+            decision = self._ask(
+                DecisionType.DISCARD,
+                player,
+                seat.drawn_tile,
+                seat.discard_options(),
+            )
+            tile = decision.choose((yield decision))
+            assert isinstance(tile, int)
+            is_red = seat.discard(tile)
+
+            # Likewise, most discards can be neither won on nor called.
+            is_claimed = self._is_claimed(player, tile)
+            if is_claimed:
+                result = yield from self._ask_ron(player, tile, is_red)
+                if result:
+                    return result
+            for offset in range(1, NUM_PLAYERS):
+                self.seats[(player + offset) % NUM_PLAYERS].river.observe(tile)
+
+            call = (
+                (yield from self._ask_calls(player, tile, is_red))
+                if is_claimed
+                else None
+            )
+            if call:
+                player, tile_id = call
+            elif wall.num_remaining:
+                player = (player + 1) % NUM_PLAYERS
+                tile_id = wall.draw()
+            else:
+                return RoundResultData(
+                    dealer=dealer,
+                    tenpai=[seat.waits_mask != 0 for seat in self.seats],
+                )
+
+    def safe_tiles(self, player: int) -> int:
+        """Find the tiles that cannot deal into a player (genbutsu).
+
+        Args:
+            player (int): Seat of the player.
+
+        Returns:
+            int: Bitmask with bit i set if tile index i is safe against the player.
+
+        """
+        return self.seats[player].river.safe_mask
+
+    def _deal(self, wall: Wall, dealer: int) -> None:
+        self.wall = wall
+        self.dealer = dealer
+        for offset, tile_ids in enumerate(wall.deal_ids().tolist()):
+            self.seats[(dealer + offset) % NUM_PLAYERS].reset(tile_ids)
+
+    def _play_draw(
+        self,
+        player: int,
+    ) -> Generator[Decision, int, RoundResultData | None]:
+        seat = self.seats[player]
+        wall = self._current_wall()
+        while True:
+            tile = seat.drawn_tile
+            if tile is not None and seat.waits_mask >> tile & 1:
+                decision = self._ask(DecisionType.TSUMO, player, tile, _WIN_OPTIONS)
+                if decision.choose((yield decision)):
+                    return self._win(player, None, tile, seat.is_drawn_red)
+
+            if wall.num_kans == MAX_KANS or not wall.num_remaining:
+                return None
+            options = seat.kan_options()
+            if not options:
+                return None
+            decision = self._ask(DecisionType.KAN, player, tile, [None, *options])
+            option = decision.choose((yield decision))
+            if not isinstance(option, CallOption):
+                return None
+            seat.call(option)
+            seat.draw(wall.draw_replacement())
+
+    def _ask_ron(
+        self,
+        discarder: int,
+        tile: int,
+        is_red: bool,
+    ) -> Generator[Decision, int, RoundResultData | None]:
+        for offset in range(1, NUM_PLAYERS):
+            player = (discarder + offset) % NUM_PLAYERS
+            seat = self.seats[player]
+            if seat.waits_mask >> tile & 1 and not seat.is_furiten:
+                decision = self._ask(DecisionType.RON, player, tile, _WIN_OPTIONS)
+                if decision.choose((yield decision)):
+                    return self._win(player, discarder, tile, is_red)
+        return None
+
+    def _ask_calls(
+        self,
+        discarder: int,
+        tile: int,
+        is_red: bool,
+    ) -> Generator[Decision, int, tuple[int, int | None] | None]:
+        wall = self._current_wall()
+        if not wall.num_remaining:
+            return None
+
+        # Pon and kan take precedence over chii, so the next player, who alone may
+        # chii, is asked last.
+        can_kan = wall.num_kans < MAX_KANS
+        for offset in (2, 3, 1):
+            player = (discarder + offset) % NUM_PLAYERS
+            relation = _PLAYER_RELATIONS[offset]
+            options = self.seats[player].call_options(tile, relation, can_kan)
+            if not options:
+                continue
+            decision = self._ask(DecisionType.CALL, player, tile, [None, *options])
+            option = decision.choose((yield decision))
+            if isinstance(option, CallOption):
+                self.seats[player].call(option, is_red, relation)
+                # The caller draws a replacement tile after a kan, and otherwise
+                # discards without drawing.
+                if option.call_type is CallType.BIG_MELDED_KAN:
+                    return player, wall.draw_replacement()
+                return player, None
+        return None
+
+    def _ask(
+        self,
+        decision_type: DecisionType,
+        player: int,
+        tile: int | None,
+        options: Sequence[int | CallOption | bool | None],
+    ) -> Decision:
+        decision = self._decision
+        decision.decision_type = decision_type
+        decision.player = player
+        decision.tile = tile
+        decision.options = options
+        return decision
+
+    def _is_claimed(self, discarder: int, tile: int) -> bool:
+        for offset, relation in _PLAYER_RELATIONS.items():
+            seat = self.seats[(discarder + offset) % NUM_PLAYERS]
+            if seat.can_claim(tile, relation):
+                return True
+        return False
+
+    def _win(
+        self,
+        player: int,
+        loser: int | None,
+        tile: int,
+        is_red: bool,
+    ) -> RoundResultData:
+        seat = self.seats[player]
+        agari_tile = TileMapping.index_to_tile(tile)
+        if is_red:
+            agari_tile = Tile(agari_tile.tile_type, 5, is_red=True)
+        hand_info = HandInfo(
+            concealed_count=TileCount(
+                list(seat.concealed_count),
+                seat.concealed_count.red_mask,
+            ),
+            call_counts=seat.hand_info.call_counts[:],
+            agari_tile=agari_tile,
+            is_tsumo=loser is None,
+        )
+        return RoundResultData(
+            dealer=self.dealer,
+            winner=player,
+            loser=loser,
+            hand_info=hand_info,
+        )
+
+    def _current_wall(self) -> Wall:
+        if self.wall is None:
+            raise ValueError
+        return self.wall
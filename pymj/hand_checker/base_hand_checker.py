@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from copy import deepcopy
 
 from pymj.enums.efficiency_data import EfficiencyData
@@ -45,6 +46,21 @@ class BaseHandChecker(ABC):
 
         """
 
+    def iterate_divisions(self, hand_info: HandInfo) -> Iterator[Division]:
+        """Generate the tile divisions of a hand one at a time.
+
+        Checkers that search for divisions override this to stop the search when
+        the caller stops iterating.
+
+        Args:
+            hand_info (HandInfo): HandInfo object to calculate.
+
+        Yields:
+            Division: Next possible tile combination forming valid groups.
+
+        """
+        yield from self.calculate_divisions(hand_info)
+
     def check_agari(self, hand_info: HandInfo) -> bool:
         """Check if current hand forms a valid winning hand.
 
@@ -57,6 +73,38 @@ class BaseHandChecker(ABC):
         """
         return self.calculate_shanten(hand_info) == -1
 
+    def calculate_waits(
+        self,
+        hand_info: HandInfo,
+        candidates: Iterable[int] = Tiles.ALL,
+    ) -> int:
+        """Calculate the tiles that complete a hand of 3n+1 tiles.
+
+        Args:
+            hand_info (HandInfo): Hand state with 3n+1 concealed tiles and no
+                winning tile.
+            candidates (Iterable[int], optional): Tile indices to check, e.g. ones
+                passing cheap necessary conditions. Defaults to all tiles.
+
+        Returns:
+            int: Bitmask with bit i set if tile index i completes the hand, to be
+                compared with the masks of `pymj.game.river.River`.
+
+        Raises:
+            ValueError: If hand tile count is not 3n+1 or winning tile is given.
+
+        """
+        if hand_info.concealed_count.num_tiles % 3 != 1 or hand_info.agari_tile:
+            raise ValueError
+
+        waits_mask = 0
+        for tile in candidates:
+            hand_info.agari_tile = TileMapping.index_to_tile(tile)
+            if self.check_agari(hand_info):
+                waits_mask |= 1 << tile
+        hand_info.agari_tile = None
+        return waits_mask
+
     def calculate_efficiency(self, hand_info: HandInfo) -> list[EfficiencyData]:
         """Calculate discard efficiency for each tile in the hand.
 
@@ -101,6 +149,26 @@ class BaseHandChecker(ABC):
         efficiency.sort(key=lambda x: (-x.num_ukeire, x.discard_tile))
         return efficiency
 
+    def calculate_ukeire(self, hand_info: HandInfo) -> tuple[list[int], int]:
+        """Calculate tiles that reduce the shanten number when drawn.
+
+        Args:
+            hand_info (HandInfo): Hand state with 3n+1 concealed tiles and no
+                winning tile.
+
+        Returns:
+            tuple[list[int], int]: IDs of the useful tiles and their total count
+                that remains unseen by this hand.
+
+        Raises:
+            ValueError: If hand tile count is not 3n+1 or winning tile is given.
+
+        """
+        if hand_info.concealed_count.num_tiles % 3 != 1 or hand_info.agari_tile:
+            raise ValueError
+
+        return self._calculate_ukeire(hand_info, self.calculate_shanten(hand_info))
+
     def _calculate_ukeire(
         self,
         hand_info: HandInfo,
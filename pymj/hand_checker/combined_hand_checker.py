@@ -0,0 +1,119 @@
+from collections.abc import Iterable, Iterator
+
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.hand_checker.normal_form_checker import NormalFormChecker
+from pymj.hand_checker.seven_pair_checker import SevenPairChecker
+from pymj.hand_checker.thirteen_orphan_checker import ThirteenOrphanChecker
+from pymj.tiles.division import Division
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile_constants import Tiles
+
+
+class CombinedHandChecker(BaseHandChecker):
+    """Check hands against every winning form at once.
+
+    The shanten number of a hand is the minimum over the normal form, seven pairs
+    and thirteen orphans, and divisions are collected from every form the hand
+    completes.
+
+    Attributes:
+        checkers (list[BaseHandChecker]): Checkers of the individual hand forms.
+
+    """
+
+    def __init__(self, checkers: list[BaseHandChecker] | None = None) -> None:
+        """Initialize combined hand checker.
+
+        Args:
+            checkers (list[BaseHandChecker] | None, optional): Checkers to combine.
+                Defaults to the normal form, seven pairs and thirteen orphans
+                checkers.
+
+        """
+        self.checkers: list[BaseHandChecker] = (
+            checkers
+            if checkers
+            else [NormalFormChecker(), SevenPairChecker(), ThirteenOrphanChecker()]
+        )
+
+    def calculate_shanten(self, hand_info: HandInfo) -> int:
+        """Calculate the minimum shanten number over all hand forms.
+
+        Args:
+            hand_info (HandInfo): HandInfo object to calculate.
+
+        Returns:
+            int: Shanten number, where 0 means tenpai, -1 means winning hand.
+
+        """
+        return min(checker.calculate_shanten(hand_info) for checker in self.checkers)
+
+    def check_agari(self, hand_info: HandInfo) -> bool:
+        """Check if the hand completes any hand form.
+
+        Args:
+            hand_info (HandInfo): HandInfo object to calculate.
+
+        Returns:
+            bool: True if hand is complete, False otherwise.
+
+        """
+        return any(checker.check_agari(hand_info) for checker in self.checkers)
+
+    def calculate_waits(
+        self,
+        hand_info: HandInfo,
+        candidates: Iterable[int] = Tiles.ALL,
+    ) -> int:
+        """Calculate the tiles that complete a hand of 3n+1 tiles in any hand form.
+
+        Args:
+            hand_info (HandInfo): Hand state with 3n+1 concealed tiles and no
+                winning tile.
+            candidates (Iterable[int], optional): Tile indices to check. Defaults
+                to all tiles.
+
+        Returns:
+            int: Bitmask with bit i set if tile index i completes any hand form.
+
+        Raises:
+            ValueError: If hand tile count is not 3n+1 or winning tile is given.
+
+        """
+        candidates = tuple(candidates)
+        waits_mask = 0
+        for checker in self.checkers:
+            waits_mask |= checker.calculate_waits(hand_info, candidates)
+        return waits_mask
+
+    def calculate_divisions(self, hand_info: HandInfo) -> list[Division]:
+        """Calculate divisions of every hand form that the hand completes.
+
+        Args:
+            hand_info (HandInfo): HandInfo object to calculate.
+
+        Returns:
+            list[Division]: Divisions of all completed hand forms.
+
+        Raises:
+            ValueError: When hand cannot form any winning pattern.
+
+        """
+        divisions = list(self.iterate_divisions(hand_info))
+        if not divisions:
+            raise ValueError
+        return divisions
+
+    def iterate_divisions(self, hand_info: HandInfo) -> Iterator[Division]:
+        """Generate divisions of every hand form that the hand completes.
+
+        Args:
+            hand_info (HandInfo): HandInfo object to calculate.
+
+        Yields:
+            Division: Next division, form by form in the order of the checkers.
+
+        """
+        for checker in self.checkers:
+            if checker.check_agari(hand_info):
+                yield from checker.iterate_divisions(hand_info)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+from pymj.enums.search_stats_data import SearchStatsData
+from pymj.hand_checker.normal_form_checker import NormalFormChecker
+from pymj.tiles.hand_info import HandInfo
+
+
+class InstrumentedNormalFormChecker(NormalFormChecker):
+    """Normal form checker recording statistics of its shanten searches.
+
+    The search methods of `NormalFormChecker` are wrapped to count their calls,
+    so NormalFormChecker itself pays nothing and statistics are opt-in by using
+    this class instead, e.g. as a checker of `CombinedHandChecker`. The results
+    are the same as those of NormalFormChecker.
+
+    Attributes:
+        callback (Callable[[HandInfo, SearchStatsData], None] | None): Function
+            called with the hand and the statistics after each search.
+        last_stats (SearchStatsData | None): Statistics of the last search.
+
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[HandInfo, SearchStatsData], None] | None = None,
+    ) -> None:
+        """Initialize instrumented normal form checker.
+
+        Args:
+            callback (Callable[[HandInfo, SearchStatsData], None] | None, optional):
+                Function called with the hand and the statistics after each
+                search. Defaults to None.
+
+        """
+        super().__init__()
+        self.callback = callback
+        self.last_stats: SearchStatsData | None = None
+        self._stats = SearchStatsData()
+        self._depth = 0
+
+    def calculate_shanten(self, hand_info: HandInfo) -> int:
+        """Calculate shanten number and record statistics of the search.
+
+        Args:
+            hand_info: Contains information about tiles in hand and called tiles.
+
+        Returns:
+            int: Minimum shanten number for the hand.
+
+        Raises:
+            ValueError: If number of tiles in hand is invalid.
+
+        """
+        return self.calculate_shanten_with_stats(hand_info)[0]
+
+    def calculate_shanten_with_stats(
+        self,
+        hand_info: HandInfo,
+    ) -> tuple[int, SearchStatsData]:
+        """Calculate shanten number along with statistics of the search.
+
+        Args:
+            hand_info (HandInfo): Contains information about tiles in hand and
+                called tiles.
+
+        Returns:
+            tuple[int, SearchStatsData]: Minimum shanten number for the hand, and
+                statistics of the search.
+
+        Raises:
+            ValueError: If number of tiles in hand is invalid.
+
+        """
+        self._stats = SearchStatsData()
+        self._depth = 0
+        start = time.perf_counter_ns()
+        shanten = super().calculate_shanten(hand_info)
+        self._stats.elapsed_ns = time.perf_counter_ns() - start
+        self._stats.shanten = shanten
+
+        self.last_stats = self._stats
+        if self.callback is not None:
+            self.callback(hand_info, self._stats)
+        return shanten, self._stats
+
+    def _calculate_best_shanten(
+        self,
+        num_complete_sets: int,
+        is_head_fixed: bool = True,
+        index: int = 0,
+    ) -> None:
+        stats = self._stats
+        stats.num_set_nodes += 1
+        if self._depth == 0 and is_head_fixed:
+            stats.num_heads += 1
+        if index == 34 or self._tile_count.find_earliest_nonzero_index(index) == 34:
+            # A leaf either takes partial sets from index 0 or is pruned.
+            stats.num_pruned += 1
+
+        self._depth += 1
+        stats.max_depth = max(stats.max_depth, self._depth)
+        super()._calculate_best_shanten(num_complete_sets, is_head_fixed, index)
+        self._depth -= 1
+
+    def _calculate_best_shanten_step2(
+        self,
+        num_complete_sets: int,
+        num_partial_sets: int,
+        is_head_fixed: bool,
+        index: int = 0,
+    ) -> None:
+        stats = self._stats
+        stats.num_partial_nodes += 1
+        if index == 0 and num_partial_sets == 0:
+            # Only leaves of complete sets start from index 0 without partial sets.
+            stats.num_pruned -= 1
+
+        self._depth += 1
+        stats.max_depth = max(stats.max_depth, self._depth)
+        super()._calculate_best_shanten_step2(
+            num_complete_sets,
+            num_partial_sets,
+            is_head_fixed,
+            index,
+        )
+        self._depth -= 1
@@ -1,9 +1,11 @@
-from copy import deepcopy
+from collections.abc import Iterable, Iterator
+from copy import copy, deepcopy
 
 from pymj.enums.division_part_state import DivisionPartState
 from pymj.enums.division_part_type import DivisionPartType
 from pymj.enums.wait_type import WaitType
 from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.tables.agari_table import find_complete_waits, is_complete_hand
 from pymj.tiles.division import Division
 from pymj.tiles.division_part import DivisionPart
 from pymj.tiles.hand_info import HandInfo
@@ -68,6 +70,67 @@ class NormalFormChecker(BaseHandChecker):
         self._calculate_best_shanten(num_calls, is_head_fixed=False)
         return self._best_shanten
 
+    def check_agari(self, hand_info: HandInfo) -> bool:
+        """Check if the hand completes the normal form with its winning tile.
+
+        Unlike calculating the shanten number, this only looks up each suit and
+        the honors in the agari table, see `pymj.tables.agari_table`.
+
+        Args:
+            hand_info (HandInfo): HandInfo object to calculate.
+
+        Returns:
+            bool: True if hand is complete, False otherwise.
+
+        Raises:
+            ValueError: If number of tiles in hand is invalid.
+
+        """
+        num_calls = len(hand_info.call_counts)
+        num_tiles = hand_info.concealed_count.num_tiles
+        if num_tiles % 3 != 1 or num_tiles // 3 + num_calls != 4:
+            raise ValueError
+        if hand_info.agari_tile is None:
+            return False
+
+        counts = list(hand_info.concealed_count)
+        counts[TileMapping.tile_to_index(hand_info.agari_tile)] += 1
+        return is_complete_hand(counts)
+
+    def calculate_waits(
+        self,
+        hand_info: HandInfo,
+        candidates: Iterable[int] = Tiles.ALL,
+    ) -> int:
+        """Calculate the tiles that complete a hand of 3n+1 tiles in the normal form.
+
+        Candidates are looked up in the agari table by `find_complete_waits`,
+        without building a winning tile or a hand per candidate.
+
+        Args:
+            hand_info (HandInfo): Hand state with 3n+1 concealed tiles and no
+                winning tile.
+            candidates (Iterable[int], optional): Tile indices to check. Defaults
+                to all tiles.
+
+        Returns:
+            int: Bitmask with bit i set if tile index i completes the hand.
+
+        Raises:
+            ValueError: If number of tiles in hand is invalid or winning tile is
+                given.
+
+        """
+        num_tiles = hand_info.concealed_count.num_tiles
+        if (
+            num_tiles % 3 != 1
+            or num_tiles // 3 + len(hand_info.call_counts) != 4
+            or hand_info.agari_tile
+        ):
+            raise ValueError
+
+        return find_complete_waits(list(hand_info.concealed_count), candidates)
+
     def _calculate_best_shanten(
         self,
         num_complete_sets: int,
@@ -222,6 +285,26 @@ class NormalFormChecker(BaseHandChecker):
         Raises:
             ValueError: When hand cannot form normal agari pattern.
 
+        """
+        return list(self.iterate_divisions(hand_info))
+
+    def iterate_divisions(self, hand_info: HandInfo) -> Iterator[Division]:
+        """Generate the hand divisions one at a time as the search finds them.
+
+        The search state lives in the checker, so the checker must not be used
+        for anything else until the iteration ends. Divisions share the parts
+        they have in common, other than the part completed by the winning tile.
+
+        Args:
+            hand_info (HandInfo): Complete hand information including the winning
+                tile.
+
+        Yields:
+            Division: Next possible hand division.
+
+        Raises:
+            ValueError: When hand cannot form normal agari pattern.
+
         """
         if not hand_info.agari_tile or not self.check_agari(hand_info):
             raise ValueError
@@ -235,48 +318,43 @@ class NormalFormChecker(BaseHandChecker):
             for call_type, tile_count in hand_info.call_counts
         ]
 
-        divisions: list[Division] = []
-        for concealed_parts in self._calculate_concealed_parts():
-            divisions.extend(
-                NormalFormChecker._calculate_divisions_from_division_parts(
-                    concealed_parts,
-                    call_parts,
-                    agari_tile_index,
-                    hand_info.is_tsumo,
-                ),
+        for concealed_parts in self._iterate_concealed_parts():
+            yield from NormalFormChecker.create_divisions(
+                concealed_parts,
+                call_parts,
+                agari_tile_index,
+                hand_info.is_tsumo,
             )
 
-        return divisions
-
-    def _calculate_concealed_parts(self) -> list[list[DivisionPart]]:
-        concealed_parts: list[list[DivisionPart]] = []
+    def _iterate_concealed_parts(self) -> Iterator[list[DivisionPart]]:
         for head in Tiles.ALL:
             if self._tile_count[head] < 2:
                 continue
             self._tile_count[head] -= 2
             head_part = DivisionPart.create_head(head, DivisionPartState.CONCEALED)
             self._parts.append(head_part)
-            self._find_bodies(concealed_parts)
+            yield from self._iterate_bodies()
             self._parts.pop()
             self._tile_count[head] += 2
-        return concealed_parts
 
-    def _find_bodies(self, parts: list[list[DivisionPart]], index: int = 0) -> None:
+    def _iterate_bodies(self, index: int = 0) -> Iterator[list[DivisionPart]]:
         index = (
             34 if index == 34 else self._tile_count.find_earliest_nonzero_index(index)
         )
         if index == 34:
-            parts.append(deepcopy(self._parts))
+            yield self._parts[:]
             return
 
         for num_triplet in range(2):
-            if self._can_make_triplet(index, num_triplet) and self._can_make_sequence(
-                index,
-                num_sequence := self._tile_count[index] - num_triplet * 3,
+            num_sequence = self._tile_count[index] - num_triplet * 3
+            if self._can_make_triplet(index, num_triplet) and (
+                num_sequence == 0 or self._can_make_sequence(index, num_sequence)
             ):
+                # Triplets of 8, 9 and honors have no following tiles to update.
+                sequence_tiles = (index + 1, index + 2) if num_sequence else ()
                 self._tile_count[index] = 0
-                self._tile_count[index + 1] -= num_sequence
-                self._tile_count[index + 2] -= num_sequence
+                for tile in sequence_tiles:
+                    self._tile_count[tile] -= num_sequence
                 for _ in range(num_triplet):
                     self._parts.append(
                         DivisionPart.create_triple(index, DivisionPartState.CONCEALED),
@@ -288,26 +366,45 @@ class NormalFormChecker(BaseHandChecker):
                             DivisionPartState.CONCEALED,
                         ),
                     )
-                self._find_bodies(parts, index + 1)
+                yield from self._iterate_bodies(index + 1)
                 for _ in range(num_triplet + num_sequence):
                     self._parts.pop()
                 self._tile_count[index] = 3 * num_triplet + num_sequence
-                self._tile_count[index + 1] += num_sequence
-                self._tile_count[index + 2] += num_sequence
+                for tile in sequence_tiles:
+                    self._tile_count[tile] += num_sequence
 
     @staticmethod
-    def _calculate_divisions_from_division_parts(
+    def create_divisions(
         concealed_parts: list[DivisionPart],
         call_parts: list[DivisionPart],
         agari_tile_index: int,
         is_tsumo: bool,
     ) -> list[Division]:
+        """Create the divisions of complete concealed parts for a winning tile.
+
+        A division is created for each concealed part holding the winning tile,
+        with that part completed by the winning tile.
+
+        Args:
+            concealed_parts (list[DivisionPart]): Head and bodies of the concealed
+                tiles including the winning tile, all concealed.
+            call_parts (list[DivisionPart]): Parts of the calls.
+            agari_tile_index (int): Index of the winning tile.
+            is_tsumo (bool): Whether the winning tile was self-drawn.
+
+        Returns:
+            list[Division]: Divisions by the part completed by the winning tile.
+
+        """
         divisions = []
         for idx, concealed_part in enumerate(concealed_parts):
             if concealed_part.tile_count[agari_tile_index] == 0:
                 continue
 
-            temp_concealed_parts = deepcopy(concealed_parts)
+            # Only the part completed by the winning tile changes, so the other
+            # parts are shared between divisions like the call parts.
+            temp_concealed_parts = concealed_parts[:]
+            temp_concealed_parts[idx] = copy(concealed_part)
             temp_concealed_parts[idx].state = (
                 DivisionPartState.CONCEALED if is_tsumo else DivisionPartState.RON
             )
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from pymj.enums.division_part_state import DivisionPartState
 from pymj.enums.wait_type import WaitType
 from pymj.hand_checker.base_hand_checker import BaseHandChecker
@@ -64,3 +66,38 @@ class SevenPairChecker(BaseHandChecker):
         num_pairs = sum(1 for num_tile in real_tile_count if num_tile >= 2)
         num_kinds = sum(1 for num_tile in real_tile_count if num_tile >= 1)
         return 6 - num_pairs + max(7 - num_kinds, 0)
+
+    def calculate_waits(
+        self,
+        hand_info: HandInfo,
+        candidates: Iterable[int] = Tiles.ALL,
+    ) -> int:
+        """Calculate the tiles that complete a hand of 3n+1 tiles as seven pairs.
+
+        A hand of six distinct pairs and a single tile waits on the single tile,
+        and any other hand waits on nothing.
+
+        Args:
+            hand_info (HandInfo): Hand state with 3n+1 concealed tiles and no
+                winning tile.
+            candidates (Iterable[int], optional): Tile indices to check. Defaults
+                to all tiles.
+
+        Returns:
+            int: Bitmask with bit i set if tile index i completes the hand.
+
+        Raises:
+            ValueError: If hand tile count is not 3n+1 or winning tile is given.
+
+        """
+        num_tiles = hand_info.concealed_count.num_tiles
+        if num_tiles % 3 != 1 or hand_info.agari_tile:
+            raise ValueError
+        if num_tiles != 13:
+            return 0
+
+        counts = list(hand_info.concealed_count)
+        if counts.count(2) != 6 or counts.count(1) != 1:
+            return 0
+        wait = counts.index(1)
+        return 1 << wait if wait in set(candidates) else 0
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from pymj.enums.division_part_state import DivisionPartState
 from pymj.enums.wait_type import WaitType
 from pymj.hand_checker.base_hand_checker import BaseHandChecker
@@ -80,3 +82,49 @@ class ThirteenOrphanChecker(BaseHandChecker):
         )
 
         return 13 - num_orphan_kinds - int(is_orphan_pair_exist)
+
+    def calculate_waits(
+        self,
+        hand_info: HandInfo,
+        candidates: Iterable[int] = Tiles.ALL,
+    ) -> int:
+        """Calculate the tiles that complete a hand of 3n+1 tiles as thirteen orphans.
+
+        A hand of the thirteen terminals and honors waits on all of them, and one
+        with a pair of them waits on the missing one.
+
+        Args:
+            hand_info (HandInfo): Hand state with 3n+1 concealed tiles and no
+                winning tile.
+            candidates (Iterable[int], optional): Tile indices to check. Defaults
+                to all tiles.
+
+        Returns:
+            int: Bitmask with bit i set if tile index i completes the hand.
+
+        Raises:
+            ValueError: If hand tile count is not 3n+1 or winning tile is given.
+
+        """
+        num_tiles = hand_info.concealed_count.num_tiles
+        if num_tiles % 3 != 1 or hand_info.agari_tile:
+            raise ValueError
+        if num_tiles != 13:
+            return 0
+
+        orphan_counts = [
+            hand_info.concealed_count[tile] for tile in Tiles.TERMINALS_AND_HONORS
+        ]
+        if sum(orphan_counts) != 13:
+            return 0
+        if orphan_counts.count(1) == 13:
+            waits = set(Tiles.TERMINALS_AND_HONORS)
+        elif orphan_counts.count(2) == 1 and orphan_counts.count(0) == 1:
+            waits = {Tiles.TERMINALS_AND_HONORS[orphan_counts.index(0)]}
+        else:
+            return 0
+
+        waits_mask = 0
+        for tile in waits.intersection(candidates):
+            waits_mask |= 1 << tile
+        return waits_mask
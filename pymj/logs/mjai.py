@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, ClassVar
+
+from pymj.enums.call_type import CallType
+from pymj.enums.player_relation import PlayerRelation
+from pymj.enums.tile_type import TileType
+from pymj.tiles.call import Call
+from pymj.tiles.hand import Hand
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile import Tile
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_mapping import TileMapping
+
+_MJAI_HONORS = {
+    "E": Tile(TileType.WIND, 1),
+    "S": Tile(TileType.WIND, 2),
+    "W": Tile(TileType.WIND, 3),
+    "N": Tile(TileType.WIND, 4),
+    "P": Tile(TileType.DRAGON, 1),
+    "F": Tile(TileType.DRAGON, 2),
+    "C": Tile(TileType.DRAGON, 3),
+}
+_MJAI_SUITS = {"m": TileType.MAN, "p": TileType.PIN, "s": TileType.SOU}
+_PLAYER_RELATIONS = {
+    1: PlayerRelation.NEXT,
+    2: PlayerRelation.ACROSS,
+    3: PlayerRelation.PREV,
+}
+
+
+def _build_tile_map() -> dict[str, Tile]:
+    tile_map = dict(_MJAI_HONORS)
+    for suit_char, tile_type in _MJAI_SUITS.items():
+        for value in range(1, 10):
+            tile_map[f"{value}{suit_char}"] = Tile(tile_type, value)
+        tile_map[f"5{suit_char}r"] = Tile(tile_type, 5, is_red=True)
+    return tile_map
+
+
+class MjaiAdapter:
+    """Track the hands of four players from a stream of mjai protocol events.
+
+    Each event updates the `Hand` of the acting player together with incrementally
+    maintained tile counts, so that a `HandInfo` snapshot can be produced on demand
+    without recounting the hand. Snapshots are never built unless requested.
+
+    Tiles hidden from the observer (mjai "?") are tracked only by number, which
+    allows the adapter to follow opponents' calls and discards from a bot's
+    point of view.
+
+    Attributes:
+        TILE_MAP (dict[str, Tile]): Mapping from mjai tile names to Tile objects.
+        UNKNOWN_TILE (str): The mjai name of a tile hidden from the observer.
+        hands (list[Hand]): Hands of the four players, indexed by seat.
+
+    """
+
+    TILE_MAP: ClassVar[dict[str, Tile]] = _build_tile_map()
+    UNKNOWN_TILE: ClassVar[str] = "?"
+
+    def __init__(self) -> None:
+        """Initialize an adapter with four empty hands."""
+        self.hands: list[Hand] = []
+        self._concealed_counts: list[TileCount] = []
+        self._call_counts: list[list[tuple[CallType, TileCount]]] = []
+        self._num_unknown_tiles: list[int] = []
+        self._handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            "start_kyoku": self._on_start_kyoku,
+            "tsumo": self._on_tsumo,
+            "dahai": self._on_dahai,
+            "chi": self._on_chi,
+            "pon": self._on_pon,
+            "daiminkan": self._on_daiminkan,
+            "ankan": self._on_ankan,
+            "kakan": self._on_kakan,
+        }
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the hands of all players."""
+        self.hands = [Hand() for _ in range(4)]
+        self._concealed_counts = [TileCount() for _ in range(4)]
+        self._call_counts = [[] for _ in range(4)]
+        self._num_unknown_tiles = [0] * 4
+
+    @staticmethod
+    def parse_tile(tile_str: str) -> Tile:
+        """Parse a tile written in mjai notation.
+
+        Args:
+            tile_str (str): Tile name such as '1m', '5pr', 'E' or 'C'.
+
+        Returns:
+            Tile: Parsed Tile object.
+
+        Raises:
+            ValueError: If the tile name is not a valid mjai tile.
+
+        """
+        try:
+            return MjaiAdapter.TILE_MAP[tile_str]
+        except KeyError:
+            raise ValueError from None
+
+    @staticmethod
+    def read_events(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+        """Decode mjai events from JSON lines, skipping blank lines.
+
+        Args:
+            lines (Iterable[str]): JSON lines, such as an open file or sys.stdin.
+
+        Yields:
+            dict[str, Any]: Decoded mjai event.
+
+        """
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+
+    def consume(self, lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+        """Apply mjai events from JSON lines and yield each of them once applied.
+
+        Args:
+            lines (Iterable[str]): JSON lines, such as an open file or sys.stdin.
+
+        Yields:
+            dict[str, Any]: The event that has just been applied.
+
+        """
+        for event in MjaiAdapter.read_events(lines):
+            self.feed(event)
+            yield event
+
+    def feed(self, event: dict[str, Any]) -> None:
+        """Apply a single mjai event to the tracked hands.
+
+        Events that do not change any hand (e.g. 'reach', 'dora', 'hora') are
+        ignored.
+
+        Args:
+            event (dict[str, Any]): Decoded mjai event.
+
+        Raises:
+            ValueError: If the event is inconsistent with the tracked hands.
+
+        """
+        handler = self._handlers.get(event["type"])
+        if handler is not None:
+            handler(event)
+
+    def hand_info(self, actor: int, is_tsumo: bool = False) -> HandInfo:
+        """Create a snapshot of a player's hand for the hand checkers.
+
+        The drawn tile, if any, becomes the agari tile of the snapshot as in
+        `HandInfo.create_from_hand`. Tiles hidden from the observer are omitted.
+
+        Args:
+            actor (int): Seat of the player.
+            is_tsumo (bool, optional): Whether the snapshot represents a self-drawn
+                win. Defaults to False.
+
+        Returns:
+            HandInfo: Snapshot of the player's hand.
+
+        """
+        concealed_count = self._concealed_counts[actor]
+        return HandInfo(
+            concealed_count=TileCount(list(concealed_count), concealed_count.red_mask),
+            call_counts=list(self._call_counts[actor]),
+            agari_tile=self.hands[actor].drawn_tile,
+            is_tsumo=is_tsumo,
+        )
+
+    def _on_start_kyoku(self, event: dict[str, Any]) -> None:
+        self.reset()
+        for actor, tehai in enumerate(event["tehais"]):
+            for tile_str in tehai:
+                self._add_tile(actor, tile_str)
+
+    def _on_tsumo(self, event: dict[str, Any]) -> None:
+        actor = event["actor"]
+        if event["pai"] == MjaiAdapter.UNKNOWN_TILE:
+            self._num_unknown_tiles[actor] += 1
+        else:
+            self.hands[actor].draw_tile(MjaiAdapter.parse_tile(event["pai"]))
+
+    def _on_dahai(self, event: dict[str, Any]) -> None:
+        actor = event["actor"]
+        hand = self.hands[actor]
+        tile = MjaiAdapter.parse_tile(event["pai"])
+        if event.get("tsumogiri", False) and hand.drawn_tile == tile:
+            hand.discard_tile()
+            return
+
+        self._append_drawn_tile(actor)
+        self._remove_tile(actor, tile)
+
+    def _on_chi(self, event: dict[str, Any]) -> None:
+        self._add_call(event, CallType.CHII)
+
+    def _on_pon(self, event: dict[str, Any]) -> None:
+        self._add_call(event, CallType.PON)
+
+    def _on_daiminkan(self, event: dict[str, Any]) -> None:
+        self._add_call(event, CallType.BIG_MELDED_KAN)
+
+    def _on_ankan(self, event: dict[str, Any]) -> None:
+        actor = event["actor"]
+        self._append_drawn_tile(actor)
+        tiles = [MjaiAdapter.parse_tile(tile_str) for tile_str in event["consumed"]]
+        for tile in tiles:
+            self._remove_tile(actor, tile)
+        self._append_call(actor, Call(tiles, CallType.CONCEALED_KAN))
+
+    def _on_kakan(self, event: dict[str, Any]) -> None:
+        actor = event["actor"]
+        tile = MjaiAdapter.parse_tile(event["pai"])
+        self._append_drawn_tile(actor)
+        self._remove_tile(actor, tile)
+
+        hand = self.hands[actor]
+        for position, call in enumerate(hand.calls):
+            if call.call_type is CallType.PON and call.tiles[0] == tile:
+                new_call = Call(
+                    [*call.tiles, tile],
+                    CallType.SMALL_MELDED_KAN,
+                    call.player_relation,
+                )
+                hand.calls[position] = new_call
+                self._call_counts[actor][position] = (
+                    new_call.call_type,
+                    TileCount.create_from_tiles(new_call.tiles),
+                )
+                return
+        raise ValueError
+
+    def _add_call(self, event: dict[str, Any], call_type: CallType) -> None:
+        actor = event["actor"]
+        tiles = [MjaiAdapter.parse_tile(tile_str) for tile_str in event["consumed"]]
+        call = Call(
+            [MjaiAdapter.parse_tile(event["pai"]), *tiles],
+            call_type,
+            MjaiAdapter._calculate_player_relation(actor, event["target"]),
+        )
+        for tile in tiles:
+            self._remove_tile(actor, tile)
+        self._append_call(actor, call)
+
+    def _append_call(self, actor: int, call: Call) -> None:
+        self.hands[actor].calls.append(call)
+        self._call_counts[actor].append(
+            (call.call_type, TileCount.create_from_tiles(call.tiles)),
+        )
+
+    def _append_drawn_tile(self, actor: int) -> None:
+        drawn_tile = self.hands[actor].drawn_tile
+        if drawn_tile is not None:
+            self.hands[actor].append_drawn_tile()
+            self._count_tile(actor, drawn_tile)
+
+    def _add_tile(self, actor: int, tile_str: str) -> None:
+        if tile_str == MjaiAdapter.UNKNOWN_TILE:
+            self._num_unknown_tiles[actor] += 1
+            return
+
+        tile = MjaiAdapter.parse_tile(tile_str)
+        self.hands[actor].tiles.append(tile)
+        self._count_tile(actor, tile)
+
+    def _count_tile(self, actor: int, tile: Tile) -> None:
+        concealed_count = self._concealed_counts[actor]
+        concealed_count[TileMapping.tile_to_index(tile)] += 1
+        concealed_count.red_mask |= TileMapping.tile_to_red_mask(tile)
+
+    def _remove_tile(self, actor: int, tile: Tile) -> None:
+        tiles = self.hands[actor].tiles
+        for position, hand_tile in enumerate(tiles):
+            if hand_tile == tile and hand_tile.is_red is tile.is_red:
+                del tiles[position]
+                concealed_count = self._concealed_counts[actor]
+                concealed_count[TileMapping.tile_to_index(tile)] -= 1
+                concealed_count.red_mask &= ~TileMapping.tile_to_red_mask(tile)
+                return
+
+        if self._num_unknown_tiles[actor] == 0:
+            raise ValueError
+        self._num_unknown_tiles[actor] -= 1
+
+    @staticmethod
+    def _calculate_player_relation(actor: int, target: int) -> PlayerRelation:
+        try:
+            return _PLAYER_RELATIONS[(target - actor) % 4]
+        except KeyError:
+            raise ValueError from None
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from pymj.enums.division_part_state import DivisionPartState
+from pymj.enums.division_part_type import DivisionPartType
+from pymj.enums.division_signature_data import DivisionSignatureData
+from pymj.enums.scoring_context_data import ScoringContextData
+from pymj.enums.wait_type import WaitType
+from pymj.enums.yaku_feature import YakuFeature
+from pymj.tiles.tile_constants import Tiles
+
+BASE_FU = 20
+SEVEN_PAIRS_FU = 25
+CONCEALED_RON_FU = 10
+TSUMO_FU = 2
+VALUE_HEAD_FU = 2
+MAX_HAN = 13
+FU_VALUES = (20, 25, *range(30, 150, 10))
+
+
+def _calculate_part_fu(
+    part_type: DivisionPartType,
+    state: DivisionPartState,
+    is_outside: bool,
+) -> int:
+    # A triplet completed by ron counts as open.
+    if part_type is DivisionPartType.TRIPLE:
+        fu = 2
+    elif part_type is DivisionPartType.QUAD:
+        fu = 8
+    else:
+        return 0
+    if state is DivisionPartState.CONCEALED:
+        fu *= 2
+    return fu * 2 if is_outside else fu
+
+
+# Fu of a part by its type, its state and whether its tile is a terminal or an
+# honor, and fu of a wait by its type.
+PART_FU: Mapping[tuple[DivisionPartType, DivisionPartState, bool], int] = (
+    MappingProxyType(
+        {
+            (part_type, state, is_outside): _calculate_part_fu(
+                part_type,
+                state,
+                is_outside,
+            )
+            for part_type in DivisionPartType
+            for state in DivisionPartState
+            for is_outside in (False, True)
+        },
+    )
+)
+WAIT_FU: Mapping[WaitType, int] = MappingProxyType(
+    {
+        WaitType.SINGLE_WAIT: 2,
+        WaitType.CLOSED_WAIT: 2,
+        WaitType.EDGE_WAIT: 2,
+    },
+)
+
+_DRAGONS_MASK = sum(1 << tile for tile in Tiles.DRAGONS)
+_CONCEALED = int(YakuFeature.CONCEALED)
+_TSUMO = int(YakuFeature.TSUMO)
+_SEVEN_PAIRS = int(YakuFeature.SEVEN_PAIRS)
+
+
+def calculate_fu(
+    signature: DivisionSignatureData,
+    context: ScoringContextData,
+) -> int:
+    """Calculate the fu of a division, rounded up to a multiple of 10.
+
+    The fu of the parts and the wait are precomputed in the signature from
+    `PART_FU` and `WAIT_FU`, so only the head and the way of winning are added:
+
+    - Seven pairs are always 25 fu.
+    - A head of a dragon, the seat wind or the round wind is 2 fu each, so a
+      double wind head is 4 fu.
+    - A concealed ron is 10 fu, and a tsumo 2 fu except for pinfu, the only
+      concealed hand still at 20 fu.
+    - An open hand of 20 fu is raised to 30 fu.
+
+    Args:
+        signature (DivisionSignatureData): Signature of the division.
+        context (ScoringContextData): Situation of the win.
+
+    Returns:
+        int: Fu of the division.
+
+    """
+    features = signature.features
+    if features & _SEVEN_PAIRS:
+        return SEVEN_PAIRS_FU
+
+    head_mask = signature.head_mask
+    fu = (
+        BASE_FU
+        + signature.fu
+        + VALUE_HEAD_FU
+        * (
+            bool(head_mask & _DRAGONS_MASK)
+            + (head_mask >> context.seat_wind & 1)
+            + (head_mask >> context.round_wind & 1)
+        )
+    )
+    is_concealed = features & _CONCEALED
+    if not features & _TSUMO:
+        fu += CONCEALED_RON_FU if is_concealed else 0
+    elif not is_concealed or fu != BASE_FU:
+        fu += TSUMO_FU
+
+    if fu == BASE_FU and not is_concealed:
+        return 30
+    return -(-fu // 10) * 10
+
+
+def _round_up_100(points: int) -> int:
+    return -(-points // 100) * 100
+
+
+def _calculate_base_points(han: int, fu: int) -> int:
+    if han >= 13:
+        return 8000
+    if han >= 11:
+        return 6000
+    if han >= 8:
+        return 4000
+    if han >= 6:
+        return 3000
+    return min(fu << han + 2, 2000)
+
+
+def _calculate_payments(
+    han: int,
+    fu: int,
+    is_dealer: bool,
+    is_tsumo: bool,
+) -> tuple[int, int]:
+    base = _calculate_base_points(han, fu)
+    if not is_tsumo:
+        return _round_up_100(base * (6 if is_dealer else 4)), 0
+    if is_dealer:
+        return 0, _round_up_100(base * 2)
+    return _round_up_100(base * 2), _round_up_100(base)
+
+
+# Payments by (han, fu, dealer, tsumo), see `lookup_payments`.
+POINTS_TABLE: Mapping[tuple[int, int, bool, bool], tuple[int, int]] = MappingProxyType(
+    {
+        (han, fu, is_dealer, is_tsumo): _calculate_payments(
+            han,
+            fu,
+            is_dealer,
+            is_tsumo,
+        )
+        for han in range(1, MAX_HAN + 1)
+        for fu in FU_VALUES
+        for is_dealer in (False, True)
+        for is_tsumo in (False, True)
+    },
+)
+
+
+def lookup_payments(
+    han: int,
+    fu: int,
+    is_dealer: bool,
+    is_tsumo: bool,
+) -> tuple[int, int]:
+    """Look up the payments for a win in the points table.
+
+    Han above MAX_HAN count as multiples of yakuman, so callers clamp counted
+    han of regular yaku to MAX_HAN first.
+
+    Args:
+        han (int): Han of the hand, at least 1.
+        fu (int): Fu of the hand, one of FU_VALUES or above.
+        is_dealer (bool): Whether the winner is the dealer.
+        is_tsumo (bool): Whether the win is a tsumo.
+
+    Returns:
+        tuple[int, int]: Payment of the discarder for a ron, or of the dealer for
+            a tsumo, and payment of each non-dealer for a tsumo, 0 when they do
+            not pay.
+
+    """
+    # Fu above the table only occur in hands worth a mangan or more.
+    fu = min(fu, FU_VALUES[-1])
+    if han > MAX_HAN:
+        first, each = POINTS_TABLE[MAX_HAN, fu, is_dealer, is_tsumo]
+        multiple = han // MAX_HAN
+        return first * multiple, each * multiple
+    return POINTS_TABLE[han, fu, is_dealer, is_tsumo]
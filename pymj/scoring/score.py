@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+from pymj.enums.division_signature_data import DivisionSignatureData
+from pymj.enums.score_data import ScoreData
+from pymj.enums.scoring_context_data import ScoringContextData
+from pymj.enums.yaku_feature import YakuFeature
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.scoring.fu import MAX_HAN, calculate_fu, lookup_payments
+from pymj.scoring.yaku import (
+    YAKUMAN_HAN,
+    calculate_han_bound,
+    calculate_signature,
+    calculate_situation_features,
+    evaluate_yaku,
+)
+from pymj.tiles.division import Division
+from pymj.tiles.hand_info import HandInfo
+
+SCORE_CACHE_SIZE = 1 << 16
+
+_TSUMO = int(YakuFeature.TSUMO)
+
+
+def _calculate_points(
+    payments: tuple[int, int],
+    is_dealer: bool,
+    is_tsumo: bool,
+) -> int:
+    if not is_tsumo:
+        return payments[0]
+    return payments[0] + payments[1] * (3 if is_dealer else 2)
+
+
+def score_signature(
+    signature: DivisionSignatureData,
+    context: ScoringContextData,
+) -> ScoreData:
+    """Score a division from its signature.
+
+    Dora add to the han of hands with a yaku. Counted han are capped at MAX_HAN,
+    while yakuman keep their multiples.
+
+    Args:
+        signature (DivisionSignatureData): Signature of the division.
+        context (ScoringContextData): Situation of the win.
+
+    Returns:
+        ScoreData: Score of the division, with no han and points without yaku.
+
+    """
+    yaku = tuple(evaluate_yaku(signature, context))
+    fu = calculate_fu(signature, context)
+    if not yaku:
+        return ScoreData(yaku=yaku, han=0, fu=fu, payments=(0, 0), points=0)
+
+    han = sum(yaku_han for _, yaku_han in yaku)
+    if yaku[0][1] < YAKUMAN_HAN:
+        han = min(han + context.num_dora, MAX_HAN)
+    is_tsumo = bool(signature.features & _TSUMO)
+    payments = lookup_payments(han, fu, context.is_dealer, is_tsumo)
+    points = _calculate_points(payments, context.is_dealer, is_tsumo)
+    return ScoreData(yaku=yaku, han=han, fu=fu, payments=payments, points=points)
+
+
+def score_division(division: Division, context: ScoringContextData) -> ScoreData:
+    """Score a division by its yaku and fu.
+
+    Args:
+        division (Division): Division of a winning hand.
+        context (ScoringContextData): Situation of the win.
+
+    Returns:
+        ScoreData: Score of the division, see `score_signature`.
+
+    """
+    return score_signature(calculate_signature(division), context)
+
+
+@lru_cache(maxsize=SCORE_CACHE_SIZE)
+def _score_signature_cached(
+    signature: DivisionSignatureData,
+    context: ScoringContextData,
+) -> ScoreData:
+    return score_signature(signature, context)
+
+
+def clear_score_cache() -> None:
+    """Clear the scores memoized by `score_hand`."""
+    _score_signature_cached.cache_clear()
+
+
+def _bound_points(
+    signature: DivisionSignatureData,
+    context: ScoringContextData,
+    situation: int,
+) -> int | None:
+    """Bound the points of a division, or None if it may be a yakuman."""
+    han = calculate_han_bound(signature.features, situation)
+    if han >= YAKUMAN_HAN:
+        return None
+    if not han:
+        return 0
+    is_tsumo = bool(signature.features & _TSUMO)
+    payments = lookup_payments(
+        min(han + context.num_dora, MAX_HAN),
+        calculate_fu(signature, context),
+        context.is_dealer,
+        is_tsumo,
+    )
+    return _calculate_points(payments, context.is_dealer, is_tsumo)
+
+
+def score_divisions(
+    divisions: Iterable[Division],
+    context: ScoringContextData,
+) -> ScoreData:
+    """Score the highest-scoring of some divisions of a winning hand.
+
+    Each division is reduced to its signature, and skipped when a bound of its
+    points from the han of the yaku its features allow and its exact fu is below
+    the points of the best score so far. Divisions that may tie on points are
+    scored, so the han and fu do not depend on the order of the divisions. Scores
+    are memoized by signature and context across calls, so equal divisions of
+    different hands or waits are scored once. The memo holds up to
+    SCORE_CACHE_SIZE scores and is emptied by `clear_score_cache`.
+
+    Args:
+        divisions (Iterable[Division]): Divisions of a winning hand, consumed
+            one at a time.
+        context (ScoringContextData): Situation of the win.
+
+    Returns:
+        ScoreData: Score with the most points, then the most han and fu. Hands
+            without yaku score no han and no points.
+
+    Raises:
+        ValueError: If there is no division.
+
+    """
+    situation = calculate_situation_features(context)
+    best: ScoreData | None = None
+    for division in divisions:
+        signature = calculate_signature(division)
+        if best is not None:
+            bound = _bound_points(signature, context, situation)
+            if bound is not None and bound < best.points:
+                continue
+        score = _score_signature_cached(signature, context)
+        if best is None or (score.points, score.han, score.fu) > (
+            best.points,
+            best.han,
+            best.fu,
+        ):
+            best = score
+
+    if best is None:
+        raise ValueError
+    return best
+
+
+def score_hand(
+    hand_info: HandInfo,
+    context: ScoringContextData,
+    checker: BaseHandChecker | None = None,
+) -> ScoreData:
+    """Score a winning hand by its highest-scoring division.
+
+    Divisions are streamed from the checker one at a time into
+    `score_divisions`, which prunes and memoizes them.
+
+    Args:
+        hand_info (HandInfo): Winning hand with its agari tile.
+        context (ScoringContextData): Situation of the win.
+        checker (BaseHandChecker | None, optional): Checker that divides the hand.
+            Defaults to CombinedHandChecker.
+
+    Returns:
+        ScoreData: Score with the most points, then the most han and fu. Hands
+            without yaku score no han and no points.
+
+    Raises:
+        ValueError: If the hand is not a winning hand.
+
+    """
+    checker = checker or CombinedHandChecker()
+    return score_divisions(checker.iterate_divisions(hand_info), context)
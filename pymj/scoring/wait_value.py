@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import chain, product
+
+from pymj.enums.division_part_state import DivisionPartState
+from pymj.enums.scoring_context_data import ScoringContextData
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.hand_checker.normal_form_checker import NormalFormChecker
+from pymj.hand_checker.seven_pair_checker import SevenPairChecker
+from pymj.hand_checker.thirteen_orphan_checker import ThirteenOrphanChecker
+from pymj.scoring.score import score_divisions
+from pymj.tiles.division import Division
+from pymj.tiles.division_part import DivisionPart
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile_constants import Tiles
+from pymj.tiles.tile_mapping import TileMapping
+
+# First tile index and size of the man, pin and sou suits and the honors.
+_GROUPS = ((0, 9), (9, 9), (18, 9), (27, 7))
+
+
+def _split_bodies(
+    start: int,
+    counts: list[int],
+    index: int,
+) -> Iterator[tuple[DivisionPart, ...]]:
+    while index < len(counts) and not counts[index]:
+        index += 1
+    if index == len(counts):
+        yield ()
+        return
+
+    for num_triplet in range(2):
+        num_sequence = counts[index] - 3 * num_triplet
+        if num_sequence < 0:
+            continue
+        if num_sequence and (
+            start == _GROUPS[3][0]
+            or index + 2 >= len(counts)
+            or counts[index + 1] < num_sequence
+            or counts[index + 2] < num_sequence
+        ):
+            continue
+        sequence_tiles = (index + 1, index + 2) if num_sequence else ()
+        counts[index] = 0
+        for tile in sequence_tiles:
+            counts[tile] -= num_sequence
+        parts = (
+            *(
+                DivisionPart.create_triple(start + index, DivisionPartState.CONCEALED)
+                for _ in range(num_triplet)
+            ),
+            *(
+                DivisionPart.create_sequence(
+                    start + index,
+                    DivisionPartState.CONCEALED,
+                )
+                for _ in range(num_sequence)
+            ),
+        )
+        for rest in _split_bodies(start, counts, index + 1):
+            yield parts + rest
+        counts[index] = 3 * num_triplet + num_sequence
+        for tile in sequence_tiles:
+            counts[tile] += num_sequence
+
+
+@lru_cache(maxsize=4096)
+def _decompose_group(
+    start: int,
+    counts: tuple[int, ...],
+) -> tuple[tuple[DivisionPart, ...], ...]:
+    """Find all ways to split the tiles of a suit or the honors into parts.
+
+    Tiles of 3n are split into bodies, and tiles of 3n+2 into a head and bodies.
+    Decompositions are cached by counts, so the waits of a hand and other hands
+    share the decompositions of their unchanged suits.
+    """
+    remaining = list(counts)
+    match sum(counts) % 3:
+        case 0:
+            heads: list[int | None] = [None]
+        case 2:
+            heads = [tile for tile, count in enumerate(counts) if count >= 2]
+        case _:
+            return ()
+
+    decompositions: list[tuple[DivisionPart, ...]] = []
+    for head in heads:
+        head_parts: tuple[DivisionPart, ...] = ()
+        if head is not None:
+            remaining[head] -= 2
+            head_parts = (
+                DivisionPart.create_head(start + head, DivisionPartState.CONCEALED),
+            )
+        decompositions.extend(
+            head_parts + bodies for bodies in _split_bodies(start, remaining, 0)
+        )
+        if head is not None:
+            remaining[head] += 2
+    return tuple(decompositions)
+
+
+def _calculate_normal_divisions(
+    counts: list[int],
+    call_parts: list[DivisionPart],
+    agari_tile: int,
+    is_tsumo: bool,
+) -> list[Division]:
+    group_decompositions = [
+        _decompose_group(start, tuple(counts[start : start + size]))
+        for start, size in _GROUPS
+    ]
+    divisions = []
+    for combination in product(*group_decompositions):
+        divisions.extend(
+            NormalFormChecker.create_divisions(
+                list(chain.from_iterable(combination)),
+                call_parts,
+                agari_tile,
+                is_tsumo,
+            ),
+        )
+    return divisions
+
+
+def _find_wait_candidates(counts: list[int]) -> list[int]:
+    """Find the tiles that may complete a hand, near its tiles or orphans."""
+    candidates = []
+    for start, size in _GROUPS:
+        reach = 0 if start == _GROUPS[3][0] else 2
+        for index in range(size):
+            window = counts[start + max(0, index - reach) : start + index + reach + 1]
+            if any(window) or start + index in Tiles.TERMINALS_AND_HONORS:
+                candidates.append(start + index)
+    return candidates
+
+
+def wait_value_table(
+    hand_info: HandInfo,
+    context: ScoringContextData,
+) -> dict[int, tuple[int, int, int]]:
+    """Score each winning tile of a tenpai hand on ron and on tsumo.
+
+    Waits are computed once, among the tiles near the tiles of the hand and the
+    terminals and honors. Normal form divisions of each wait are assembled
+    from decompositions of the suits and the honors, of which only the suit of
+    the winning tile changes between waits, and ron and tsumo share them.
+    Divisions are scored by `score_divisions`, so equal divisions of different
+    waits are scored once. The context applies to every wait, including its
+    dora, and furiten is not considered.
+
+    Args:
+        hand_info (HandInfo): Hand with 3n+1 concealed tiles and no winning tile.
+        context (ScoringContextData): Situation of the win.
+
+    Returns:
+        dict[int, tuple[int, int, int]]: Points on ron, points on tsumo and
+            number of copies unseen by the hand, by index of each winning tile.
+            Waits without yaku score 0 points.
+
+    Raises:
+        ValueError: If the hand is not 3n+1 tiles without a winning tile.
+
+    """
+    counts = list(hand_info.concealed_count)
+    waits_mask = CombinedHandChecker().calculate_waits(
+        hand_info,
+        _find_wait_candidates(counts),
+    )
+    special_checkers = (
+        [] if hand_info.call_counts else [SevenPairChecker(), ThirteenOrphanChecker()]
+    )
+    call_parts = [
+        DivisionPart.create_from_call(call_type, tile_count)
+        for call_type, tile_count in hand_info.call_counts
+    ]
+    total_count = hand_info.total_count
+
+    table = {}
+    for tile in range(34):
+        if not waits_mask >> tile & 1:
+            continue
+        counts[tile] += 1
+        winning_hand = HandInfo(
+            hand_info.concealed_count,
+            hand_info.call_counts,
+            TileMapping.index_to_tile(tile),
+        )
+        winning_checkers = [
+            checker for checker in special_checkers if checker.check_agari(winning_hand)
+        ]
+        points = []
+        for is_tsumo in (False, True):
+            winning_hand.is_tsumo = is_tsumo
+            divisions = _calculate_normal_divisions(
+                counts,
+                call_parts,
+                tile,
+                is_tsumo,
+            )
+            for checker in winning_checkers:
+                divisions.extend(checker.calculate_divisions(winning_hand))
+            points.append(score_divisions(divisions, context).points)
+        counts[tile] -= 1
+        table[tile] = (points[0], points[1], max(0, 4 - total_count[tile]))
+    return table
@@ -0,0 +1,429 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+from pymj.enums.division_part_state import DivisionPartState
+from pymj.enums.division_part_type import DivisionPartType
+from pymj.enums.division_signature_data import DivisionSignatureData
+from pymj.enums.scoring_context_data import ScoringContextData
+from pymj.enums.wait_type import WaitType
+from pymj.enums.yaku import Yaku
+from pymj.enums.yaku_feature import YakuFeature
+from pymj.scoring.fu import PART_FU, WAIT_FU
+from pymj.tiles.division import Division
+from pymj.tiles.division_part import DivisionPart
+from pymj.tiles.tile_constants import Tiles
+
+YAKUMAN_HAN = 13
+
+
+def _to_mask(tiles: Iterable[int]) -> int:
+    mask = 0
+    for tile in tiles:
+        mask |= 1 << tile
+    return mask
+
+
+_SIMPLES_MASK = _to_mask(Tiles.SIMPLES)
+_TERMINALS_MASK = _to_mask(Tiles.TERMINALS)
+_HONORS_MASK = _to_mask(Tiles.HONORS)
+_TERMINALS_AND_HONORS_MASK = _to_mask(Tiles.TERMINALS_AND_HONORS)
+_GREENS_MASK = _to_mask(Tiles.GREENS)
+_WINDS_MASK = _to_mask(Tiles.WINDS)
+_DRAGONS_MASK = _to_mask(Tiles.DRAGONS)
+_SUIT_MASKS = tuple(_to_mask(suit) for suit in (Tiles.MANS, Tiles.PINS, Tiles.SOUS))
+_SUIT_VALUES_MASK = 0x1FF
+_STRAIGHT_MASK = _to_mask((0, 3, 6))
+_NINE_GATES = (3, 1, 1, 1, 1, 1, 1, 1, 3)
+_CONCEALED = int(YakuFeature.CONCEALED)
+# Situation features that depend on the division as well as the context.
+_WIND_FEATURES_MASK = int(
+    YakuFeature.SEAT_WIND | YakuFeature.ROUND_WIND | YakuFeature.VALUE_HEAD,
+)
+
+_WAIT_FEATURES = {
+    WaitType.SIDE_WAIT: YakuFeature.SIDE_WAIT,
+    WaitType.SINGLE_WAIT: YakuFeature.SINGLE_WAIT,
+    WaitType.THIRTEEN_ORPHANS_13WAIT: YakuFeature.THIRTEEN_WAIT,
+}
+_CONCEALED_TRIPLET_FEATURES = (
+    0,
+    0,
+    0,
+    YakuFeature.THREE_CONCEALED_TRIPLETS,
+    YakuFeature.FOUR_CONCEALED_TRIPLETS,
+)
+_QUAD_FEATURES = (0, 0, 0, YakuFeature.THREE_QUADS, YakuFeature.FOUR_QUADS)
+_IDENTICAL_SEQUENCE_FEATURES = (
+    0,
+    YakuFeature.ONE_IDENTICAL_SEQUENCES,
+    YakuFeature.TWO_IDENTICAL_SEQUENCES,
+)
+
+F = YakuFeature
+
+# Rows of (yaku, required features, forbidden features, han when concealed, han
+# when open). A yaku is found when all required and no forbidden features are
+# present, and a han of 0 when open makes it a concealed-only yaku.
+_YAKUMAN_TABLE: tuple[tuple[Yaku, int, int, int, int], ...] = tuple(
+    (yaku, int(required), int(forbidden), closed_han, open_han)
+    for yaku, required, forbidden, closed_han, open_han in (
+        (Yaku.KOKUSHI_MUSOU, F.THIRTEEN_ORPHANS, F.THIRTEEN_WAIT, 1, 0),
+        (Yaku.KOKUSHI_MUSOU_13_WAIT, F.THIRTEEN_ORPHANS | F.THIRTEEN_WAIT, F(0), 2, 0),
+        (Yaku.SUUANKOU, F.FOUR_CONCEALED_TRIPLETS, F.SINGLE_WAIT, 1, 0),
+        (
+            Yaku.SUUANKOU_TANKI,
+            F.FOUR_CONCEALED_TRIPLETS | F.SINGLE_WAIT,
+            F(0),
+            2,
+            0,
+        ),
+        (Yaku.DAISANGEN, F.BIG_THREE_DRAGONS, F(0), 1, 1),
+        (Yaku.SHOUSUUSHII, F.LITTLE_FOUR_WINDS, F(0), 1, 1),
+        (Yaku.DAISUUSHII, F.BIG_FOUR_WINDS, F(0), 2, 2),
+        (Yaku.TSUUIISOU, F.HONORS_ONLY, F(0), 1, 1),
+        (Yaku.CHINROUTOU, F.TERMINALS_ONLY, F(0), 1, 1),
+        (Yaku.RYUUIISOU, F.GREENS_ONLY, F(0), 1, 1),
+        (Yaku.CHUUREN_POUTOU, F.NINE_GATES, F(0), 1, 0),
+        (Yaku.SUUKANTSU, F.FOUR_QUADS, F(0), 1, 1),
+        (Yaku.TENHOU, F.FIRST_DRAW | F.TSUMO | F.CONCEALED | F.DEALER, F(0), 1, 0),
+        (Yaku.CHIIHOU, F.FIRST_DRAW | F.TSUMO | F.CONCEALED, F.DEALER, 1, 0),
+    )
+)
+_YAKU_TABLE: tuple[tuple[Yaku, int, int, int, int], ...] = tuple(
+    (yaku, int(required), int(forbidden), closed_han, open_han)
+    for yaku, required, forbidden, closed_han, open_han in (
+        (Yaku.RIICHI, F.RIICHI | F.CONCEALED, F(0), 1, 0),
+        (Yaku.DOUBLE_RIICHI, F.DOUBLE_RIICHI | F.CONCEALED, F(0), 2, 0),
+        (Yaku.IPPATSU, F.IPPATSU | F.CONCEALED, F(0), 1, 0),
+        (Yaku.MENZEN_TSUMO, F.CONCEALED | F.TSUMO, F(0), 1, 0),
+        (
+            Yaku.PINFU,
+            F.CONCEALED | F.ALL_SEQUENCES | F.SIDE_WAIT,
+            F.VALUE_HEAD,
+            1,
+            0,
+        ),
+        (Yaku.IIPEIKOU, F.ONE_IDENTICAL_SEQUENCES, F(0), 1, 0),
+        (Yaku.HAITEI, F.LAST_TILE | F.TSUMO, F(0), 1, 1),
+        (Yaku.HOUTEI, F.LAST_TILE, F.TSUMO, 1, 1),
+        (Yaku.RINSHAN, F.AFTER_KAN | F.TSUMO, F(0), 1, 1),
+        (Yaku.CHANKAN, F.ROBBING_KAN, F.TSUMO, 1, 1),
+        (Yaku.TANYAO, F.SIMPLES_ONLY, F(0), 1, 1),
+        (Yaku.SEAT_WIND, F.SEAT_WIND, F(0), 1, 1),
+        (Yaku.ROUND_WIND, F.ROUND_WIND, F(0), 1, 1),
+        (Yaku.WHITE_DRAGON, F.WHITE_DRAGON, F(0), 1, 1),
+        (Yaku.GREEN_DRAGON, F.GREEN_DRAGON, F(0), 1, 1),
+        (Yaku.RED_DRAGON, F.RED_DRAGON, F(0), 1, 1),
+        (Yaku.CHANTA, F.OUTSIDE | F.HAS_SEQUENCE | F.HAS_HONOR, F(0), 2, 1),
+        (Yaku.SANSHOKU_DOUJUN, F.THREE_COLOR_SEQUENCES, F(0), 2, 1),
+        (Yaku.ITTSU, F.STRAIGHT, F(0), 2, 1),
+        (Yaku.TOITOI, F.ALL_TRIPLETS, F(0), 2, 2),
+        (Yaku.SANANKOU, F.THREE_CONCEALED_TRIPLETS, F(0), 2, 2),
+        (Yaku.SANSHOKU_DOUKOU, F.THREE_COLOR_TRIPLETS, F(0), 2, 2),
+        (Yaku.SANKANTSU, F.THREE_QUADS, F(0), 2, 2),
+        (Yaku.CHIITOITSU, F.SEVEN_PAIRS, F(0), 2, 0),
+        (Yaku.HONROUTOU, F.TERMINALS_AND_HONORS_ONLY, F(0), 2, 2),
+        (Yaku.SHOUSANGEN, F.LITTLE_THREE_DRAGONS, F(0), 2, 2),
+        (Yaku.HONITSU, F.ONE_SUIT | F.HAS_HONOR, F(0), 3, 2),
+        (Yaku.JUNCHAN, F.OUTSIDE | F.HAS_SEQUENCE, F.HAS_HONOR, 3, 2),
+        (Yaku.RYANPEIKOU, F.TWO_IDENTICAL_SEQUENCES, F(0), 3, 0),
+        (Yaku.CHINITSU, F.ONE_SUIT, F.HAS_HONOR, 6, 5),
+    )
+)
+
+
+def _when(condition: object, feature: YakuFeature) -> int:
+    return int(feature) if condition else 0
+
+
+class _PartScan:
+    """Masks and counts of the parts of a division, gathered in one pass."""
+
+    def __init__(self, parts: list[DivisionPart]) -> None:
+        self.tile_mask = 0
+        self.sequence_mask = 0
+        self.triplet_mask = 0
+        self.head_mask = 0
+        self.sequence_counts: dict[int, int] = {}
+        self.num_heads = 0
+        self.num_triplets = 0
+        self.num_concealed_triplets = 0
+        self.num_quads = 0
+        self.num_inner_parts = 0
+        self.fu = 0
+        self.is_concealed = True
+        self.is_tsumo = True
+        self.is_thirteen_orphans = False
+        for part in parts:
+            self._add(part)
+
+    def _add(self, part: DivisionPart) -> None:
+        if part.state is DivisionPartState.OPENED:
+            self.is_concealed = False
+        elif part.state is DivisionPartState.RON:
+            self.is_tsumo = False
+
+        first = part.tile_count.find_earliest_nonzero_index()
+        match part.type:
+            case DivisionPartType.SEQUENCE:
+                part_mask = 0b111 << first
+                self.sequence_mask |= 1 << first
+                self.sequence_counts[first] = self.sequence_counts.get(first, 0) + 1
+            case DivisionPartType.HEAD:
+                part_mask = 1 << first
+                self.head_mask |= part_mask
+                self.num_heads += 1
+            case DivisionPartType.THIRTEEN_ORPHANS:
+                part_mask = _TERMINALS_AND_HONORS_MASK
+                self.head_mask |= 1 << next(
+                    tile
+                    for tile in Tiles.TERMINALS_AND_HONORS
+                    if part.tile_count[tile] == 2
+                )
+                self.is_thirteen_orphans = True
+            case _:
+                part_mask = 1 << first
+                self.triplet_mask |= part_mask
+                self.num_triplets += 1
+                self.num_quads += part.type is DivisionPartType.QUAD
+                self.num_concealed_triplets += part.state is DivisionPartState.CONCEALED
+
+        is_outside = bool(part_mask & _TERMINALS_AND_HONORS_MASK)
+        self.tile_mask |= part_mask
+        self.num_inner_parts += not is_outside
+        self.fu += PART_FU[part.type, part.state, is_outside]
+
+
+def _tile_features(tile_mask: int) -> int:
+    num_suits = sum(1 for suit_mask in _SUIT_MASKS if tile_mask & suit_mask)
+    return (
+        _when(num_suits == 1, F.ONE_SUIT)
+        | _when(tile_mask & _HONORS_MASK, F.HAS_HONOR)
+        | _when(not tile_mask & ~_SIMPLES_MASK, F.SIMPLES_ONLY)
+        | _when(
+            not tile_mask & ~_TERMINALS_AND_HONORS_MASK,
+            F.TERMINALS_AND_HONORS_ONLY,
+        )
+        | _when(not tile_mask & ~_TERMINALS_MASK, F.TERMINALS_ONLY)
+        | _when(not tile_mask & ~_HONORS_MASK, F.HONORS_ONLY)
+        | _when(not tile_mask & ~_GREENS_MASK, F.GREENS_ONLY)
+    )
+
+
+def _honor_features(triplet_mask: int, head_mask: int) -> int:
+    num_dragons = (triplet_mask & _DRAGONS_MASK).bit_count()
+    num_winds = (triplet_mask & _WINDS_MASK).bit_count()
+    return (
+        _when(triplet_mask >> Tiles.DRAGONS[0] & 1, F.WHITE_DRAGON)
+        | _when(triplet_mask >> Tiles.DRAGONS[1] & 1, F.GREEN_DRAGON)
+        | _when(triplet_mask >> Tiles.DRAGONS[2] & 1, F.RED_DRAGON)
+        | _when(num_dragons == 2 and head_mask & _DRAGONS_MASK, F.LITTLE_THREE_DRAGONS)
+        | _when(num_dragons == 3, F.BIG_THREE_DRAGONS)
+        | _when(num_winds == 3 and head_mask & _WINDS_MASK, F.LITTLE_FOUR_WINDS)
+        | _when(num_winds == 4, F.BIG_FOUR_WINDS)
+    )
+
+
+def _pattern_features(sequence_mask: int, triplet_mask: int) -> int:
+    # Bit n of a suit-aligned AND is set when value n + 1 is in all three suits.
+    three_color_sequences = sequence_mask & sequence_mask >> 9 & sequence_mask >> 18
+    three_color_triplets = triplet_mask & triplet_mask >> 9 & triplet_mask >> 18
+    return (
+        _when(three_color_sequences & _SUIT_VALUES_MASK, F.THREE_COLOR_SEQUENCES)
+        | _when(three_color_triplets & _SUIT_VALUES_MASK, F.THREE_COLOR_TRIPLETS)
+        | _when(
+            any(
+                sequence_mask >> 9 * suit & _STRAIGHT_MASK == _STRAIGHT_MASK
+                for suit in range(3)
+            ),
+            F.STRAIGHT,
+        )
+    )
+
+
+def _is_nine_gates(division: Division, scan: _PartScan) -> bool:
+    if not scan.is_concealed or scan.num_quads or scan.num_heads != 1:
+        return False
+    suit = next(
+        (
+            index
+            for index, suit_mask in enumerate(_SUIT_MASKS)
+            if not scan.tile_mask & ~suit_mask
+        ),
+        None,
+    )
+    if suit is None:
+        return False
+    counts = list(division.tile_count)[9 * suit : 9 * suit + 9]
+    return all(
+        count >= required for count, required in zip(counts, _NINE_GATES, strict=True)
+    )
+
+
+def calculate_signature(division: Division) -> DivisionSignatureData:
+    """Calculate the features of a division that yaku are tested against.
+
+    The parts of the division are walked once, gathering bitmasks of the tiles,
+    sequences, triplets and heads and the fu of the parts, and the shape features
+    are then derived from the masks by bit operations.
+
+    Args:
+        division (Division): Division of a winning hand.
+
+    Returns:
+        DivisionSignatureData: Signature of the division.
+
+    """
+    scan = _PartScan(division.parts)
+    num_identical_sequences = (
+        sum(count // 2 for count in scan.sequence_counts.values())
+        if scan.is_concealed
+        else 0
+    )
+    features = (
+        _when(scan.is_concealed, F.CONCEALED)
+        | _when(scan.is_tsumo, F.TSUMO)
+        | _when(scan.num_heads == 7, F.SEVEN_PAIRS)
+        | _when(scan.is_thirteen_orphans, F.THIRTEEN_ORPHANS)
+        | int(_WAIT_FEATURES.get(division.wait_type, 0))
+        | _when(sum(scan.sequence_counts.values()) == 4, F.ALL_SEQUENCES)
+        | _when(scan.num_triplets == 4, F.ALL_TRIPLETS)
+        | _when(scan.sequence_mask, F.HAS_SEQUENCE)
+        | _when(not scan.num_inner_parts, F.OUTSIDE)
+        | int(_CONCEALED_TRIPLET_FEATURES[scan.num_concealed_triplets])
+        | int(_QUAD_FEATURES[scan.num_quads])
+        | int(_IDENTICAL_SEQUENCE_FEATURES[min(num_identical_sequences, 2)])
+        | _tile_features(scan.tile_mask)
+        | _honor_features(scan.triplet_mask, scan.head_mask)
+        | _pattern_features(scan.sequence_mask, scan.triplet_mask)
+        | _when(_is_nine_gates(division, scan), F.NINE_GATES)
+    )
+    return DivisionSignatureData(
+        features=features,
+        triplet_mask=scan.triplet_mask,
+        head_mask=scan.head_mask,
+        fu=scan.fu + WAIT_FU.get(division.wait_type, 0),
+    )
+
+
+def calculate_situation_features(context: ScoringContextData) -> int:
+    """Calculate the situation features of a context that hold for any division.
+
+    Args:
+        context (ScoringContextData): Situation of the win.
+
+    Returns:
+        int: Bitmask of the situation `YakuFeature` values other than the winds
+            and the value of the head.
+
+    """
+    return (
+        _when(context.is_double_riichi, F.DOUBLE_RIICHI)
+        | _when(context.is_riichi and not context.is_double_riichi, F.RIICHI)
+        | _when(context.is_ippatsu, F.IPPATSU)
+        | _when(context.is_last_tile, F.LAST_TILE)
+        | _when(context.is_after_kan, F.AFTER_KAN)
+        | _when(context.is_robbing_kan, F.ROBBING_KAN)
+        | _when(context.is_first_draw, F.FIRST_DRAW)
+        | _when(context.is_dealer, F.DEALER)
+    )
+
+
+def _wind_features(
+    signature: DivisionSignatureData,
+    context: ScoringContextData,
+) -> int:
+    value_mask = _DRAGONS_MASK | 1 << context.seat_wind | 1 << context.round_wind
+    return (
+        _when(signature.triplet_mask >> context.seat_wind & 1, F.SEAT_WIND)
+        | _when(signature.triplet_mask >> context.round_wind & 1, F.ROUND_WIND)
+        | _when(signature.head_mask & value_mask, F.VALUE_HEAD)
+    )
+
+
+def evaluate_yaku(
+    signature: DivisionSignatureData,
+    context: ScoringContextData,
+) -> list[tuple[Yaku, int]]:
+    """Find the yaku of a division by testing its features against the yaku table.
+
+    The situation features of the context are added to the shape features of the
+    signature, and each yaku is then a single test of required and forbidden
+    feature masks. Yakuman replace all other yaku.
+
+    Args:
+        signature (DivisionSignatureData): Signature of the division.
+        context (ScoringContextData): Situation of the win.
+
+    Returns:
+        list[tuple[Yaku, int]]: Yaku found with their han, in table order.
+            Yakuman are worth YAKUMAN_HAN, or twice that for double yakuman.
+
+    """
+    features = (
+        signature.features
+        | calculate_situation_features(context)
+        | _wind_features(signature, context)
+    )
+    is_concealed = features & _CONCEALED
+    for table, unit in ((_YAKUMAN_TABLE, YAKUMAN_HAN), (_YAKU_TABLE, 1)):
+        found = [
+            (yaku, unit * (closed_han if is_concealed else open_han))
+            for yaku, required, forbidden, closed_han, open_han in table
+            if features & required == required
+            and not features & forbidden
+            and (is_concealed or open_han)
+        ]
+        if found:
+            return found
+    return []
+
+
+def find_yaku(
+    division: Division,
+    context: ScoringContextData,
+) -> list[tuple[Yaku, int]]:
+    """Find the yaku of a division.
+
+    Args:
+        division (Division): Division of a winning hand.
+        context (ScoringContextData): Situation of the win.
+
+    Returns:
+        list[tuple[Yaku, int]]: Yaku found with their han, see `evaluate_yaku`.
+
+    """
+    return evaluate_yaku(calculate_signature(division), context)
+
+
+@lru_cache(maxsize=4096)
+def calculate_han_bound(features: int, situation: int) -> int:
+    """Bound the han of a division without looking at its tiles.
+
+    Winds and the value of the head are assumed to give the most han, so the
+    bound holds for every division with these features. Results are cached, as
+    hands share few distinct feature masks.
+
+    Args:
+        features (int): Shape features of a signature.
+        situation (int): Features from `calculate_situation_features`.
+
+    Returns:
+        int: Upper bound of the han of the yaku, at least YAKUMAN_HAN if a
+            yakuman may be found.
+
+    """
+    known = features | situation
+    is_concealed = known & _CONCEALED
+    for table, unit in ((_YAKUMAN_TABLE, YAKUMAN_HAN), (_YAKU_TABLE, 1)):
+        han = sum(
+            unit * (closed_han if is_concealed else open_han)
+            for _, required, forbidden, closed_han, open_han in table
+            if known & required | _WIND_FEATURES_MASK == required | _WIND_FEATURES_MASK
+            and not known & forbidden
+        )
+        if han:
+            return han
+    return 0
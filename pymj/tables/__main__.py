@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from pymj.tables.agari_table import (
+    AGARI_TABLE_NAME,
+    AGARI_TABLE_VERSION,
+    generate_agari_table,
+)
+from pymj.tables.table_file import table_directory, write_table
+
+# Version and generator of each table by name.
+TABLES: dict[str, tuple[int, Callable[[], bytearray]]] = {
+    AGARI_TABLE_NAME: (AGARI_TABLE_VERSION, generate_agari_table),
+}
+
+
+def build(directory: Path) -> list[Path]:
+    """Generate and write every table.
+
+    Args:
+        directory (Path): Directory to write the tables to.
+
+    Returns:
+        list[Path]: Paths of the written tables.
+
+    """
+    paths = []
+    for name, (version, generate) in TABLES.items():
+        start = time.perf_counter()
+        path = directory / f"{name}.bin"
+        write_table(path, generate(), version)
+        elapsed = time.perf_counter() - start
+        print(f"{path} (version {version}, {elapsed:.2f} s)")
+        paths.append(path)
+    return paths
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the command line interface.
+
+    Args:
+        argv (Sequence[str] | None, optional): Arguments without the program name.
+            Defaults to None for the arguments of the process.
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m pymj.tables")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser(
+        "build",
+        help="build the table files",
+        description="Build the tables once per installation. Processes loading "
+        "them share their pages, and tables that are not built are generated in "
+        "each process instead.",
+    )
+    build_parser.add_argument(
+        "--dir",
+        type=Path,
+        default=None,
+        help="directory of the tables, defaults to PYMJ_TABLE_DIR or the package",
+    )
+    args = parser.parse_args(argv)
+    build(args.dir or table_directory())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+from pymj.tables.table_file import load_table, table_directory
+
+AGARI_TABLE_NAME = "agari"
+AGARI_TABLE_VERSION = 1
+
+# Entries of the suits are indexed by their counts in base 5, followed by entries of
+# the honors. Each entry sets COMPLETE if its tiles split into complete sets, and
+# COMPLETE_WITH_HEAD if they split into a head and complete sets.
+SUIT_SIZE = 5**9
+HONOR_SIZE = 5**7
+COMPLETE = 0b01
+COMPLETE_WITH_HEAD = 0b10
+
+# Start, end and table offset of the three suits and the honors, and for each tile
+# its part and the step of its count in the index of the part.
+_PARTS = ((0, 9, 0), (9, 18, 0), (18, 27, 0), (27, 34, SUIT_SIZE))
+_TILE_PARTS = tuple(min(tile // 9, 3) for tile in range(34))
+_TILE_STEPS = tuple(5 ** (tile - _PARTS[_TILE_PARTS[tile]][0]) for tile in range(34))
+
+
+def _enumerate_complete_counts(
+    size: int,
+    has_sequences: bool,
+) -> tuple[set[tuple[int, ...]], set[tuple[int, ...]]]:
+    bodies = [
+        tuple(3 if tile == start else 0 for tile in range(size))
+        for start in range(size)
+    ]
+    if has_sequences:
+        bodies += [
+            tuple(1 if start <= tile < start + 3 else 0 for tile in range(size))
+            for start in range(size - 2)
+        ]
+
+    complete = {(0,) * size}
+    level = complete
+    for _ in range(4):
+        level = {
+            counts
+            for base in level
+            for body in bodies
+            if max(counts := tuple(map(sum, zip(base, body, strict=True)))) <= 4
+        }
+        complete |= level
+
+    with_head = set()
+    for counts in complete:
+        for head in range(size):
+            if counts[head] <= 2:
+                with_head.add(counts[:head] + (counts[head] + 2,) + counts[head + 1 :])
+    return complete, with_head
+
+
+def _fill(
+    table: bytearray,
+    offset: int,
+    counts: set[tuple[int, ...]],
+    flag: int,
+) -> None:
+    for tile_counts in counts:
+        index = 0
+        for count in reversed(tile_counts):
+            index = index * 5 + count
+        table[offset + index] |= flag
+
+
+def generate_agari_table() -> bytearray:
+    """Generate the agari table of the suits and the honors.
+
+    Rather than testing every count of a suit, complete counts are enumerated
+    from up to four sets and an optional head, so generation takes well under a
+    second and most of the table stays zero.
+
+    Returns:
+        bytearray: Table of SUIT_SIZE entries of a suit followed by HONOR_SIZE
+            entries of the honors.
+
+    """
+    table = bytearray(SUIT_SIZE + HONOR_SIZE)
+    for offset, size, has_sequences in ((0, 9, True), (SUIT_SIZE, 7, False)):
+        complete, with_head = _enumerate_complete_counts(size, has_sequences)
+        _fill(table, offset, complete, COMPLETE)
+        _fill(table, offset, with_head, COMPLETE_WITH_HEAD)
+    return table
+
+
+@lru_cache(maxsize=1)
+def get_agari_table() -> bytearray | memoryview:
+    """Get the agari table, mapped from its file or generated in this process.
+
+    The file is looked up in `table_directory` as built by
+    `python -m pymj.tables build`. When it is missing or invalid, the table is
+    generated instead, so tables never have to be built, only to be shared.
+
+    Returns:
+        bytearray | memoryview: Agari table as in `generate_agari_table`.
+
+    """
+    table = load_table(
+        table_directory() / f"{AGARI_TABLE_NAME}.bin",
+        AGARI_TABLE_VERSION,
+    )
+    return generate_agari_table() if table is None else table
+
+
+def is_complete_hand(counts: list[int]) -> bool:
+    """Check if tiles split into a head and complete sets using the agari table.
+
+    Counts above 4 are outside the table, and such hands are never complete, as
+    callers trying a fifth copy of a tile as a wait expect.
+
+    Args:
+        counts (list[int]): Counts of 34 tile types of 3n+2 tiles.
+
+    Returns:
+        bool: True if the tiles form a head and complete sets, False otherwise.
+
+    """
+    table = get_agari_table()
+    num_heads = 0
+    for start, end, offset in ((0, 9, 0), (9, 18, 0), (18, 27, 0), (27, 34, SUIT_SIZE)):
+        index = 0
+        for count in reversed(counts[start:end]):
+            if count > 4:
+                return False
+            index = index * 5 + count
+        entry = table[offset + index]
+        if entry & COMPLETE:
+            continue
+        if not entry & COMPLETE_WITH_HEAD:
+            return False
+        num_heads += 1
+    return num_heads == 1
+
+
+def find_complete_waits(counts: list[int], candidates: Iterable[int]) -> int:
+    """Find the tiles that split 3n+1 tiles into a head and complete sets.
+
+    Every part, i.e. suit or the honors, but the one of the winning tile has to be
+    complete already, with or without the head. So the parts are looked up once,
+    and each candidate takes one lookup of its own part with the tile added.
+
+    Args:
+        counts (list[int]): Counts of 34 tile types of 3n+1 tiles.
+        candidates (Iterable[int]): Tile indices to check.
+
+    Returns:
+        int: Bitmask with bit i set if tile index i completes the tiles.
+
+    """
+    table = get_agari_table()
+    indices = []
+    heads: list[int | None] = []
+    for start, end, offset in _PARTS:
+        index = 0
+        for count in reversed(counts[start:end]):
+            if count > 4:
+                return 0
+            index = index * 5 + count
+        entry = table[offset + index]
+        indices.append(index)
+        heads.append(
+            0 if entry & COMPLETE else 1 if entry & COMPLETE_WITH_HEAD else None,
+        )
+
+    num_incomplete = heads.count(None)
+    if num_incomplete > 1:
+        return 0
+    num_heads = sum(head for head in heads if head is not None)
+
+    waits_mask = 0
+    for tile in candidates:
+        part = _TILE_PARTS[tile]
+        head = heads[part]
+        if (num_incomplete and head is not None) or counts[tile] == 4:
+            continue
+        entry = table[_PARTS[part][2] + indices[part] + _TILE_STEPS[tile]]
+        num_other_heads = num_heads - (head or 0)
+        if (entry & COMPLETE and num_other_heads == 1) or (
+            entry & COMPLETE_WITH_HEAD and not num_other_heads
+        ):
+            waits_mask |= 1 << tile
+    return waits_mask
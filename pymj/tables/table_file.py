@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+
+MAGIC = b"PYMJTABL"
+# Magic, version of the generator, CRC-32 checksum and size of the payload.
+HEADER = struct.Struct("<8sIIQ")
+TABLE_DIR_ENV = "PYMJ_TABLE_DIR"
+
+
+def table_directory() -> Path:
+    """Find the directory of the table files.
+
+    Returns:
+        Path: Directory named by the PYMJ_TABLE_DIR environment variable, or the
+            data directory of this package.
+
+    """
+    directory = os.environ.get(TABLE_DIR_ENV)
+    return Path(directory) if directory else Path(__file__).parent / "data"
+
+
+def write_table(
+    path: str | os.PathLike[str],
+    table: bytes | bytearray | memoryview,
+    version: int,
+) -> None:
+    """Write a table with its version and CRC-32 checksum.
+
+    The file is written next to its path and then renamed, so processes loading
+    the table never see a partial file.
+
+    Args:
+        path (str | os.PathLike[str]): Path of the table file.
+        table (bytes | bytearray | memoryview): Bytes of the table.
+        version (int): Version of the generator of the table.
+
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with temporary_path.open("wb") as file:
+        file.write(HEADER.pack(MAGIC, version, zlib.crc32(table), len(table)))
+        file.write(table)
+    temporary_path.replace(path)
+
+
+def load_table(
+    path: str | os.PathLike[str],
+    version: int,
+) -> memoryview | None:
+    """Map a table file into memory if it is valid.
+
+    Tables are mapped read-only with `mmap`, so processes loading the same file
+    share its pages in the page cache instead of each holding a copy.
+
+    Args:
+        path (str | os.PathLike[str]): Path of the table file.
+        version (int): Version of the generator expected for the table.
+
+    Returns:
+        memoryview | None: Bytes of the mapped table, or None if the file is
+            missing, of another version, truncated or fails its checksum.
+
+    """
+    try:
+        with Path(path).open("rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) != HEADER.size:
+                return None
+            magic, file_version, checksum, size = HEADER.unpack(header)
+            if (
+                magic != MAGIC
+                or file_version != version
+                or os.fstat(file.fileno()).st_size != HEADER.size + size
+            ):
+                return None
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    table = memoryview(mapped)[HEADER.size :]
+    if zlib.crc32(table) != checksum:
+        return None
+    return table
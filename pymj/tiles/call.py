@@ -2,6 +2,7 @@ from pymj.enums.call_type import CallType
 from pymj.enums.player_relation import PlayerRelation
 from pymj.enums.tile_type import TileType
 from pymj.tiles.tile import Tile
+from pymj.tiles.tile_mapping import TileMapping
 
 
 class Call:
@@ -64,6 +65,19 @@ class Call:
 
         self._validate_init()
 
+    @property
+    def red_mask(self) -> int:
+        """Calculate the bitmask of red fives in the call.
+
+        Returns:
+            int: Bitmask of red fives in the layout of TileCount.red_mask.
+
+        """
+        red_mask = 0
+        for tile in self.tiles:
+            red_mask |= TileMapping.tile_to_red_mask(tile)
+        return red_mask
+
     def _validate_init(self) -> None:
         tile_count_dict: dict[CallType, int] = {
             CallType.CHII: 3,
@@ -99,5 +99,33 @@ class HandInfo:
         total_count = total_count + self.concealed_count
         if self.agari_tile:
             total_count[TileMapping.tile_to_index(self.agari_tile)] += 1
+            total_count.red_mask |= TileMapping.tile_to_red_mask(self.agari_tile)
 
         return total_count
+
+    @property
+    def red_mask(self) -> int:
+        """Calculates the bitmask of red fives in the hand.
+
+        Returns:
+            int: Bitmask of red fives among concealed tiles, called tiles, and the
+                winning tile, in the layout of TileCount.red_mask.
+
+        """
+        red_mask = self.concealed_count.red_mask
+        for _, call_count in self.call_counts:
+            red_mask |= call_count.red_mask
+        if self.agari_tile:
+            red_mask |= TileMapping.tile_to_red_mask(self.agari_tile)
+        return red_mask
+
+    @property
+    def num_red_fives(self) -> int:
+        """Counts red fives in the hand.
+
+        Returns:
+            int: Number of red fives among concealed tiles, called tiles, and the
+                winning tile.
+
+        """
+        return self.red_mask.bit_count()
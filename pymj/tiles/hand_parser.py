@@ -31,6 +31,11 @@ class HandParser:
         ">": PlayerRelation.NEXT,
         "_": PlayerRelation.SELF,
     }
+    TILE_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"(\d)([mpsz])")
+    TILE_GROUP_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"(\d+)([mpsz])")
+    CALL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"([cpbks])([<^>_])(\d+[mpsz])",
+    )
 
     @staticmethod
     def parse_tile(tile_str: str) -> Tile:
@@ -38,7 +43,7 @@ class HandParser:
 
         Args:
         ----
-            tile_str (str): Tile string (e.g., '1m', '5p', '6z')
+            tile_str (str): Tile string (e.g., '1m', '5p', '6z', '0s' for red five)
 
         Returns:
         -------
@@ -50,7 +55,7 @@ class HandParser:
 
         """
         # Extract the number and type characters
-        match = re.fullmatch(r"(\d)([mpsz])", tile_str)
+        match = HandParser.TILE_PATTERN.fullmatch(tile_str)
         if not match:
             raise ValueError
 
@@ -58,6 +63,11 @@ class HandParser:
         tile_type_char = match.group(2)
 
         # Determine tile type based on the type character
+        if number == 0:
+            if tile_type_char == "z":
+                raise ValueError
+            return Tile(HandParser.TILE_TYPE_MAP[tile_type_char], 5, is_red=True)
+
         if tile_type_char == "z":
             if 1 <= number <= 4:
                 tile_type = TileType.WIND
@@ -84,7 +94,7 @@ class HandParser:
             list[Tile]: List of parsed Tile objects
 
         """
-        match = re.fullmatch(r"(\d+)([mpsz])", group)
+        match = HandParser.TILE_GROUP_PATTERN.fullmatch(group)
         if not match:
             raise ValueError
 
@@ -111,7 +121,7 @@ class HandParser:
 
         """
         # Parse call string
-        match = re.match(r"([cpbks])([<^>_])(\d+[mpsz])", call_str)
+        match = HandParser.CALL_PATTERN.match(call_str)
         if not match:
             raise ValueError
 
@@ -131,6 +141,7 @@ class HandParser:
 
         Format: "123m456p,c<789p,p^111s,k_2222m"
         - Basic tiles: 123m (man), 456p (pin), 789s (sou), 1234z (wind), 567z (dragon)
+        - Red fives: 0m, 0p, 0s (e.g. 406m is 4m, red 5m and 6m)
         - Call format: [type][player_relation][tiles]
             * Call types:
                 - c (chii)
@@ -167,8 +178,8 @@ class HandParser:
         # Parse base tiles (first part)
         hand.tiles = list(
             chain.from_iterable(
-                HandParser.parse_tile_group(group)
-                for group in re.findall(r"\d+[mpsz]", parts[0])
+                HandParser.parse_tile_group(match.group())
+                for match in HandParser.TILE_GROUP_PATTERN.finditer(parts[0])
             ),
         )
         hand.calls = [HandParser.parse_call(call_str) for call_str in parts[1:]]
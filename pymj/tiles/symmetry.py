@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from itertools import permutations
+
+from pymj.enums.call_type import CallType
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_mapping import TileMapping
+
+# Counts of the concealed tiles with the winning tile, and calls as values of their
+# call types with their counts, all after a transform.
+HandKey = tuple[tuple[int, ...], tuple[tuple[int, tuple[int, ...]], ...]]
+
+
+def _create_transform(suits: tuple[int, ...], is_mirrored: bool) -> tuple[int, ...]:
+    transform = []
+    for tile in range(27):
+        suit, number = divmod(tile, 9)
+        transform.append(9 * suits[suit] + (8 - number if is_mirrored else number))
+    return (*transform, *range(27, 34))
+
+
+# The 12 transforms that permute the man, pin and sou suits and optionally mirror
+# the numbers 1 to 9. Transform i maps tile index t to TRANSFORMS[i][t], and the
+# first transform is the identity.
+TRANSFORMS = tuple(
+    _create_transform(suits, is_mirrored)
+    for is_mirrored in (False, True)
+    for suits in permutations(range(3))
+)
+
+
+def invert_transform(transform: tuple[int, ...]) -> tuple[int, ...]:
+    """Invert a transform of tile indices.
+
+    Args:
+        transform (tuple[int, ...]): Tile index of each tile index after the
+            transform.
+
+    Returns:
+        tuple[int, ...]: Transform mapping the transformed tiles back.
+
+    """
+    inverse = [0] * 34
+    for tile, transformed in enumerate(transform):
+        inverse[transformed] = tile
+    return tuple(inverse)
+
+
+def _apply(transform: tuple[int, ...], counts: list[int]) -> tuple[int, ...]:
+    transformed = [0] * 34
+    for tile, count in enumerate(counts):
+        transformed[transform[tile]] = count
+    return tuple(transformed)
+
+
+def canonicalize(hand_info: HandInfo) -> tuple[HandKey, tuple[int, ...]]:
+    """Find the canonical key of a hand among its suit symmetric hands.
+
+    Shanten numbers, waits, ukeire and efficiency are unchanged by permuting the
+    suits and by mirroring the numbers 1 to 9, up to the same transform of the tile
+    indices. The key is the smallest of the hand under the 12 transforms, so
+    symmetric hands share it. The winning tile is counted with the concealed
+    tiles, and red fives are ignored, as neither changes these analyses.
+
+    Args:
+        hand_info (HandInfo): Hand to canonicalize.
+
+    Returns:
+        tuple[HandKey, tuple[int, ...]]: Canonical key of the hand, and transform
+            mapping the tiles of the hand to the tiles of the key.
+
+    """
+    counts = list(hand_info.concealed_count)
+    if hand_info.agari_tile:
+        counts[TileMapping.tile_to_index(hand_info.agari_tile)] += 1
+    calls = [
+        (call_type, list(call_count)) for call_type, call_count in hand_info.call_counts
+    ]
+
+    best_transform = TRANSFORMS[0]
+    best_key = _transform_key(best_transform, counts, calls)
+    for transform in TRANSFORMS[1:]:
+        # Calls only break ties, so most transforms stop at the concealed tiles.
+        if _apply(transform, counts) > best_key[0]:
+            continue
+        key = _transform_key(transform, counts, calls)
+        if key < best_key:
+            best_key, best_transform = key, transform
+    return best_key, best_transform
+
+
+def _transform_key(
+    transform: tuple[int, ...],
+    counts: list[int],
+    calls: list[tuple[CallType, list[int]]],
+) -> HandKey:
+    return (
+        _apply(transform, counts),
+        tuple(
+            sorted(
+                (call_type.value, _apply(transform, call_count))
+                for call_type, call_count in calls
+            ),
+        ),
+    )
+
+
+def create_hand_info(key: HandKey) -> HandInfo:
+    """Create a hand from its canonical key.
+
+    A hand of 3n+2 tiles takes its last tile as the winning tile.
+
+    Args:
+        key (HandKey): Canonical key from `canonicalize`.
+
+    Returns:
+        HandInfo: Hand with the tiles of the key.
+
+    """
+    concealed, calls = key
+    counts = list(concealed)
+    agari_tile = None
+    if sum(counts) % 3 == 2:
+        last = max(tile for tile in range(34) if counts[tile])
+        counts[last] -= 1
+        agari_tile = TileMapping.index_to_tile(last)
+    return HandInfo(
+        TileCount(counts),
+        [(CallType(value), TileCount(list(call_count))) for value, call_count in calls],
+        agari_tile,
+    )
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from pymj.enums.tile_type import TileType
 
@@ -17,21 +17,26 @@ class Tile:
             - Wind: East(1), South(2), West(3), North(4)
             - Dragon: White(1), Green(2), Red(3)
             - Etc: any value for special tiles
+        is_red (bool): Whether the tile is a red five. A red five is equal to the
+            plain five of the same suit, so it is only told apart for scoring.
 
     Raises:
         ValueError: If value is invalid for the given tile_type:
             - Man/Pin/Sou: must be 1-9
             - Wind: must be 1-4
             - Dragon: must be 1-3
+            If is_red is set for a tile other than the five of Man/Pin/Sou.
 
     Examples:
         >>> five_man = Tile(tile_type=TileType.MAN, value=5)  # 5 of Characters
         >>> east_wind = Tile(tile_type=TileType.WIND, value=1)  # East Wind
+        >>> red_five_pin = Tile(tile_type=TileType.PIN, value=5, is_red=True)
 
     """
 
     tile_type: TileType
     value: int
+    is_red: bool = field(default=False, compare=False)
 
     def __post_init__(self) -> None:
         max_tile_map = {
@@ -46,5 +51,11 @@ class Tile:
         ):
             raise ValueError
 
+        if self.is_red and (
+            self.tile_type not in {TileType.MAN, TileType.PIN, TileType.SOU}
+            or self.value != 5
+        ):
+            raise ValueError
+
     def __repr__(self) -> str:
-        return f"{self.tile_type.name} {self.value}"
+        return f"{self.tile_type.name} {self.value}{' RED' if self.is_red else ''}"
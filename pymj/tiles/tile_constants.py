@@ -19,6 +19,7 @@ _LEFT_EDGE_WAIT_STARTS = (_MANS[0], _PINS[0], _SOUS[0])
 _RIGHT_EDGE_WAIT_STARTS = (_MANS[7], _PINS[7], _SOUS[7])
 
 _SIMPLES = _MANS[1:8] + _PINS[1:8] + _SOUS[1:8]
+_RED_FIVES = (_MANS[4], _PINS[4], _SOUS[4])
 _GREENS = (_SOUS[1], _SOUS[2], _SOUS[3], _SOUS[5], _SOUS[7], _DRAGONS[1])
 
 _IS_SEQUENCE_STARTS = [tile in _SEQUENCE_STARTS for tile in _ALL]
@@ -47,6 +48,7 @@ class Tiles:
         LEFT_EDGE_WAIT_STARTS: Valid starting indices for left edge waits
         RIGHT_EDGE_WAIT_STARTS: Valid starting indices for right edge waits
         SIMPLES: Simple number tiles ranging from 2 to 8
+        RED_FIVES: Five tiles that have a red copy, in the order of red five bits
         GREENS: Tiles used in all-green combinations
         IS_SEQUENCE_STARTS: Boolean flags for valid sequence starts
         IS_SIDE_WAIT_STARTS: Boolean flags for valid side waits
@@ -74,6 +76,7 @@ class Tiles:
     RIGHT_EDGE_WAIT_STARTS = _RIGHT_EDGE_WAIT_STARTS
 
     SIMPLES = _SIMPLES
+    RED_FIVES = _RED_FIVES
     GREENS = _GREENS
 
     IS_SEQUENCE_STARTS = _IS_SEQUENCE_STARTS
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import operator
 from collections.abc import Iterable, Iterator, Sequence
 from typing import SupportsIndex
 
 from pymj.tiles.tile import Tile
+from pymj.tiles.tile_constants import Tiles
 from pymj.tiles.tile_mapping import TileMapping
 
+_RED_BITS = {tile: 1 << bit for bit, tile in enumerate(Tiles.RED_FIVES)}
+
 
 class TileCount:
     """A class for counting mahjong tiles using a fixed-length array representation.
@@ -24,9 +28,14 @@ class TileCount:
     This array-based representation enables efficient operations for hand analysis,
     such as checking completeness or calculating possible tile combinations.
 
+    Red fives are not given slots of their own. They are tracked in a side bitmask
+    instead, so that the 34-length counts used by the hand checkers stay unchanged.
+
     Attributes:
         _counts (list[int]): A 34-element integer list where each element represents
             the count of a specific tile type (0-4 tiles possible per type).
+        red_mask (int): Bitmask of red fives among the counted tiles. Bit 0, 1 and 2
+            stand for the red five of Man, Pin and Sou respectively.
 
     Examples:
         A typical hand string "1112345678999m" would be represented as follows:
@@ -38,7 +47,7 @@ class TileCount:
 
     """
 
-    def __init__(self, counts: list[int] | None = None) -> None:
+    def __init__(self, counts: list[int] | None = None, red_mask: int = 0) -> None:
         """Initialize a new TileCount instance with optional initial counts.
 
         Creates a new TileCount object with either provided tile counts or empty counts.
@@ -47,6 +56,8 @@ class TileCount:
         Args:
             counts (list[int] | None, optional): List of 34 integers representing tile
                 counts. If None, initializes all counts to 0. Defaults to None.
+            red_mask (int, optional): Bitmask of red fives among the counted tiles.
+                Defaults to 0.
 
         Raises:
             ValueError: If the provided counts list does not have exactly 34 elements,
@@ -59,6 +70,7 @@ class TileCount:
             if len(counts) != 34:
                 raise ValueError
             self._counts = counts[:]
+        self.red_mask = red_mask
 
     @property
     def num_tiles(self) -> int:
@@ -79,6 +91,16 @@ class TileCount:
         """
         return sum(self._counts)
 
+    @property
+    def num_red_fives(self) -> int:
+        """Count the red fives in this TileCount instance.
+
+        Returns:
+            int: The number of red fives, between 0 and 3.
+
+        """
+        return self.red_mask.bit_count()
+
     @staticmethod
     def create_from_indices(tiles: Iterable[int]) -> TileCount:
         """Create a new TileCount instance from a sequence of tile indices.
@@ -114,7 +136,8 @@ class TileCount:
 
         A factory method similar to create_from_indices but works with Tile objects.
         The method first converts each Tile object into its corresponding index
-        using TileMapping, then creates a count of these indices.
+        using TileMapping, then creates a count of these indices. Red fives among
+        the tiles are recorded in red_mask.
 
         Args:
             tiles (Iterable[Tile]): A sequence of Tile objects to be counted.
@@ -129,26 +152,67 @@ class TileCount:
             2
 
         """
-        return TileCount.create_from_indices(
-            TileMapping.tile_to_index(tile) for tile in tiles
-        )
+        tile_count = TileCount()
+        for tile in tiles:
+            tile_count[TileMapping.tile_to_index(tile)] += 1
+            tile_count.red_mask |= TileMapping.tile_to_red_mask(tile)
+        return tile_count
+
+    @staticmethod
+    def unpack(packed: int) -> TileCount:
+        """Create a new TileCount instance from its packed integer encoding.
+
+        Args:
+            packed (int): Integer returned by `pack`.
+
+        Returns:
+            TileCount: A new instance equal to the packed one.
+
+        Example:
+            >>> TileCount.unpack(TileCount([2,1,0] + [0]*31).pack())[0]
+            2
+
+        """
+        counts = [(packed >> (3 * index)) & 0b111 for index in range(34)]
+        return TileCount(counts, packed >> (3 * 34))
+
+    def pack(self) -> int:
+        """Pack the counts and red fives into a single integer.
+
+        Each tile type takes 3 bits, from the lowest bits for 1-man upwards, and
+        red_mask is stored above them. Packed counts are hashable and cheap to
+        compare, so they serve as keys of caches and transposition tables.
+
+        Returns:
+            int: Packed encoding, which `unpack` converts back.
+
+        Example:
+            >>> TileCount([2,1,0] + [0]*31).pack()
+            10
+
+        """
+        packed = self.red_mask
+        for count in reversed(self._counts):
+            packed = (packed << 3) | count
+        return packed
 
     def __eq__(self, other: object) -> bool:
         """Compare this TileCount instance with another for equality.
 
         Checks if two TileCount instances represent the same tile distribution by
-        comparing their internal count arrays. Equality means that both instances have
-        exactly the same number of each tile type.
+        comparing their internal count arrays and red fives. Equality means that both
+        instances have exactly the same number of each tile type and the same red
+        fives among them.
 
         Args:
             other (object): The object to compare against this TileCount instance. Can
                 be any type, but only returns True if it's another TileCount with
-                identical counts.
+                identical counts and red fives.
 
         Returns:
-            bool: True if 'other' is a TileCount instance with identical tile counts,
-                False in all other cases (including comparison with non-TileCount
-                objects).
+            bool: True if 'other' is a TileCount instance with identical tile counts
+                and red fives, False in all other cases (including comparison with
+                non-TileCount objects).
 
         Example:
             >>> tc1 = TileCount([1,1,1] + [0]*31)  # Three tiles: one each of first
@@ -160,14 +224,14 @@ class TileCount:
         """
         if not isinstance(other, TileCount):
             return False
-        return self._counts == other._counts
+        return self._counts == other._counts and self.red_mask == other.red_mask
 
     def __add__(self, other: TileCount) -> TileCount:
         """Add two TileCount instances element-wise.
 
         Creates a new TileCount instance by summing the corresponding tile counts from
         both operands. This is used when combining tile counts from different hands or
-        sets.
+        sets. Red fives of both operands are kept.
 
         Args:
            other (TileCount): Another TileCount instance whose counts will be added to
@@ -187,6 +251,7 @@ class TileCount:
         """
         return TileCount(
             [count1 + count2 for count1, count2 in zip(self, other, strict=False)],
+            self.red_mask | other.red_mask,
         )
 
     def __getitem__(self, key: SupportsIndex) -> int:
@@ -209,6 +274,8 @@ class TileCount:
     def __setitem__(self, key: SupportsIndex, value: int) -> None:
         """Set the count value for a specified mahjong tile type.
 
+        Setting the count of a five to 0 also drops its red five from red_mask.
+
         Args:
             key (SupportsIndex): Index of the tile type (0-33) to modify.
             value (int): New count value to set for the specified tile.
@@ -223,6 +290,8 @@ class TileCount:
 
         """
         self._counts[key] = value
+        if not value and self.red_mask:
+            self.red_mask &= ~_RED_BITS.get(operator.index(key) % 34, 0)
 
     def __iter__(self) -> Iterator[int]:
         """Create an iterator for sequentially accessing all tile counts.
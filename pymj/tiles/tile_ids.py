@@ -0,0 +1,175 @@
+import numpy as np
+import numpy.typing as npt
+
+# A 136-tile id is tile index * 4 + copy. With red fives, copy 0 of each five is red.
+RED_FIVE_IDS136 = (16, 52, 88)
+
+
+def id136_to_index(tile_id: int) -> int:
+    """Convert a 136-tile id to its tile index.
+
+    Args:
+        tile_id (int): Tile id between 0 and 135.
+
+    Returns:
+        int: Tile index between 0 and 33.
+
+    Raises:
+        ValueError: If the tile id is not within the valid range [0, 135].
+
+    """
+    if not 0 <= tile_id <= 135:
+        raise ValueError
+    return tile_id >> 2
+
+
+def index_to_id136(index: int, copy: int = 0) -> int:
+    """Convert a tile index to the 136-tile id of one of its copies.
+
+    Args:
+        index (int): Tile index between 0 and 33.
+        copy (int, optional): Copy of the tile between 0 and 3. Defaults to 0.
+
+    Returns:
+        int: Tile id between 0 and 135.
+
+    Raises:
+        ValueError: If index or copy is out of range.
+
+    """
+    if not 0 <= index <= 33 or not 0 <= copy <= 3:
+        raise ValueError
+    return (index << 2) | copy
+
+
+def is_red_id136(tile_id: int) -> bool:
+    """Check whether a 136-tile id is a red five.
+
+    Args:
+        tile_id (int): Tile id between 0 and 135.
+
+    Returns:
+        bool: True if the tile id is one of the red fives.
+
+    """
+    return tile_id in RED_FIVE_IDS136
+
+
+def ids136_to_indices(ids: npt.ArrayLike) -> npt.NDArray[np.integer]:
+    """Convert an array of 136-tile ids to tile indices element-wise.
+
+    Args:
+        ids (npt.ArrayLike): Integer array of tile ids between 0 and 135.
+
+    Returns:
+        npt.NDArray[np.integer]: Array of tile indices with the same shape.
+
+    Raises:
+        ValueError: If any tile id is out of range.
+
+    """
+    ids_array = np.asarray(ids)
+    if ids_array.size and (ids_array.min() < 0 or ids_array.max() > 135):
+        raise ValueError
+    indices: npt.NDArray[np.integer] = np.right_shift(ids_array, 2)
+    return indices
+
+
+def indices_to_ids136(indices: npt.ArrayLike) -> npt.NDArray[np.integer]:
+    """Convert tile indices of hands to distinct 136-tile ids.
+
+    Repeated indices along the last axis, i.e. within one hand, are given distinct
+    copies. Copies are handed out from the last one, so a red five is only used
+    when a hand holds all four copies of a five.
+
+    Args:
+        indices (npt.ArrayLike): Integer array of tile indices between 0 and 33.
+            The last axis holds the tiles of a single hand.
+
+    Returns:
+        npt.NDArray[np.integer]: Array of tile ids with the same shape.
+
+    Raises:
+        ValueError: If any index is out of range or a hand holds more than four
+            copies of a tile.
+
+    """
+    indices_array = np.asarray(indices)
+    if indices_array.size and (indices_array.min() < 0 or indices_array.max() > 33):
+        raise ValueError
+    if indices_array.ndim == 0 or indices_array.size == 0:
+        ids: npt.NDArray[np.integer] = np.left_shift(indices_array, 2) | 3
+        return ids
+
+    hands = indices_array.reshape(-1, indices_array.shape[-1])
+    order = np.argsort(hands, axis=1, kind="stable")
+    sorted_hands = np.take_along_axis(hands, order, axis=1)
+
+    positions = np.broadcast_to(np.arange(hands.shape[1]), hands.shape)
+    is_run_start = np.ones(hands.shape, dtype=bool)
+    is_run_start[:, 1:] = sorted_hands[:, 1:] != sorted_hands[:, :-1]
+    run_starts = np.maximum.accumulate(np.where(is_run_start, positions, 0), axis=1)
+    sorted_copies = positions - run_starts
+    if sorted_copies.max() > 3:
+        raise ValueError
+
+    copies = np.empty_like(sorted_copies)
+    np.put_along_axis(copies, order, sorted_copies, axis=1)
+    ids = (np.left_shift(hands, 2) | (3 - copies)).reshape(indices_array.shape)
+    return ids
+
+
+def ids136_to_counts(ids: npt.ArrayLike) -> npt.NDArray[np.uint8]:
+    """Count tiles of hands given as 136-tile ids.
+
+    Negative ids are treated as padding, so hands with fewer tiles (e.g. after
+    calls) can share one rectangular array.
+
+    Args:
+        ids (npt.ArrayLike): Integer array of shape (N, k) holding k tile ids for
+            each of N hands, or of shape (k,) for a single hand.
+
+    Returns:
+        npt.NDArray[np.uint8]: Tile counts of shape (N, 34), or (34,) for a single
+            hand, in the layout of `TileCount`.
+
+    Raises:
+        ValueError: If any tile id is greater than 135 or the array is not one or
+            two dimensional.
+
+    """
+    ids_array = np.asarray(ids)
+    if ids_array.ndim not in (1, 2):
+        raise ValueError
+    if ids_array.size and ids_array.max() > 135:
+        raise ValueError
+
+    hands = ids_array.reshape(-1, ids_array.shape[-1])
+    num_hands = hands.shape[0]
+    offsets = np.right_shift(hands, 2) + 34 * np.arange(num_hands)[:, np.newaxis]
+    offsets = offsets[hands >= 0]
+    counts = np.bincount(offsets, minlength=34 * num_hands).astype(np.uint8)
+    hand_counts = counts.reshape(num_hands, 34)
+    return hand_counts[0] if ids_array.ndim == 1 else hand_counts
+
+
+def ids136_to_red_masks(ids: npt.ArrayLike) -> npt.NDArray[np.uint8]:
+    """Calculate red five bitmasks of hands given as 136-tile ids.
+
+    Args:
+        ids (npt.ArrayLike): Integer array of shape (N, k) holding k tile ids for
+            each of N hands, or of shape (k,) for a single hand.
+
+    Returns:
+        npt.NDArray[np.uint8]: Red five bitmasks of shape (N,), or a 0-dimensional
+            array for a single hand, in the layout of `TileCount.red_mask`.
+
+    """
+    ids_array = np.asarray(ids)
+    is_red = ids_array[..., np.newaxis] == np.array(RED_FIVE_IDS136)
+    red_bits = np.array([1, 2, 4], dtype=np.uint8)
+    red_masks: npt.NDArray[np.uint8] = (is_red.any(axis=-2) * red_bits).sum(
+        axis=-1,
+        dtype=np.uint8,
+    )
+    return red_masks
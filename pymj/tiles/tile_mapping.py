@@ -1,5 +1,6 @@
 from pymj.enums.tile_type import TileType
 from pymj.tiles.tile import Tile
+from pymj.tiles.tile_constants import Tiles
 
 
 class TileMapping:
@@ -76,3 +77,21 @@ class TileMapping:
             return Tile(TileType.DRAGON, index - 30)
         else:
             raise ValueError
+
+    @staticmethod
+    def tile_to_red_mask(tile: Tile) -> int:
+        """Convert a mahjong tile to its bit in red five bitmasks.
+
+        Bit 0, 1 and 2 stand for the red five of Man, Pin and Sou respectively,
+        following the order of Tiles.RED_FIVES.
+
+        Args:
+            tile (Tile): A Tile object representing a mahjong tile.
+
+        Returns:
+            int: The bit of the tile if it is a red five, 0 otherwise.
+
+        """
+        if not tile.is_red:
+            return 0
+        return 1 << Tiles.RED_FIVES.index(TileMapping.tile_to_index(tile))
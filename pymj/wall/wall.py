@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_ids import ids136_to_counts, ids136_to_red_masks
+
+NUM_TILES = 136
+NUM_PLAYERS = 4
+HAND_SIZE = 13
+DEAD_WALL_SIZE = 14
+MAX_KANS = 4
+
+# The tiles are dealt from the front of the wall: player p receives positions
+# 13p to 13p+12, and draws continue from position 52. The last 14 positions are
+# the dead wall, holding replacement tiles for kans and the dora indicators.
+LIVE_WALL_START = NUM_PLAYERS * HAND_SIZE
+DEAD_WALL_START = NUM_TILES - DEAD_WALL_SIZE
+REPLACEMENT_POSITIONS = tuple(range(DEAD_WALL_START, DEAD_WALL_START + MAX_KANS))
+DORA_INDICATOR_POSITIONS = tuple(range(DEAD_WALL_START + 4, DEAD_WALL_START + 9))
+URA_DORA_INDICATOR_POSITIONS = tuple(range(DEAD_WALL_START + 9, NUM_TILES))
+
+_DORA_OF_INDICATOR = (
+    tuple((index + 1) % 9 + suit for suit in (0, 9, 18) for index in range(9))
+    + tuple(27 + (index + 1) % 4 for index in range(4))
+    + tuple(31 + (index + 1) % 3 for index in range(3))
+)
+
+
+def indicator_to_dora(indicator: int) -> int:
+    """Convert a dora indicator to the dora it indicates.
+
+    Args:
+        indicator (int): Tile index of the dora indicator.
+
+    Returns:
+        int: Tile index of the dora, i.e. the next tile in the cycle of its kind
+            (1-9 for each suit, East-South-West-North, White-Green-Red).
+
+    """
+    return _DORA_OF_INDICATOR[indicator]
+
+
+def shuffle_batch(num_walls: int, rng: np.random.Generator) -> npt.NDArray[np.uint8]:
+    """Shuffle many walls at once.
+
+    Args:
+        num_walls (int): Number of walls N to shuffle.
+        rng (np.random.Generator): Random number generator. Walls are reproducible
+            for a generator created with the same seed.
+
+    Returns:
+        npt.NDArray[np.uint8]: Array of shape (N, 136), each row a permutation of
+            the 136-tile ids.
+
+    """
+    ids = np.broadcast_to(np.arange(NUM_TILES, dtype=np.uint8), (num_walls, NUM_TILES))
+    walls: npt.NDArray[np.uint8] = rng.permuted(ids, axis=1)
+    return walls
+
+
+def deal_batch(walls: npt.NDArray[np.integer]) -> npt.NDArray[np.uint8]:
+    """Deal the starting hands of many walls as tile counts.
+
+    Args:
+        walls (npt.NDArray[np.integer]): Walls of shape (N, 136), e.g. from
+            `shuffle_batch`.
+
+    Returns:
+        npt.NDArray[np.uint8]: Tile counts of shape (N, 4, 34) for each player.
+
+    """
+    num_walls = walls.shape[0]
+    hands = walls[:, :LIVE_WALL_START].reshape(num_walls * NUM_PLAYERS, HAND_SIZE)
+    return ids136_to_counts(hands).reshape(num_walls, NUM_PLAYERS, 34)
+
+
+class Wall:
+    """A shuffled wall of 136 tiles with its dead wall.
+
+    Tiles are held as 136-tile ids (see `pymj.tiles.tile_ids`), so dealing and
+    drawing never create Tile objects.
+
+    Attributes:
+        tile_ids (npt.NDArray[np.uint8]): The 136 tile ids in wall order.
+        num_kans (int): Number of replacement tiles drawn for kans.
+
+    """
+
+    def __init__(self, tile_ids: npt.ArrayLike):
+        """Initialize a wall from tile ids in wall order.
+
+        Args:
+            tile_ids (npt.ArrayLike): Permutation of the 136 tile ids.
+
+        Raises:
+            ValueError: If tile_ids is not a permutation of the 136 tile ids.
+
+        """
+        self.tile_ids = np.asarray(tile_ids, dtype=np.uint8)
+        if (
+            self.tile_ids.shape != (NUM_TILES,)
+            or (np.bincount(self.tile_ids, minlength=NUM_TILES) != 1).any()
+        ):
+            raise ValueError
+
+        self.num_kans = 0
+        self._next_position = LIVE_WALL_START
+
+    @staticmethod
+    def shuffle(rng: np.random.Generator) -> Wall:
+        """Create a randomly shuffled wall.
+
+        Args:
+            rng (np.random.Generator): Random number generator.
+
+        Returns:
+            Wall: A new wall.
+
+        """
+        return Wall(rng.permutation(NUM_TILES))
+
+    @property
+    def num_remaining(self) -> int:
+        """Count tiles that can still be drawn from the live wall.
+
+        Returns:
+            int: Number of remaining draws, which shrinks by one for each kan.
+
+        """
+        return DEAD_WALL_START - self.num_kans - self._next_position
+
+    @property
+    def dora_indicators(self) -> list[int]:
+        """Tile indices of the revealed dora indicators.
+
+        Returns:
+            list[int]: One indicator, plus one more for each kan.
+
+        """
+        positions = DORA_INDICATOR_POSITIONS[: self.num_kans + 1]
+        return [int(tile_id) >> 2 for tile_id in self.tile_ids[list(positions)]]
+
+    @property
+    def ura_dora_indicators(self) -> list[int]:
+        """Tile indices of the ura dora indicators under the revealed indicators.
+
+        Returns:
+            list[int]: As many indicators as dora_indicators.
+
+        """
+        positions = URA_DORA_INDICATOR_POSITIONS[: self.num_kans + 1]
+        return [int(tile_id) >> 2 for tile_id in self.tile_ids[list(positions)]]
+
+    def deal_ids(self) -> npt.NDArray[np.uint8]:
+        """Deal the starting hands as tile ids.
+
+        Returns:
+            npt.NDArray[np.uint8]: Tile ids of shape (4, 13) for each player.
+
+        """
+        return self.tile_ids[:LIVE_WALL_START].reshape(NUM_PLAYERS, HAND_SIZE)
+
+    def deal(self) -> list[TileCount]:
+        """Deal the starting hands as tile counts.
+
+        Returns:
+            list[TileCount]: Counts of the starting hand of each player, with red
+                fives in red_mask.
+
+        """
+        hand_ids = self.deal_ids()
+        return [
+            TileCount(counts, red_mask)
+            for counts, red_mask in zip(
+                ids136_to_counts(hand_ids).tolist(),
+                ids136_to_red_masks(hand_ids).tolist(),
+                strict=True,
+            )
+        ]
+
+    def deal_packed(self) -> list[int]:
+        """Deal the starting hands as packed tile counts.
+
+        Returns:
+            list[int]: Packed counts of each player, see `TileCount.pack`.
+
+        """
+        return [tile_count.pack() for tile_count in self.deal()]
+
+    def draw(self) -> int:
+        """Draw the next tile from the live wall.
+
+        Returns:
+            int: Tile id of the drawn tile.
+
+        Raises:
+            ValueError: If the live wall is exhausted.
+
+        """
+        if self.num_remaining == 0:
+            raise ValueError
+        tile_id = int(self.tile_ids[self._next_position])
+        self._next_position += 1
+        return tile_id
+
+    def draw_replacement(self) -> int:
+        """Draw a replacement tile from the dead wall after a kan.
+
+        The dead wall is refilled from the end of the live wall, and a new dora
+        indicator is revealed.
+
+        Returns:
+            int: Tile id of the replacement tile.
+
+        Raises:
+            ValueError: If four kans were already made or the live wall is
+                exhausted.
+
+        """
+        if self.num_kans == MAX_KANS or self.num_remaining == 0:
+            raise ValueError
+        tile_id = int(self.tile_ids[REPLACEMENT_POSITIONS[self.num_kans]])
+        self.num_kans += 1
+        return tile_id
@@ -0,0 +1,117 @@
+import pytest
+
+from pymj.analysis.call_analyzer import analyze_call_options, analyze_kan_options
+from pymj.enums.call_option import CallOption
+from pymj.enums.call_type import CallType
+from pymj.enums.player_relation import PlayerRelation
+from pymj.tiles.tile_count import TileCount
+
+
+def test_analyze_chii_options(parse_hand_info):
+    # Given: hand that can chii 5m in two ways
+    hand_info = parse_hand_info("346m456p789s1122z")
+
+    # When: analyze_call_options on 5m from the previous player
+    results = analyze_call_options(hand_info, 4, PlayerRelation.PREV)
+
+    # Then: both chii reach tenpai on 1z and 2z with the leftover man discarded
+    assert [result.option for result in results] == [
+        CallOption(CallType.CHII, (4, 2, 3)),
+        CallOption(CallType.CHII, (4, 3, 5)),
+    ]
+    assert [result.discard_tile for result in results] == [5, 2]
+    assert all(result.shanten == 0 for result in results)
+    assert all(result.ukeire == [27, 28] for result in results)
+    assert all(result.num_ukeire == 4 for result in results)
+
+    # Then: no chii from other players
+    assert analyze_call_options(hand_info, 4, PlayerRelation.ACROSS) == []
+
+
+def test_analyze_pon_and_kan_options(parse_hand_info):
+    # Given: hand holding three 1m and a lone 9m
+    hand_info = parse_hand_info("1119m456p78s1122z")
+
+    # When: analyze_call_options on 1m
+    results = analyze_call_options(hand_info, 0, PlayerRelation.NEXT)
+
+    # Then: pon and kan are both analyzed
+    assert {result.option.call_type for result in results} == {
+        CallType.PON,
+        CallType.BIG_MELDED_KAN,
+    }
+    pon = next(result for result in results if result.option.call_type is CallType.PON)
+    kan = next(result for result in results if result.discard_tile is None)
+    assert pon.discard_tile != 0
+    assert kan.shanten >= pon.shanten
+
+    # Then: no kan when kans are exhausted
+    results = analyze_call_options(hand_info, 0, PlayerRelation.NEXT, can_kan=False)
+    assert [result.option.call_type for result in results] == [CallType.PON]
+
+
+def test_swap_discards_are_forbidden(parse_hand_info):
+    # Given: hand where chii of 3m with 45m could swap to 6m
+    hand_info = parse_hand_info("456m456p789s1122z")
+
+    # When: analyze_call_options on 3m
+    results = analyze_call_options(hand_info, 2, PlayerRelation.PREV)
+
+    # Then: the other end of the sequence is not discarded
+    assert results[0].option == CallOption(CallType.CHII, (2, 3, 4))
+    assert results[0].discard_tile != 5
+
+    # Then: raise error for hand with winning tile
+    with pytest.raises(ValueError):
+        analyze_call_options(
+            parse_hand_info("456m456p789s11222z"),
+            2,
+            PlayerRelation.PREV,
+        )
+
+
+def test_analyze_kan_options_keeping_waits(parse_hand_info):
+    # Given: tenpai hand on 2z drawing the fourth 1z
+    hand_info = parse_hand_info("123m456p789s1112z", "1z")
+
+    # When: analyze_kan_options
+    (result,) = analyze_kan_options(hand_info)
+
+    # Then: concealed kan keeps the waits and is allowed in riichi
+    assert result.option == CallOption(CallType.CONCEALED_KAN, (27,) * 4)
+    assert (result.shanten_before, result.shanten_after) == (0, 0)
+    assert result.waits_before == result.waits_after == [28]
+    assert result.is_riichi_legal
+
+
+def test_analyze_kan_options_changing_waits(parse_hand_info):
+    # Given: tenpai hand on 2m and 3m drawing the fourth 1m
+    hand_info = parse_hand_info("1113m456p789s777z", "1m")
+
+    # When: analyze_kan_options
+    (result,) = analyze_kan_options(hand_info)
+
+    # Then: concealed kan loses the 2m wait and is not allowed in riichi
+    assert result.waits_before == [1, 2]
+    assert result.waits_after == [2]
+    assert result.ukeire_delta < 0
+    assert not result.is_riichi_legal
+
+
+def test_analyze_small_melded_kan_option(parse_hand_info):
+    # Given: hand with a pon of 5z drawing the fourth 5z
+    hand_info = parse_hand_info("23m456p789s11z", "5z")
+    hand_info.call_counts = [(CallType.PON, TileCount.create_from_indices([31] * 3))]
+
+    # When: analyze_kan_options
+    (result,) = analyze_kan_options(hand_info)
+
+    # Then: small melded kan keeps the waits
+    assert result.option == CallOption(CallType.SMALL_MELDED_KAN, (31,) * 4)
+    assert result.waits_before == result.waits_after == [0, 3]
+    assert result.ukeire_delta == 0
+    assert not result.is_riichi_legal
+
+    # Then: raise error for hand without drawn tile
+    with pytest.raises(ValueError):
+        analyze_kan_options(parse_hand_info("123m456p789s1112z"))
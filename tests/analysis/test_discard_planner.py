@@ -0,0 +1,63 @@
+import pytest
+
+from pymj.analysis.discard_planner import plan_discard
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.hand_parser import HandParser
+from pymj.tiles.tile_count import TileCount
+
+
+def test_plan_discard_of_tenpai_hand(parse_hand_info):
+    # Given: tenpai hand waiting on 1z and 2z which draws 5z
+    hand_info = parse_hand_info("123m456p789s1122z", "5z")
+
+    # When: plan_discard one draw ahead
+    plan = plan_discard(hand_info, depth=1)
+
+    # Then: discarding 5z keeps 4 winning tiles of 122 unseen
+    assert plan.discard_tile == 31
+    assert plan.depth == 1
+    assert plan.probability == pytest.approx(4 / 122)
+    assert plan.probabilities[27] == 0
+
+    # When: plan_discard more draws ahead
+    deeper_plan = plan_discard(hand_info, depth=2)
+
+    # Then: probability grows with the draws
+    assert deeper_plan.discard_tile == 31
+    assert deeper_plan.depth == 2
+    assert deeper_plan.probability > plan.probability
+    assert deeper_plan.num_nodes > 0
+
+
+def test_plan_discard_with_pool(parse_hand_info):
+    # Given: tenpai hand whose 2z are no longer in the pool
+    hand_info = parse_hand_info("123m456p789s1122z", "5z")
+    pool = TileCount([4 - count for count in hand_info.total_count])
+    pool[28] = 0
+
+    # When: plan_discard one draw ahead
+    plan = plan_discard(hand_info, pool, depth=1)
+
+    # Then: only 1z can win
+    assert plan.probability == pytest.approx(2 / 120)
+
+
+def test_plan_discard_with_deadline(parse_hand_info):
+    # Given: 2-shanten hand
+    hand_info = parse_hand_info("12m456p789s11345z", "7z")
+
+    # When: plan_discard without time to search
+    plan = plan_discard(hand_info, depth=10, deadline_ms=0)
+
+    # Then: a discard from the hand is returned with the depths needing no search
+    assert plan.depth == 2
+    assert plan.num_nodes == 0
+    assert hand_info.total_count[plan.discard_tile] > 0
+
+    # Then: raise error for hand without drawn tile or negative depth
+    with pytest.raises(ValueError):
+        plan_discard(
+            HandInfo.create_from_hand(HandParser.parse_hand("12m456p789s1134z")),
+        )
+    with pytest.raises(ValueError):
+        plan_discard(hand_info, depth=-1)
@@ -0,0 +1,80 @@
+from math import comb
+
+import pytest
+
+from pymj.analysis.exact_win_probability import calculate_win_probability
+from pymj.analysis.win_probability import estimate_win_probability
+from pymj.enums.exact_win_probability_data import ExactWinProbabilityData
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.hand_parser import HandParser
+from pymj.tiles.tile_count import TileCount
+
+
+@pytest.mark.parametrize("draws", [0, 1, 3, 10])
+def test_calculate_win_probability_of_tenpai_hand(draws):
+    # Given: tenpai hand waiting on 4 of 123 unseen tiles
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand("123m456p789s1122z"))
+
+    # When: calculate_win_probability
+    result = calculate_win_probability(hand_info, draws=draws)
+
+    # Then: probability is the chance of drawing any winning tile
+    expected = 1 - comb(119, draws) / comb(123, draws)
+    assert result.probability == pytest.approx(expected)
+    assert result.num_states == draws
+
+    # Then: tenpai is reached without exploring states
+    tenpai_result = calculate_win_probability(hand_info, draws=draws, target_shanten=0)
+    assert tenpai_result.probability == 1
+    assert tenpai_result.num_states == 0
+
+
+def test_calculate_win_probability_with_visible_tiles():
+    # Given: tenpai hand with 3 of its 4 winning tiles visible
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand("123m456p789s1122z"))
+    visible = TileCount.create_from_indices([27, 28, 28, 0, 0])
+
+    # When: calculate_win_probability within two draws
+    result = calculate_win_probability(hand_info, visible, draws=2)
+
+    # Then: probability is the chance of drawing the last winning tile
+    assert result.probability == pytest.approx(2 / 118)
+
+
+def test_calculate_win_probability_agrees_with_estimate():
+    # Given: 2-shanten hand
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand("13m456p789s11z345z"))
+
+    # When: calculate_win_probability and estimate_win_probability
+    tenpai = calculate_win_probability(hand_info, draws=6, target_shanten=0)
+    agari = calculate_win_probability(hand_info, draws=6)
+    estimate = estimate_win_probability(hand_info, draws=6, samples=20000, seed=0)
+
+    # Then: exact probabilities are within sampling error of estimates
+    assert tenpai.probability == pytest.approx(estimate.tenpai_probability, abs=0.01)
+    assert agari.probability == pytest.approx(estimate.agari_probability, abs=0.005)
+    assert 0 < agari.probability < tenpai.probability
+    assert agari.num_states > 0
+
+    # Then: states needing more draws than remain are pruned
+    assert calculate_win_probability(hand_info, draws=2) == ExactWinProbabilityData(
+        probability=0.0,
+        num_states=0,
+    )
+
+
+@pytest.mark.parametrize(
+    "hand_str, draws, target_shanten",
+    [
+        ("123m456p789s11223z", 1, -1),
+        ("123m456p789s1122z", 200, -1),
+        ("123m456p789s1122z", 1, 1),
+    ],
+)
+def test_calculate_win_probability_fail(hand_str, draws, target_shanten):
+    # Given: invalid hand, too many draws, or invalid target
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand(hand_str))
+
+    # Then: raise error
+    with pytest.raises(ValueError):
+        calculate_win_probability(hand_info, draws=draws, target_shanten=target_shanten)
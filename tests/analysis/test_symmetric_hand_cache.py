@@ -0,0 +1,86 @@
+import pytest
+
+from pymj.analysis.symmetric_hand_cache import SymmetricHandCache
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+
+
+class CountingChecker(CombinedHandChecker):
+    def __init__(self):
+        super().__init__()
+        self.num_efficiencies = 0
+
+    def calculate_efficiency(self, hand_info):
+        self.num_efficiencies += 1
+        return super().calculate_efficiency(hand_info)
+
+
+@pytest.mark.parametrize(
+    ("hand_str", "agari_tile_str"),
+    [
+        ("1123m468p3579s15z", "7z"),
+        ("2234m468s3579p15z", "7z"),
+        ("9987s642p7531m15z", "7z"),
+        ("1122m3344p5566s7z", "1z"),
+        ("19m19p19s1234567z", "2m"),
+        ("2345m67p9s,c<123s,p^111z", "8p"),
+    ],
+)
+def test_cached_results_match_checker(hand_str, agari_tile_str, parse_hand_info):
+    # Given: a cache and the checker it wraps
+    checker = CombinedHandChecker()
+    cache = SymmetricHandCache(checker)
+    hand_info = parse_hand_info(hand_str, agari_tile_str)
+
+    # When / Then: the cached efficiency matches the checker
+    assert cache.calculate_efficiency(hand_info) == checker.calculate_efficiency(
+        hand_info,
+    )
+    assert cache.calculate_shanten(hand_info) == checker.calculate_shanten(hand_info)
+
+    # When / Then: the cached shanten and waits of the hand before the draw match
+    hand_info.agari_tile = None
+    assert cache.calculate_shanten(hand_info) == checker.calculate_shanten(hand_info)
+    assert cache.calculate_waits(hand_info) == checker.calculate_waits(hand_info)
+
+
+def test_symmetric_hands_share_entries(parse_hand_info):
+    # Given: hands differing by suit permutation and mirroring
+    checker = CountingChecker()
+    cache = SymmetricHandCache(checker)
+    hands = [
+        parse_hand_info("1123m468p3579s15z", "7z"),
+        parse_hand_info("1123p468s3579m15z", "7z"),
+        parse_hand_info("9987s642m7531p15z", "7z"),
+    ]
+
+    # When: calculate their efficiency
+    efficiencies = [cache.calculate_efficiency(hand_info) for hand_info in hands]
+
+    # Then: the checker is asked once
+    assert checker.num_efficiencies == 1
+
+    # Then: the results are in the tiles of each hand
+    assert efficiencies[1] == CombinedHandChecker().calculate_efficiency(hands[1])
+    assert efficiencies[2] == CombinedHandChecker().calculate_efficiency(hands[2])
+
+
+def test_waits_mapped_back(parse_hand_info):
+    # Given: a tenpai hand and its mirror
+    cache = SymmetricHandCache(CombinedHandChecker())
+    hand_info = parse_hand_info("1112345678999m")
+    mirrored_hand_info = parse_hand_info("1112345678999p")
+
+    # When / Then: each gets the waits in its own suit
+    assert cache.calculate_waits(hand_info) == (1 << 9) - 1
+    assert cache.calculate_waits(mirrored_hand_info) == ((1 << 9) - 1) << 9
+
+
+def test_invalid_hands_raise(parse_hand_info):
+    # Given: a cache
+    cache = SymmetricHandCache(CombinedHandChecker())
+
+    # When / Then: waits need no winning tile, and efficiency needs one
+    with pytest.raises(ValueError):
+        cache.calculate_waits(parse_hand_info("1112345678999m", "1m"))
+    with pytest.raises(ValueError):
+        cache.calculate_efficiency(parse_hand_info("1112345678999m"))
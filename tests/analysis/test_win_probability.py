@@ -0,0 +1,75 @@
+import pytest
+
+from pymj.analysis.win_probability import estimate_win_probability
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.hand_parser import HandParser
+from pymj.tiles.tile_count import TileCount
+
+
+def test_estimate_win_probability_of_tenpai_hand():
+    # Given: tenpai hand waiting on 1z and 2z
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand("123m456p789s1122z"))
+
+    # When: estimate_win_probability within one draw
+    result = estimate_win_probability(hand_info, draws=1, samples=20000, seed=0)
+
+    # Then: hand is tenpai, and wins with 4 of 123 unseen tiles
+    assert result.num_samples == 20000
+    assert result.tenpai_probabilities == [1.0, 1.0]
+    assert result.agari_probabilities[0] == 0
+    assert result.agari_probability == pytest.approx(4 / 123, abs=0.005)
+
+
+def test_estimate_win_probability_with_visible_tiles():
+    # Given: tenpai hand whose winning tiles are all visible
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand("123m456p789s1122z"))
+    visible = TileCount.create_from_indices([27, 27, 28, 28])
+
+    # When: estimate_win_probability
+    result = estimate_win_probability(hand_info, visible, draws=5, samples=100)
+
+    # Then: hand never wins
+    assert result.agari_probabilities == [0.0] * 6
+
+
+def test_estimate_win_probability_reaches_tenpai():
+    # Given: 1-shanten hand
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand("13m456p789s11z345z"))
+
+    # When: estimate_win_probability within more draws
+    result = estimate_win_probability(hand_info, draws=6, samples=1000, seed=1)
+
+    # Then: probabilities grow with draws and winning implies tenpai
+    assert result.tenpai_probabilities[0] == 0
+    assert result.tenpai_probabilities == sorted(result.tenpai_probabilities)
+    assert result.agari_probabilities == sorted(result.agari_probabilities)
+    assert 0 < result.agari_probability < result.tenpai_probability < 1
+
+
+def test_estimate_win_probability_is_reproducible_across_workers():
+    # Given: 1-shanten hand
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand("13m456p789s11z345z"))
+
+    # When: estimate_win_probability with a seed in one and two processes
+    kwargs = {"draws": 4, "samples": 5000, "seed": 7}
+    result1 = estimate_win_probability(hand_info, **kwargs)
+    result2 = estimate_win_probability(hand_info, **kwargs, num_workers=2)
+
+    # Then: results are equal
+    assert result1 == result2
+
+
+@pytest.mark.parametrize(
+    "hand_str, draws",
+    [
+        ("123m456p789s11223z", 1),
+        ("123m456p789s1122z", 200),
+    ],
+)
+def test_estimate_win_probability_fail(hand_str, draws):
+    # Given: hand with invalid number of tiles, or too many draws
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand(hand_str))
+
+    # Then: raise error
+    with pytest.raises(ValueError):
+        estimate_win_probability(hand_info, draws=draws)
@@ -0,0 +1,121 @@
+import json
+import random
+
+import pytest
+
+from pymj.bench.__main__ import main
+from pymj.bench.compare import (
+    bootstrap_speedup_interval,
+    compare_results,
+    render_table,
+)
+
+
+def create_results(cases):
+    return {
+        "settings": {"size": 4, "rounds": 5, "seed": 2024},
+        "cases": {
+            name: {"round_ops_per_sec": samples} for name, samples in cases.items()
+        },
+    }
+
+
+def test_bootstrap_speedup_interval():
+    # Given: samples of a run twice as fast
+    rng = random.Random(1)
+    old_samples = [100 + rng.random() for _ in range(10)]
+    new_samples = [200 + rng.random() for _ in range(10)]
+
+    # When: estimate the interval of the speedup
+    lower, upper = bootstrap_speedup_interval(old_samples, new_samples)
+
+    # Then: it is around 2 and reproducible
+    assert 1.98 < lower <= upper < 2.02
+    assert bootstrap_speedup_interval(old_samples, new_samples) == (lower, upper)
+
+    # Then: single samples give the ratio itself
+    assert bootstrap_speedup_interval([100], [150]) == (1.5, 1.5)
+
+
+def test_compare_results():
+    # Given: runs with slower, faster, noisy, added and removed cases
+    old = create_results(
+        {
+            "slow": [100, 101, 99, 100, 100],
+            "fast": [100, 101, 99, 100, 100],
+            "noisy": [100, 60, 140, 100, 100],
+            "removed": [100],
+        },
+    )
+    new = create_results(
+        {
+            "slow": [80, 81, 79, 80, 80],
+            "fast": [150, 151, 149, 150, 150],
+            "noisy": [90, 50, 130, 95, 90],
+            "added": [100],
+        },
+    )
+
+    # When: compare the runs
+    rows = {row["name"]: row for row in compare_results(old, new)}
+
+    # Then: significant changes beyond the threshold are flagged
+    assert rows["slow"]["status"] == "regressed"
+    assert rows["slow"]["speedup"] == pytest.approx(0.8)
+    assert rows["fast"]["status"] == "improved"
+    assert rows["noisy"]["status"] == "unchanged"
+    assert rows["added"]["status"] == "added"
+    assert rows["removed"]["status"] == "removed"
+
+    # Then: a small regression is within a larger threshold
+    rows = {row["name"]: row for row in compare_results(old, new, threshold=0.25)}
+    assert rows["slow"]["status"] == "unchanged"
+
+
+def test_render_table():
+    # Given: a comparison
+    old = create_results({"case": [100, 100], "removed": [1]})
+    new = create_results({"case": [200, 200]})
+
+    # When: render it
+    lines = render_table(compare_results(old, new)).splitlines()
+
+    # Then: a header and a line per case are rendered
+    assert lines[0].split() == [
+        "case",
+        "old",
+        "ops/s",
+        "new",
+        "ops/s",
+        "speedup",
+        "interval",
+        "status",
+    ]
+    assert lines[1].split() == [
+        "case",
+        "100.0",
+        "200.0",
+        "2.000x",
+        "[2.000,",
+        "2.000]",
+        "improved",
+    ]
+    assert lines[2].split() == ["removed", "-", "-", "-", "-", "removed"]
+
+
+def test_main_compare_exit_status(tmp_path, capsys):
+    # Given: result files of a baseline and of slower and faster runs
+    paths = {}
+    for name, samples in (
+        ("old", [100, 101, 99]),
+        ("slow", [50, 51, 49]),
+        ("fast", [200, 201, 199]),
+    ):
+        paths[name] = tmp_path / f"{name}.json"
+        paths[name].write_text(json.dumps(create_results({"case": samples})))
+
+    # When / Then: regressions exit with status 1
+    assert main(["compare", str(paths["old"]), str(paths["slow"])]) == 1
+    assert "regressed" in capsys.readouterr().out
+    assert main(["compare", str(paths["old"]), str(paths["fast"])]) == 0
+    assert "improved" in capsys.readouterr().out
@@ -0,0 +1,62 @@
+import pytest
+
+from pymj.bench.corpora import CORPORA, create_corpus
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.hand_checker.seven_pair_checker import SevenPairChecker
+from pymj.hand_checker.thirteen_orphan_checker import ThirteenOrphanChecker
+
+
+def describe(hand_info):
+    return (
+        list(hand_info.concealed_count),
+        [(call_type, list(count)) for call_type, count in hand_info.call_counts],
+        hand_info.agari_tile,
+    )
+
+
+@pytest.mark.parametrize("name", list(CORPORA))
+def test_corpus_is_seeded_and_valid(name):
+    # When: create the corpus twice, and with another seed
+    hands = create_corpus(name, 16)
+    same_hands = create_corpus(name, 16)
+    other_hands = create_corpus(name, 16, seed=1)
+
+    # Then: the corpus only depends on its seed
+    assert [describe(hand) for hand in hands] == [describe(hand) for hand in same_hands]
+    assert [describe(hand) for hand in hands] != [
+        describe(hand) for hand in other_hands
+    ]
+
+    # Then: hands have 3n+1 concealed tiles and at most 4 copies of a tile
+    for hand_info in hands:
+        assert hand_info.concealed_count.num_tiles % 3 == 1
+        assert max(hand_info.total_count) <= 4
+
+
+@pytest.mark.parametrize(
+    ("name", "checker"),
+    [
+        ("winning", CombinedHandChecker()),
+        ("nine_gates", CombinedHandChecker()),
+        ("called", CombinedHandChecker()),
+        ("seven_pairs", SevenPairChecker()),
+        ("thirteen_orphans", ThirteenOrphanChecker()),
+    ],
+)
+def test_winning_corpora_are_complete(name, checker):
+    # Given: a corpus of winning hands
+    hands = create_corpus(name, 16)
+
+    # Then: every hand is complete
+    assert all(checker.check_agari(hand_info) for hand_info in hands)
+
+
+def test_tenpai_and_called_corpora():
+    # Given: tenpai and called corpora
+    checker = CombinedHandChecker()
+    tenpai_hands = create_corpus("tenpai", 16)
+    called_hands = create_corpus("called", 8)
+
+    # Then: tenpai hands are tenpai, and called hands have 1 to 4 calls
+    assert all(checker.calculate_shanten(hand) == 0 for hand in tenpai_hands)
+    assert sorted({len(hand.call_counts) for hand in called_hands}) == [1, 2, 3, 4]
@@ -0,0 +1,92 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from pymj.bench.import_time import (
+    BUDGET_PATH,
+    IMPORT_TARGETS,
+    find_over_budget,
+    measure_import_time,
+    parse_import_times,
+)
+
+
+def test_parse_import_times():
+    # Given: output of python -X importtime
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |     pymj",
+            "import time:        80 |        200 |   pymj.tiles",
+            "other output",
+        ],
+    )
+
+    # When: parse the output
+    times = parse_import_times(output)
+
+    # Then: self and cumulative times are found by module
+    assert times == {"pymj": (120, 120), "pymj.tiles": (80, 200)}
+
+
+def test_find_over_budget():
+    # Given: a budget
+    budget = {"pymj": 100, "pymj.tiles": 200}
+
+    # When / Then: modules over budget or without one are found
+    assert find_over_budget({"pymj": 100, "pymj.tiles": 150}, budget) == []
+    assert find_over_budget({"pymj": 101, "pymj.wall": 1}, budget) == [
+        "pymj",
+        "pymj.wall",
+    ]
+
+
+def test_budget_covers_targets():
+    # Given: the committed budget
+    budget = json.loads(BUDGET_PATH.read_text())
+
+    # Then: every target has a budget
+    assert set(budget) == set(IMPORT_TARGETS)
+
+
+def test_measure_import_time():
+    # When: measure the import time of the package
+    time = measure_import_time("pymj", repeat=1)
+
+    # Then: it is positive
+    assert time > 0
+
+
+def test_package_imports_lazily():
+    # Given: a fresh interpreter importing pymj
+    code = (
+        "import sys, pymj; "
+        "print(sorted(name for name in sys.modules if name.startswith('pymj'))); "
+        "print('numpy' in sys.modules); "
+        "print(pymj.HandParser.__name__); "
+        "print('pymj.tiles.hand_parser' in sys.modules)"
+    )
+
+    # When: run it
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    # Then: no subsystem is imported until one of its names is used
+    assert result.stdout.splitlines() == ["['pymj']", "False", "HandParser", "True"]
+
+
+def test_package_api():
+    # Given: the package
+    import pymj
+
+    # Then: every public name resolves, and others raise AttributeError
+    assert all(getattr(pymj, name) for name in pymj.__all__)
+    assert set(pymj.__all__) <= set(dir(pymj))
+    with pytest.raises(AttributeError):
+        _ = pymj.missing_name
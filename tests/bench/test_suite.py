@@ -0,0 +1,67 @@
+import json
+
+from pymj.bench.__main__ import main
+from pymj.bench.corpora import create_corpus
+from pymj.bench.suite import run_suite, time_case
+from pymj.hand_checker.normal_form_checker import NormalFormChecker
+
+
+def test_time_case():
+    # Given: an operation and a corpus
+    hands = create_corpus("winning", 4)
+
+    # When: time the operation over 3 rounds
+    result = time_case(NormalFormChecker().check_agari, hands, 3)
+
+    # Then: throughput and latencies are reported
+    assert result["num_hands"] == 4
+    assert len(result["round_ops_per_sec"]) == 3
+    assert result["ops_per_sec"] > 0
+    latency = result["latency_us"]
+    assert 0 < latency["p50"] <= latency["p90"] <= latency["p99"]
+
+
+def test_run_suite():
+    # When: run the check_agari cases of the suite
+    results = run_suite(size=4, rounds=1, case_filter="check_agari")
+
+    # Then: cases are named by checker, operation and corpus
+    assert results["settings"] == {"size": 4, "rounds": 1, "seed": 2024}
+    assert "normal/check_agari/winning" in results["cases"]
+    assert "combined/check_agari/thirteen_orphans" in results["cases"]
+    assert all("check_agari" in name for name in results["cases"])
+    assert results["skipped"] == []
+
+
+def test_run_suite_skips_unsupported_cases():
+    # When: run the divisions cases of the seven pairs checker
+    results = run_suite(size=4, rounds=1, case_filter="seven_pairs/calculate_div")
+
+    # Then: only its own form is timed
+    assert list(results["cases"]) == ["seven_pairs/calculate_divisions/seven_pairs"]
+    assert "seven_pairs/calculate_divisions/winning" in results["skipped"]
+
+
+def test_main_writes_json(tmp_path):
+    # Given: an output file
+    path = tmp_path / "results.json"
+
+    # When: run the command line without the run subcommand
+    status = main(["--size", "2", "--rounds", "1", "--filter", "normal/check_agari"])
+    status |= main(
+        [
+            "run",
+            "--size",
+            "2",
+            "--rounds",
+            "1",
+            "--filter",
+            "x/y",
+            "--output",
+            str(path),
+        ],
+    )
+
+    # Then: results are written as JSON
+    assert status == 0
+    assert json.loads(path.read_text())["cases"] == {}
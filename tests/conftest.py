@@ -1,6 +1,8 @@
 import pytest
 
 from pymj.enums.tile_type import TileType
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.hand_parser import HandParser
 from pymj.tiles.tile import Tile
 
 
@@ -15,3 +17,16 @@ def tiles():
     }
 
     return mans | pins | sous | winds | dragons
+
+
+@pytest.fixture
+def parse_hand_info():
+    def parse(hand_str, agari_tile_str=None, is_tsumo=False):
+        agari_tile = HandParser.parse_tile(agari_tile_str) if agari_tile_str else None
+        return HandInfo.create_from_hand(
+            HandParser.parse_hand(hand_str),
+            agari_tile,
+            is_tsumo,
+        )
+
+    return parse
@@ -0,0 +1,94 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from pymj.corpus.hand_corpus import HandCorpus, HandCorpusWriter
+from pymj.features import encode_counts
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.hand_parser import HandParser
+
+
+@pytest.fixture
+def hand_infos():
+    hand_strs = [
+        "123m406p789s1122z",
+        "23406m,c<789p,p^111z,k_0000s",
+        "19m19p19s1234567z",
+    ]
+    hand_infos = [
+        HandInfo.create_from_hand(HandParser.parse_hand(s)) for s in hand_strs
+    ]
+    hand_infos[1].agari_tile = HandParser.parse_tile("0m")
+    hand_infos[1].concealed_count[4] -= 1
+    hand_infos[1].is_tsumo = True
+    return hand_infos
+
+
+@pytest.fixture
+def corpus_path(tmp_path, hand_infos):
+    path = tmp_path / "hands.corpus"
+    with HandCorpusWriter(path, buffer_size=2) as writer:
+        for meta, hand_info in enumerate(hand_infos):
+            writer.append(hand_info, meta=meta)
+    return path
+
+
+def assert_same_hand(actual, expected):
+    assert actual.concealed_count == expected.concealed_count
+    assert actual.call_counts == expected.call_counts
+    assert actual.agari_tile == expected.agari_tile
+    assert actual.red_mask == expected.red_mask
+    assert actual.is_tsumo == expected.is_tsumo
+
+
+def test_write_and_read(corpus_path, hand_infos):
+    # When: open corpus
+    corpus = HandCorpus(corpus_path)
+
+    # Then: all hands are decoded as written
+    assert len(corpus) == len(hand_infos)
+    for index, hand_info in enumerate(hand_infos):
+        assert_same_hand(corpus[index], hand_info)
+    assert_same_hand(corpus[-1], hand_infos[-1])
+    assert corpus.metas.tolist() == [0, 1, 2]
+    assert corpus.agari_tiles.tolist() == [-1, 4, -1]
+
+
+def test_concealed_counts_are_views(corpus_path):
+    # Given: corpus
+    corpus = HandCorpus(corpus_path)
+
+    # When: slice concealed counts
+    counts = corpus.concealed_counts[1:3]
+
+    # Then: slice shares memory with the mapped records
+    assert np.shares_memory(counts, corpus.records)
+    assert encode_counts(counts).shape == (2, 9, 34)
+
+
+def test_chunks_and_pickle(corpus_path, hand_infos):
+    # Given: corpus
+    corpus = HandCorpus(corpus_path)
+
+    # Then: chunks cover all records
+    assert corpus.chunks(2) == [(0, 1), (1, 3)]
+    assert corpus.chunks(5) == [(0, 1), (1, 2), (2, 3)]
+
+    # Then: pickled corpus is reopened by path
+    unpickled = pickle.loads(pickle.dumps(corpus))
+    assert_same_hand(unpickled[1], hand_infos[1])
+
+
+def test_sample(corpus_path):
+    corpus = HandCorpus(corpus_path)
+    samples = corpus.sample(5, np.random.default_rng(0))
+    assert len(samples) == 5
+
+
+def test_open_fail_if_not_corpus(tmp_path):
+    path = tmp_path / "invalid.corpus"
+    path.write_bytes(b"not a corpus file")
+
+    with pytest.raises(ValueError):
+        HandCorpus(path)
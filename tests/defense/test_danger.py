@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from pymj.defense.danger import danger_matrix, danger_matrix_batch, defense_state
+from pymj.enums.defense_state_data import DefenseStateData
+from pymj.game.table import Table
+from pymj.tiles.tile_count import TileCount
+from tests.game.test_table import DEALER_HAND, OTHER_HANDS, TENPAI_HAND, stack_wall
+
+
+def create_state(safe_tiles=(), visible=None, is_riichi=True, num_discards=6):
+    safe_mask = sum(1 << tile for tile in safe_tiles)
+    return DefenseStateData(
+        safe_masks=[safe_mask, 0, 0],
+        is_riichi=[is_riichi, False, False],
+        num_discards=[num_discards, 0, 0],
+        visible=TileCount.create_from_indices(visible or []),
+    )
+
+
+def test_genbutsu_and_suji():
+    # Given: riichi opponent who discarded 4m
+    danger = danger_matrix(create_state(safe_tiles=[3]))
+
+    # Then: genbutsu is safe and suji are safer than the other tiles
+    assert danger.shape == (3, 34)
+    assert danger[0, 3] == 0
+    assert danger[0, 0] < danger[0, 8]
+    assert danger[0, 6] < danger[0, 4]
+    assert danger[0, 4] == danger[0, 13]
+
+    # Then: middle tiles are more dangerous than terminals
+    assert danger[0, 0] < danger[0, 1] < danger[0, 2] < danger[0, 4]
+
+    # Then: opponents not discarding anything yet are no threat
+    assert not danger[1:].any()
+
+
+@pytest.mark.parametrize(
+    "visible, tile, expected_reduction",
+    [
+        ([1] * 4, 0, "no chance"),
+        ([1] * 3, 0, "one chance"),
+        ([27] * 3, 27, "honor"),
+    ],
+)
+def test_visible_tiles(visible, tile, expected_reduction):
+    # Given: riichi opponent and visible tiles
+    base = danger_matrix(create_state())
+    danger = danger_matrix(create_state(visible=visible))
+
+    # Then: visible tiles make the tile safer
+    assert danger[0, tile] < base[0, tile], expected_reduction
+
+
+def test_riichi_weight():
+    # Given: opponent without riichi
+    riichi = danger_matrix(create_state())
+    early = danger_matrix(create_state(is_riichi=False, num_discards=3))
+    late = danger_matrix(create_state(is_riichi=False, num_discards=18))
+
+    # Then: danger grows with discards and is highest for riichi
+    assert (early[0] < late[0]).all()
+    assert (late[0] < riichi[0]).all()
+
+
+def test_danger_matrix_batch():
+    # Given: many game states
+    states = [create_state(safe_tiles=[tile]) for tile in range(34)]
+
+    # When: danger_matrix_batch
+    danger = danger_matrix_batch(states)
+
+    # Then: batch equals single evaluations
+    assert danger.shape == (34, 3, 34)
+    for state, matrix in zip(states, danger, strict=True):
+        np.testing.assert_array_equal(matrix, danger_matrix(state))
+
+
+def test_defense_state():
+    # Given: table after the dealer discards the drawn tile
+    wall = stack_wall([DEALER_HAND, TENPAI_HAND, *OTHER_HANDS], [33])
+    table = Table()
+    round_ = table.play_round(wall, dealer=0)
+    next(round_)
+    round_.send(0)
+
+    # When: defense_state of the next player
+    state = defense_state(table, 1)
+
+    # Then: the dealer is the last opponent, and the discard is safe against all
+    assert state.safe_masks == [1 << 33] * 3
+    assert state.num_discards == [0, 0, 1]
+    assert state.is_riichi == [False, False, False]
+    assert state.visible[33] == 1
+    # Then: hand with the drawn tile, discard and dora indicator are visible
+    assert state.visible.num_tiles == 13 + 1 + 1 + 1
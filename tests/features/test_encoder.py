@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from pymj.features import NUM_BASE_PLANES, encode_batch, encode_counts, num_planes
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.hand_parser import HandParser
+from pymj.tiles.tile_mapping import TileMapping
+
+
+def test_encode_counts():
+    # Given: count matrix of two hands, one with winning tile
+    concealed = np.zeros((2, 34), dtype=np.uint8)
+    concealed[0, [0, 1, 2]] = [1, 2, 4]
+    concealed[1, 33] = 3
+    called = np.zeros((2, 34), dtype=np.uint8)
+    called[1, 27] = 3
+    agari_tiles = np.array([-1, 33])
+
+    # When: encode_counts into preallocated buffer with an extra plane
+    out = np.full((2, NUM_BASE_PLANES + 1, 34), 7, dtype=np.uint8)
+    planes = encode_counts(concealed, called, agari_tiles, out=out)
+
+    # Then: buffer is filled in place and extra plane is untouched
+    assert planes is out
+    assert (out[:, NUM_BASE_PLANES] == 7).all()
+
+    # Then: count planes are thresholds of counts
+    assert out[0, 0:4, 0].tolist() == [1, 0, 0, 0]
+    assert out[0, 0:4, 1].tolist() == [1, 1, 0, 0]
+    assert out[0, 0:4, 2].tolist() == [1, 1, 1, 1]
+    assert out[1, 4:8, 27].tolist() == [1, 1, 1, 0]
+    assert out[0, 4:8].sum() == 0
+
+    # Then: winning tile plane is one-hot
+    assert out[0, 8].sum() == 0
+    assert out[1, 8].tolist() == [0] * 33 + [1]
+
+
+def test_encode_counts_fail_if_buffer_too_small():
+    with pytest.raises(ValueError):
+        encode_counts(np.zeros((2, 34)), out=np.zeros((2, 4, 34)))
+
+
+def test_encode_batch(tiles):
+    # Given: hand with a call and a drawn tile
+    hand = HandParser.parse_hand("123m456p78s11z,p^555z")
+    hand.draw_tile(tiles["9s"])
+    hand_info = HandInfo.create_from_hand(hand)
+
+    # When: encode_batch with shanten and ukeire planes
+    planes = encode_batch([hand_info], with_shanten=True, with_ukeire=True)
+
+    # Then: planes include concealed, called and winning tiles
+    assert planes.shape == (1, num_planes(True, True), 34)
+    index_9s = TileMapping.tile_to_index(tiles["9s"])
+    index_5z = TileMapping.tile_to_index(tiles["5z"])
+    assert planes[0, 0].sum() == 10
+    assert planes[0, 0:4].sum() == 11
+    assert planes[0, 0, index_9s] == 1
+    assert planes[0, 4:8, index_5z].tolist() == [1, 1, 1, 0]
+    assert planes[0, 8, index_9s] == 1
+
+    # Then: shanten plane holds agari and ukeire plane holds waits of 78s
+    assert (planes[0, NUM_BASE_PLANES] == -1).all()
+    ukeire = np.flatnonzero(planes[0, NUM_BASE_PLANES + 1]).tolist()
+    assert ukeire == [TileMapping.tile_to_index(tiles[code]) for code in ("6s", "9s")]
@@ -0,0 +1,285 @@
+import asyncio
+import itertools
+import sys
+import time
+
+import pytest
+
+from pymj.enums.decision_type import DecisionType
+from pymj.game.agent import RandomAgent, TsumogiriAgent
+from pymj.game.async_agent import (
+    AsyncAgent,
+    InProcessAgent,
+    SubprocessAgent,
+    decision_to_message,
+)
+from pymj.game.host import EfficiencyAgent, TableHost
+from pymj.game.table import Table
+from tests.game.test_table import DEALER_HAND, OTHER_HANDS, stack_wall
+
+
+class SleepingAgent(AsyncAgent):
+    def __init__(self, delay):
+        self.delay = delay
+        self.num_decisions = 0
+
+    async def decide(self, decision):
+        self.num_decisions += 1
+        await asyncio.sleep(self.delay)
+        return len(decision.options) - 1
+
+
+class SlowAgent(TsumogiriAgent):
+    def __init__(self, delay):
+        self.delay = delay
+        self.num_decisions = 0
+
+    def decide(self, decision):
+        self.num_decisions += 1
+        time.sleep(self.delay)
+        return super().decide(decision)
+
+
+class FirstSlowAgent(TsumogiriAgent):
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = itertools.count()
+
+    def decide(self, decision):
+        if next(self.calls) == 0:
+            time.sleep(self.delay)
+        return super().decide(decision)
+
+
+class RecordingAgent(TsumogiriAgent):
+    def __init__(self):
+        self.decisions = []
+
+    def decide(self, decision):
+        self.decisions.append(decision)
+        return super().decide(decision)
+
+
+class FailingAgent(AsyncAgent):
+    async def decide(self, decision):  # noqa: ARG002
+        raise RuntimeError
+
+
+class InvalidAgent(AsyncAgent):
+    async def decide(self, decision):
+        return len(decision.options)
+
+
+class CountingAgent(SleepingAgent):
+    def __init__(self):
+        super().__init__(0)
+        self.num_starts = 0
+
+    async def start(self):
+        self.num_starts += 1
+
+
+def test_run():
+    # Given: host with synchronous agents on more tables than games
+    host = TableHost([RandomAgent(seed) for seed in range(4)], num_winds=1, seed=0)
+
+    # When: run games
+    results = asyncio.run(host.run(6))
+
+    # Then: all games are played and counted
+    assert len(results) == 6
+    assert host.stats.num_games == 6
+    assert host.stats.num_rounds == sum(result.num_rounds for result in results)
+    assert host.stats.num_decisions > 0
+    assert host.stats.num_timeouts == 0
+    assert host.stats.decisions_per_second > 0
+    assert host.stats.mean_latency <= host.stats.max_latency
+
+    # Then: raise error for wrong number of agents or tables
+    with pytest.raises(ValueError):
+        TableHost([TsumogiriAgent()] * 3)
+    with pytest.raises(ValueError):
+        TableHost([TsumogiriAgent()] * 4, num_tables=0)
+
+
+def test_run_concurrently():
+    # Given: agents that take time to answer
+    agents = [SleepingAgent(0.001) for _ in range(4)]
+    host = TableHost(agents, num_tables=50, num_winds=1, seed=0)
+
+    # When: run one game on each table
+    results = asyncio.run(host.run(50))
+
+    # Then: the waits of the tables overlap
+    assert len(results) == 50
+    assert host.stats.elapsed < host.stats.total_latency / 10
+
+
+def test_run_with_timeout():
+    # Given: an agent answering slower than the timeout
+    slow = SleepingAgent(10)
+    agents = [slow, SleepingAgent(0), SleepingAgent(0), SleepingAgent(0)]
+    host = TableHost(agents, num_tables=1, num_winds=1, timeout=0.01, seed=0)
+
+    # When: run a game
+    results = asyncio.run(host.run(1))
+
+    # Then: unanswered decisions get the default option
+    assert len(results) == 1
+    assert host.stats.num_timeouts == slow.num_decisions > 0
+
+
+def test_run_with_timeout_of_synchronous_agent():
+    # Given: a synchronous agent answering slower than the timeout
+    slow = SlowAgent(0.05)
+    agents = [slow, TsumogiriAgent(), TsumogiriAgent(), TsumogiriAgent()]
+    host = TableHost(agents, num_tables=1, num_winds=1, timeout=0.001, seed=0)
+
+    async def run():
+        async with host:
+            return await host.run(1)
+
+    # When: run a game
+    results = asyncio.run(run())
+
+    # Then: its decisions time out rather than blocking the event loop
+    assert len(results) == 1
+    assert host.stats.num_timeouts > 0
+    assert host.stats.max_latency < slow.delay
+
+
+def test_run_with_timeout_at_one_table():
+    # Given: a synchronous agent at two tables answering its first decision slowly
+    slow = FirstSlowAgent(0.5)
+    agents = [slow, TsumogiriAgent(), TsumogiriAgent(), TsumogiriAgent()]
+    host = TableHost(agents, num_tables=2, num_winds=1, timeout=0.1, seed=0)
+
+    async def run():
+        async with host:
+            return await host.run(2)
+
+    # When: run a game on each table
+    results = asyncio.run(run())
+
+    # Then: only the slow decision times out, as the other table and the next
+    # decisions of the same table are answered by other threads
+    assert len(results) == 2
+    assert host.stats.num_timeouts == 1
+
+
+def test_in_process_agent_sees_copy_of_table():
+    # Given: a decision of a table and an agent running in threads
+    table = Table()
+    wall = stack_wall([DEALER_HAND, *OTHER_HANDS, OTHER_HANDS[0]], [8])
+    decision = next(table.play_round(wall, dealer=0))
+    recording = RecordingAgent()
+
+    # When: the agent decides
+    asyncio.run(InProcessAgent(recording).decide(decision))
+
+    # Then: the agent sees a copy of the decision and the table
+    seen = recording.decisions[0]
+    assert seen is not decision
+    assert seen.table is not table
+    assert seen.options == decision.options
+    assert seen.table.seats[0].concealed_count == table.seats[0].concealed_count
+
+
+def test_run_cancels_tables_after_failure():
+    # Given: an agent that fails, at tables with slow agents
+    agents = [FailingAgent(), *(SleepingAgent(0.001) for _ in range(3))]
+    host = TableHost(agents, num_tables=4, num_winds=1, seed=0)
+
+    async def run():
+        with pytest.raises(ExceptionGroup):
+            await host.run(4)
+        num_decisions = host.stats.num_decisions
+        await asyncio.sleep(0.05)
+        return num_decisions
+
+    # When: run games
+    num_decisions = asyncio.run(run())
+
+    # Then: the other tables stop with the failure
+    assert host.stats.num_decisions == num_decisions
+    assert host.stats.num_games == 0
+
+
+def test_run_with_invalid_answers():
+    # Given: an agent answering indices out of the options
+    agents = [InvalidAgent(), TsumogiriAgent(), TsumogiriAgent(), TsumogiriAgent()]
+    host = TableHost(agents, num_tables=2, num_winds=1, seed=0)
+
+    # When: run games
+    results = asyncio.run(host.run(2))
+
+    # Then: invalid answers get the default option
+    assert len(results) == 2
+    assert host.stats.num_invalid_answers > 0
+
+
+def test_start_agents_once():
+    # Given: host with one agent on every seat
+    agent = CountingAgent()
+    host = TableHost([agent] * 4, num_tables=1, num_winds=1, seed=0)
+
+    async def run():
+        async with host:
+            return await host.run(1)
+
+    # When: run a game in the context of the host
+    asyncio.run(run())
+
+    # Then: the agent is started once
+    assert agent.num_starts == 1
+
+
+def test_subprocess_agent():
+    # Given: host with a bot process shared by all seats
+    agent = SubprocessAgent([sys.executable, "-m", "pymj.game.stdio_bot"])
+    host = TableHost([agent] * 4, num_tables=4, num_winds=1, seed=0)
+
+    async def run():
+        async with host:
+            return await host.run(4)
+
+    # When: run games
+    results = asyncio.run(run())
+
+    # Then: the process answers the decisions of all tables
+    assert len(results) == 4
+    assert host.stats.num_timeouts == 0
+
+    # Then: raise error for a process that is not running
+    with pytest.raises(EOFError):
+        asyncio.run(agent.decide(None))
+
+
+def test_decision_to_message_and_efficiency_agent():
+    # Given: a decision to discard from a hand with two isolated honors
+    hand = [0, 1, 2, 12, 13, 14, 24, 25, 26, 27, 27, 30, 31]
+    wall = stack_wall([hand, DEALER_HAND, *OTHER_HANDS], [8])
+    table = Table()
+    decision = next(table.play_round(wall, dealer=0))
+    assert decision.decision_type is DecisionType.DISCARD
+
+    # When: convert it to a message
+    message = decision_to_message(decision)
+
+    # Then: the message holds what the player can see
+    assert message["type"] == "DISCARD"
+    assert message["tile"] == 8
+    assert message["options"] == decision.options
+    assert message["hand"] == list(table.seats[0].concealed_count)
+    assert message["discards"] == [[], [], [], []]
+    assert message["remaining"] == 69
+
+    # When: let the efficiency agent decide with the process pool of the host
+    async def decide():
+        async with TableHost([TsumogiriAgent()] * 4, num_workers=1) as host:
+            return await EfficiencyAgent(host).decide(decision)
+
+    answer = asyncio.run(decide())
+
+    # Then: an isolated honor is discarded rather than the drawn tile
+    assert decision.options[answer] == 30
@@ -0,0 +1,47 @@
+import pytest
+
+from pymj.game.river import River
+
+
+def test_discard_and_observe():
+    # Given: empty river
+    river = River()
+
+    # When: player discards and others discard after
+    river.discard(3)
+    river.observe(5)
+
+    # Then: own discards and passed tiles are furiten
+    assert list(river) == [3]
+    assert len(river) == 1
+    assert river.is_furiten(1 << 3)
+    assert river.is_furiten(1 << 5)
+    assert not river.is_furiten(1 << 4)
+    assert river.safe_mask == 1 << 3 | 1 << 5
+
+    # When: player discards again
+    river.discard(7)
+
+    # Then: temporary furiten is over
+    assert not river.is_furiten(1 << 5)
+    assert river.safe_mask == 1 << 3 | 1 << 7
+
+
+def test_declare_riichi():
+    # Given: river of a player in riichi
+    river = River()
+    river.discard(0)
+    river.declare_riichi()
+    river.discard(1)
+
+    # When: others discard and player discards again
+    river.observe(9)
+    river.discard(2)
+
+    # Then: tiles passed after riichi stay furiten
+    assert river.riichi_index == 1
+    assert river.is_furiten(1 << 9)
+
+    # Then: raise error for declaring riichi twice
+    with pytest.raises(ValueError):
+        river.declare_riichi()
@@ -0,0 +1,59 @@
+import pytest
+
+from pymj.game.agent import RandomAgent, TsumogiriAgent
+from pymj.game.runner import BatchRunner, play_game
+
+
+def summarize(result):
+    return [(round_.dealer, round_.winner, round_.loser) for round_ in result.rounds]
+
+
+def test_play_game():
+    # Given: random agents
+    def create_agents():
+        return [RandomAgent(seed) for seed in range(4)]
+
+    # When: play_game with the same seed twice
+    result1 = play_game(create_agents(), seed=0, num_winds=1)
+    result2 = play_game(create_agents(), seed=0, num_winds=1)
+
+    # Then: game is reproducible and has at least one round for each wind
+    assert summarize(result1) == summarize(result2)
+    assert result1.num_rounds >= 4
+
+    # Then: raise error for wrong number of agents
+    with pytest.raises(ValueError):
+        play_game([TsumogiriAgent()] * 3)
+
+
+class CountingAgent(TsumogiriAgent):
+    def __init__(self):
+        self.batch_sizes = []
+
+    def decide_batch(self, decisions):
+        self.batch_sizes.append(len(decisions))
+        return super().decide_batch(decisions)
+
+
+def test_batch_runner():
+    # Given: batch runner with tables advanced in lockstep
+    agents = [CountingAgent() for _ in range(4)]
+    runner = BatchRunner(agents, num_tables=4, num_winds=1, seed=0)
+
+    # When: run more games than tables
+    results = runner.run(10)
+
+    # Then: all games are played and agents decide for many tables at once
+    assert len(results) == 10
+    assert all(result.num_rounds >= 4 for result in results)
+    assert max(max(agent.batch_sizes) for agent in agents) > 1
+
+    # Then: results are reproducible by seed
+    rerun = BatchRunner(agents, num_tables=4, num_winds=1, seed=0).run(10)
+    assert [summarize(result) for result in rerun] == [
+        summarize(result) for result in results
+    ]
+
+    # Then: raise error for wrong number of agents
+    with pytest.raises(ValueError):
+        BatchRunner(agents[:3])
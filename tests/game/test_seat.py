@@ -0,0 +1,153 @@
+import pytest
+
+from pymj.enums.call_option import CallOption
+from pymj.enums.call_type import CallType
+from pymj.enums.player_relation import PlayerRelation
+from pymj.game.seat import Seat
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.tiles.tile_ids import indices_to_ids136
+
+
+def create_seat(indices):
+    seat = Seat(CombinedHandChecker())
+    seat.reset(indices_to_ids136(indices).tolist())
+    return seat
+
+
+def waits(seat):
+    return [tile for tile in range(34) if seat.waits_mask >> tile & 1]
+
+
+@pytest.mark.parametrize(
+    "indices, expected_waits",
+    [
+        ([0, 1, 2, 12, 13, 14, 24, 25, 26, 27, 27, 28, 28], [27, 28]),
+        ([0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 8, 8], list(range(9))),
+        ([0, 0, 5, 5, 9, 9, 14, 14, 20, 20, 31, 31, 33], [33]),
+        (
+            [0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33],
+            [0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33],
+        ),
+        ([0, 1, 3, 9, 10, 14, 18, 21, 24, 27, 29, 31, 33], []),
+        ([1, 2, 3, 10, 11, 12, 22, 23, 24, 33, 33, 33, 33], []),
+        ([0, 0, 0, 0, 1, 2, 3, 9, 10, 11, 18, 19, 20], [3]),
+    ],
+)
+def test_waits(indices, expected_waits):
+    # Given: seat with dealt hand
+    seat = create_seat(indices)
+
+    # Then: waits are tiles completing the hand
+    assert waits(seat) == expected_waits
+
+
+def test_discard():
+    # Given: seat holding a red five of man
+    seat = Seat(CombinedHandChecker())
+    seat.reset([16, 17, 0, 4, 8, 36, 40, 44, 72, 76, 80, 108, 109])
+
+    # When: tsumogiri
+    seat.draw(112)
+    assert seat.discard_options()[0] == 28
+    assert not seat.discard(28)
+    assert seat.concealed_count.red_mask == 0b001
+
+    # When: discard fives from hand
+    seat.draw(113)
+    is_red1 = seat.discard(4)
+    is_red2 = seat.discard(4)
+
+    # Then: red five is discarded last, and drawn tile is kept
+    assert (is_red1, is_red2) == (False, True)
+    assert seat.concealed_count[28] == 1
+    assert list(seat.river) == [28, 4, 4]
+
+    # Then: raise error for tiles not held
+    with pytest.raises(ValueError):
+        seat.discard(33)
+
+
+def test_calls():
+    # Given: seat holding 3466m and 777z
+    seat = create_seat([2, 3, 5, 5, 33, 33, 33, 9, 10, 11, 18, 19, 20])
+
+    # Then: chii is offered only from the previous player
+    assert seat.call_options(4, PlayerRelation.PREV, can_kan=True) == [
+        CallOption(CallType.CHII, (4, 2, 3)),
+        CallOption(CallType.CHII, (4, 3, 5)),
+    ]
+    assert seat.call_options(4, PlayerRelation.ACROSS, can_kan=True) == []
+    assert seat.call_options(33, PlayerRelation.NEXT, can_kan=True) == [
+        CallOption(CallType.PON, (33, 33, 33)),
+        CallOption(CallType.BIG_MELDED_KAN, (33, 33, 33, 33)),
+    ]
+
+    # When: pon of 6m
+    call = seat.call(
+        CallOption(CallType.PON, (5, 5, 5)),
+        relation=PlayerRelation.ACROSS,
+    )
+
+    # Then: call is made and the hand info is updated in place
+    assert call.call_type is CallType.PON
+    assert call.player_relation is PlayerRelation.ACROSS
+    assert seat.concealed_count.num_tiles == 11
+    assert seat.hand_info.concealed_count is seat.concealed_count
+    assert seat.hand_info.call_counts[0][1][5] == 3
+
+    # When: draw 6m and declare small melded kan
+    seat.discard(2)
+    seat.draw(23)
+    assert seat.kan_options() == [CallOption(CallType.SMALL_MELDED_KAN, (5,) * 4)]
+    call = seat.call(seat.kan_options()[0])
+
+    # Then: pon becomes kan
+    assert call.call_type is CallType.SMALL_MELDED_KAN
+    assert [call.call_type for call in seat.calls] == [CallType.SMALL_MELDED_KAN]
+    assert seat.concealed_count.num_tiles == 10
+
+
+def test_to_hand():
+    # Given: seat with drawn red five
+    seat = create_seat([0, 1, 2, 12, 13, 14, 24, 25, 26, 27, 27, 28, 28])
+    seat.draw(52)
+
+    # When: to_hand
+    hand = seat.to_hand()
+
+    # Then: hand has the tiles of the seat
+    assert len(hand.tiles) == 13
+    assert hand.drawn_tile.is_red
+
+
+def test_options_follow_discards_and_draws():
+    # Given: seat holding 11m, 45m and 777z
+    seat = create_seat([0, 0, 3, 4, 33, 33, 33, 9, 10, 11, 18, 19, 20])
+    assert seat.call_options(0, PlayerRelation.ACROSS, can_kan=False) == [
+        CallOption(CallType.PON, (0, 0, 0)),
+    ]
+    assert seat.kan_options() == []
+
+    # When: draw 7z and discard 1m
+    seat.draw(135)
+    assert seat.kan_options() == [CallOption(CallType.CONCEALED_KAN, (33,) * 4)]
+    seat.discard(0)
+
+    # Then: 1m is no longer a pon, and 6m is still a chii
+    assert seat.call_options(0, PlayerRelation.ACROSS, can_kan=False) == []
+    assert seat.call_options(5, PlayerRelation.PREV, can_kan=False) == [
+        CallOption(CallType.CHII, (5, 3, 4)),
+    ]
+    assert seat.call_options(6, PlayerRelation.PREV, can_kan=False) == []
+
+
+def test_can_claim():
+    # Given: seat holding 11m and 45m, tenpai on 3m and 6m
+    seat = create_seat([0, 0, 3, 4, 9, 10, 11, 18, 19, 20, 27, 27, 27])
+
+    # Then: pairs, waits and, from the previous player, chii tiles are claimable
+    assert seat.can_claim(0, PlayerRelation.ACROSS)
+    assert seat.can_claim(2, PlayerRelation.NEXT)
+    assert seat.can_claim(12, PlayerRelation.PREV)
+    assert not seat.can_claim(12, PlayerRelation.ACROSS)
+    assert not seat.can_claim(7, PlayerRelation.PREV)
@@ -0,0 +1,131 @@
+import pytest
+
+from pymj.enums.call_option import CallOption
+from pymj.enums.call_type import CallType
+from pymj.enums.decision_type import DecisionType
+from pymj.game.table import Table
+from pymj.tiles.tile_mapping import TileMapping
+from pymj.wall.wall import Wall
+
+DEALER_HAND = [0, 2, 4, 6, 8, 9, 11, 13, 15, 17, 18, 20, 22]
+TENPAI_HAND = [0, 1, 2, 12, 13, 14, 24, 25, 26, 27, 27, 28, 28]
+OTHER_HANDS = [
+    [1, 3, 5, 7, 10, 12, 14, 16, 19, 21, 23, 25, 29],
+    [1, 3, 5, 7, 10, 12, 14, 16, 19, 21, 23, 25, 30],
+]
+
+
+def stack_wall(hands, draws):
+    used = set()
+
+    def take(index):
+        tile_id = next(
+            index * 4 + copy for copy in (3, 2, 1, 0) if index * 4 + copy not in used
+        )
+        used.add(tile_id)
+        return tile_id
+
+    front = [take(index) for hand in hands for index in hand]
+    front += [take(index) for index in draws]
+    return Wall(front + [tile_id for tile_id in range(136) if tile_id not in used])
+
+
+def test_play_round_tsumo():
+    # Given: wall dealing a tenpai hand to the dealer who draws a winning tile
+    wall = stack_wall([TENPAI_HAND, DEALER_HAND, *OTHER_HANDS], [27])
+    round_ = Table().play_round(wall, dealer=0)
+
+    # When: dealer declares tsumo
+    decision = next(round_)
+    assert decision.decision_type is DecisionType.TSUMO
+    assert (decision.player, decision.tile) == (0, 27)
+    with pytest.raises(StopIteration) as stop:
+        round_.send(0)
+
+    # Then: dealer wins by self-draw
+    result = stop.value.value
+    assert (result.dealer, result.winner, result.loser) == (0, 0, None)
+    assert result.hand_info.is_tsumo
+    assert result.hand_info.agari_tile == TileMapping.index_to_tile(27)
+
+
+def test_play_round_ron_and_call():
+    # Given: wall where the dealer draws the winning tile of the next player
+    wall = stack_wall([DEALER_HAND, TENPAI_HAND, *OTHER_HANDS], [27])
+    table = Table()
+    round_ = table.play_round(wall, dealer=0)
+
+    # When: dealer discards the drawn tile
+    decision = next(round_)
+    assert decision.decision_type is DecisionType.DISCARD
+    assert decision.options[0] == 27
+    first_decision = decision
+    decision = round_.send(0)
+
+    # Then: next player may ron, asked with the same decision object
+    assert decision is first_decision
+    assert decision.decision_type is DecisionType.RON
+    assert decision.player == 1
+
+    # When: ron is declined, then pon is chosen
+    decision = round_.send(1)
+    assert decision.decision_type is DecisionType.CALL
+    assert decision.options == [None, CallOption(CallType.PON, (27, 27, 27))]
+    decision = round_.send(1)
+
+    # Then: calling player discards without drawing
+    assert decision.decision_type is DecisionType.DISCARD
+    assert (decision.player, decision.tile) == (1, None)
+    assert table.seats[1].calls[0].call_type is CallType.PON
+
+    # Then: raise error for invalid answer
+    with pytest.raises(ValueError):
+        round_.send(len(decision.options))
+
+
+def test_play_game_passes_deal():
+    # Given: walls which deal the same hands every round
+    hands = [DEALER_HAND, TENPAI_HAND, *OTHER_HANDS]
+    walls = iter([stack_wall(hands, [33]) for _ in range(4)])
+    game = Table().play_game(walls, num_winds=1)
+
+    # When: players discard drawn tiles and never win until the end of each round
+    decision = next(game)
+    with pytest.raises(StopIteration) as stop:
+        while True:
+            is_agari = decision.decision_type in (DecisionType.TSUMO, DecisionType.RON)
+            decision = game.send(1 if is_agari else 0)
+
+    # Then: each round ends in an exhaustive draw and the deal passes on
+    result = stop.value.value
+    assert result.num_rounds == 4
+    for dealer, round_result in enumerate(result.rounds):
+        assert round_result.dealer == dealer
+        assert round_result.winner is None
+        assert round_result.tenpai == [seat == (dealer + 1) % 4 for seat in range(4)]
+
+
+def test_play_round_furiten():
+    # Given: wall where the dealer and the next player discard the winning tiles
+    # of the last player
+    wall = stack_wall([DEALER_HAND, *OTHER_HANDS, TENPAI_HAND], [27, 28])
+    table = Table()
+    round_ = table.play_round(wall, dealer=0)
+
+    # When: last player declines ron and pon on the dealer's discard
+    decision = next(round_)
+    assert decision.decision_type is DecisionType.DISCARD
+    decision = round_.send(0)
+    assert (decision.decision_type, decision.player) == (DecisionType.RON, 3)
+    decision = round_.send(1)
+    assert decision.decision_type is DecisionType.CALL
+    decision = round_.send(0)
+
+    # When: next player discards the other winning tile
+    assert (decision.decision_type, decision.tile) == (DecisionType.DISCARD, 28)
+    decision = round_.send(0)
+
+    # Then: last player is furiten and may only call
+    assert table.seats[3].is_furiten
+    assert (decision.decision_type, decision.player) == (DecisionType.CALL, 3)
+    assert table.safe_tiles(3) == 1 << 27 | 1 << 28
@@ -0,0 +1,123 @@
+import pytest
+
+from pymj.enums.division_part_type import DivisionPartType
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.hand_parser import HandParser
+
+
+@pytest.mark.parametrize(
+    "hand_str, expected_shanten",
+    [
+        ("123m456p789s1112z", 0),
+        ("1122334455677m", 0),
+        ("19m19p19s1234567z", 0),
+        ("1199m4p1147s13457z", 3),
+        ("1199m1199p1199s12z", 0),
+    ],
+)
+def test_calculate_shanten(hand_str, expected_shanten):
+    # Given: hand info and combined hand checker
+    hand = HandParser.parse_hand(hand_str)
+    if len(hand.tiles) == 14:
+        hand.draw_tile(hand.tiles[-1])
+        hand.discard_tile(13)
+    hand_info = HandInfo.create_from_hand(hand)
+
+    # Then: result is the minimum over all hand forms
+    assert CombinedHandChecker().calculate_shanten(hand_info) == expected_shanten
+
+
+def test_calculate_divisions(tiles):
+    # Given: hand completing both seven pairs and normal form
+    hand = HandParser.parse_hand("1122334455667m")
+    hand.draw_tile(tiles["7m"])
+    hand_info = HandInfo.create_from_hand(hand)
+
+    # When: calculate_divisions
+    divisions = CombinedHandChecker().calculate_divisions(hand_info)
+
+    # Then: divisions of both forms are collected
+    assert any(len(division.parts) == 7 for division in divisions)
+    assert any(
+        part.type is DivisionPartType.SEQUENCE
+        for division in divisions
+        for part in division.parts
+    )
+
+
+def test_iterate_divisions(tiles):
+    # Given: hand completing both seven pairs and normal form
+    hand = HandParser.parse_hand("1122334455667m")
+    hand.draw_tile(tiles["7m"])
+    hand_info = HandInfo.create_from_hand(hand)
+
+    # When: iterate_divisions is stopped after the first division
+    divisions = CombinedHandChecker().iterate_divisions(hand_info)
+    first = next(divisions)
+
+    # Then: normal form division comes first and the rest agree with the list
+    assert len(first.parts) == 5
+    assert len(list(divisions)) + 1 == len(
+        CombinedHandChecker().calculate_divisions(hand_info),
+    )
+
+
+def test_calculate_ukeire():
+    # Given: tenpai hand waiting on 1z and 2z
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand("123m456p789s1122z"))
+
+    # When: calculate_ukeire
+    ukeire, num_ukeire = CombinedHandChecker().calculate_ukeire(hand_info)
+
+    # Then: waits and remaining count are expected
+    assert ukeire == [27, 28]
+    assert num_ukeire == 4
+
+
+@pytest.mark.parametrize(
+    "hand_str, expected",
+    [
+        ("123m456p789s11122z", True),
+        ("1199m1199p1199s12z", False),
+        ("1199m1199p11s1122z", True),
+        ("19m19p19s12345677z", True),
+        ("123m456p789s11234z", False),
+    ],
+)
+def test_check_agari(hand_str, expected):
+    # Given: hand info with winning tile and combined hand checker
+    hand = HandParser.parse_hand(hand_str)
+    hand.draw_tile(hand.tiles[-1])
+    hand.discard_tile(13)
+    hand_info = HandInfo.create_from_hand(hand)
+
+    # Then: hand is complete if any hand form is complete
+    assert CombinedHandChecker().check_agari(hand_info) is expected
+
+
+@pytest.mark.parametrize(
+    "hand_str, expected_waits",
+    [
+        ("123m456p789s1112z", [28]),
+        ("1122334455667m", [0, 3, 6]),
+        ("19m19p19s1234567z", [0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33]),
+        ("1199m4p1147s1345z", []),
+    ],
+)
+def test_calculate_waits(hand_str, expected_waits):
+    # Given: hand info of 13 tiles
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand(hand_str))
+
+    # When: calculate_waits
+    waits_mask = CombinedHandChecker().calculate_waits(hand_info)
+
+    # Then: waits are tiles completing the hand
+    assert [tile for tile in range(34) if waits_mask >> tile & 1] == expected_waits
+    assert hand_info.agari_tile is None
+
+    # Then: raise error for hand with winning tile
+    with pytest.raises(ValueError):
+        CombinedHandChecker().calculate_waits(
+            HandInfo.create_from_hand(HandParser.parse_hand("123m456p789s11122z")),
+        )
@@ -0,0 +1,79 @@
+import pytest
+
+from pymj.bench.corpora import create_corpus
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.hand_checker.instrumented_normal_form_checker import (
+    InstrumentedNormalFormChecker,
+)
+from pymj.hand_checker.normal_form_checker import NormalFormChecker
+from pymj.hand_checker.seven_pair_checker import SevenPairChecker
+from pymj.hand_checker.thirteen_orphan_checker import ThirteenOrphanChecker
+
+
+@pytest.mark.parametrize("corpus", ["random", "random_drawn", "tenpai", "called"])
+def test_same_shanten_as_normal_form_checker(corpus):
+    # Given: an instrumented and a plain checker
+    checker = InstrumentedNormalFormChecker()
+    plain_checker = NormalFormChecker()
+
+    for hand_info in create_corpus(corpus, 16):
+        # When: calculate the shanten number
+        shanten, stats = checker.calculate_shanten_with_stats(hand_info)
+
+        # Then: it matches the plain checker, and the statistics are consistent
+        assert shanten == plain_checker.calculate_shanten(hand_info)
+        assert stats.shanten == shanten
+        assert 0 <= stats.num_pruned < stats.num_set_nodes
+        assert stats.max_depth >= 1
+        assert stats.elapsed_ns > 0
+
+
+def test_search_stats(parse_hand_info):
+    # Given: hand with six pairs
+    checker = InstrumentedNormalFormChecker()
+    hand_info = parse_hand_info("1122335577899m")
+
+    # When: calculate the shanten number with statistics
+    shanten, stats = checker.calculate_shanten_with_stats(hand_info)
+
+    # Then: every pair was tried as head, and both phases were searched
+    assert shanten == 0
+    assert stats.num_heads == 6
+    assert stats.num_set_nodes > 0
+    assert stats.num_partial_nodes > 0
+    assert checker.last_stats is stats
+
+    # When: calculate another hand
+    _, other_stats = checker.calculate_shanten_with_stats(
+        parse_hand_info("19m19p19s1234567z"),
+    )
+
+    # Then: statistics start over
+    assert other_stats is not stats
+    assert other_stats.num_heads == 0
+    assert stats.num_heads == 6
+
+
+def test_callback_in_combined_hand_checker(parse_hand_info):
+    # Given: a combined checker with an instrumented normal form checker
+    calls = []
+    checker = CombinedHandChecker(
+        [
+            InstrumentedNormalFormChecker(
+                lambda hand_info, stats: calls.append((hand_info, stats)),
+            ),
+            SevenPairChecker(),
+            ThirteenOrphanChecker(),
+        ],
+    )
+    hand_info = parse_hand_info("123m456p789s1122z")
+
+    # When: calculate the shanten number
+    shanten = checker.calculate_shanten(hand_info)
+
+    # Then: the callback receives the hand and the statistics
+    assert shanten == 0
+    assert len(calls) == 1
+    assert calls[0][0] is hand_info
+    assert calls[0][1].shanten == 0
+    assert calls[0][1].num_heads == 2
@@ -2,6 +2,7 @@ import pytest
 
 from pymj.enums.efficiency_data import EfficiencyData
 from pymj.enums.wait_type import WaitType
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
 from pymj.hand_checker.normal_form_checker import NormalFormChecker
 from pymj.tiles.hand_info import HandInfo
 from pymj.tiles.hand_parser import HandParser
@@ -39,6 +40,30 @@ def test_calculate_shanten(hand_str, expected_shanten):
     assert normal_form_checker.calculate_shanten(hand_info) == expected_shanten
 
 
+@pytest.mark.parametrize(
+    "hand_str, expected",
+    [
+        ("123m456p789s11122z", True),
+        ("1112345678999m5m", True),
+        ("11122233344455m", True),
+        ("123m456p789s11234z", False),
+        ("1199m1199p1199s11z", False),
+        ("123m456p789s11123z", False),
+    ],
+)
+def test_check_agari(hand_str, expected):
+    # Given: hand info with winning tile
+    hand = HandParser.parse_hand(hand_str)
+    hand.draw_tile(hand.tiles[-1])
+    hand.discard_tile(len(hand.tiles) - 1)
+    hand_info = HandInfo.create_from_hand(hand)
+    normal_form_checker = NormalFormChecker()
+
+    # Then: result agrees with shanten number
+    assert normal_form_checker.check_agari(hand_info) is expected
+    assert (normal_form_checker.calculate_shanten(hand_info) == -1) is expected
+
+
 def test_calculate_divisions(tiles):
     # Given: hand info and seven pair checker
     hand = HandParser.parse_hand("12345689m123p99s")
@@ -137,3 +162,48 @@ def test_calculate_efficiency(hand_str, expected, tiles):
 
     normal_form_checker = NormalFormChecker()
     assert normal_form_checker.calculate_efficiency(hand_info) == expected_efficiency
+
+
+def test_calculate_divisions_with_terminal_and_honor_triplets(tiles):
+    # Given: hand whose bodies include triplets of 9m and 7z
+    hand = HandParser.parse_hand("123m999m456p7771z")
+    hand.draw_tile(tiles["1z"])
+    hand_info = HandInfo.create_from_hand(hand)
+    hand_info.is_tsumo = True
+
+    # When: calculate_divisions
+    divisions = NormalFormChecker().calculate_divisions(hand_info)
+
+    # Then: one division with the triplets of 9m and 7z
+    assert len(divisions) == 1
+    assert divisions[0].num_concealed_triplets == 2
+
+
+@pytest.mark.parametrize("hand_str", ["234m234p567s7777z7z", "1111234m123p123s1m"])
+def test_check_agari_with_fifth_copy(hand_str):
+    # Given: hand info with a fifth copy of a tile as winning tile
+    hand = HandParser.parse_hand(hand_str)
+    hand.draw_tile(hand.tiles[-1])
+    hand.discard_tile(len(hand.tiles) - 1)
+    hand_info = HandInfo.create_from_hand(hand)
+
+    # When: check agari
+    # Then: hand is not a win
+    assert not NormalFormChecker().check_agari(hand_info)
+
+
+@pytest.mark.parametrize(
+    "hand_str",
+    ["1112345678999m", "23456m234p34566s", "1111234m123p123s", "234m567p11z23s,c<789p"],
+)
+def test_calculate_waits(hand_str):
+    # Given: hand info of 3n+1 tiles
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand(hand_str))
+    checker = NormalFormChecker()
+
+    # When: calculate_waits
+    waits_mask = checker.calculate_waits(hand_info)
+
+    # Then: waits are the same as when checking every tile
+    assert waits_mask
+    assert waits_mask == BaseHandChecker.calculate_waits(checker, hand_info)
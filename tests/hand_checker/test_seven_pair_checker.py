@@ -3,6 +3,7 @@ import pytest
 from pymj.enums.division_part_type import DivisionPartType
 from pymj.enums.efficiency_data import EfficiencyData
 from pymj.enums.wait_type import WaitType
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
 from pymj.hand_checker.seven_pair_checker import SevenPairChecker
 from pymj.tiles.hand_info import HandInfo
 from pymj.tiles.hand_parser import HandParser
@@ -98,3 +99,28 @@ def test_calculate_efficiency(hand_str, expected, tiles):
 
     seven_pair_checker = SevenPairChecker()
     assert seven_pair_checker.calculate_efficiency(hand_info) == expected_efficiency
+
+
+@pytest.mark.parametrize(
+    "hand_str, expected_waits",
+    [
+        ("1122334455667m", [6]),
+        ("1122334455666m", []),
+        ("1111223344556m", []),
+        ("1122m3344p5566s7z", [33]),
+    ],
+)
+def test_calculate_waits(hand_str, expected_waits):
+    # Given: hand info of 13 tiles
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand(hand_str))
+    checker = SevenPairChecker()
+
+    # When: calculate_waits
+    waits_mask = checker.calculate_waits(hand_info)
+
+    # Then: the single tile is the wait, as when checking every tile
+    assert [tile for tile in range(34) if waits_mask >> tile & 1] == expected_waits
+    assert waits_mask == BaseHandChecker.calculate_waits(checker, hand_info)
+    assert checker.calculate_waits(hand_info, range(27, 34)) == waits_mask & (
+        ((1 << 7) - 1) << 27
+    )
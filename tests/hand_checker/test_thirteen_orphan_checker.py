@@ -3,6 +3,7 @@ import pytest
 from pymj.enums.division_part_type import DivisionPartType
 from pymj.enums.efficiency_data import EfficiencyData
 from pymj.enums.wait_type import WaitType
+from pymj.hand_checker.base_hand_checker import BaseHandChecker
 from pymj.hand_checker.thirteen_orphan_checker import ThirteenOrphanChecker
 from pymj.tiles.hand_info import HandInfo
 from pymj.tiles.hand_parser import HandParser
@@ -119,3 +120,28 @@ def test_calculate_efficiency(hand_str, expected, tiles):
     assert (
         thirteen_orphan_checker.calculate_efficiency(hand_info) == expected_efficiency
     )
+
+
+@pytest.mark.parametrize(
+    "hand_str, expected_waits",
+    [
+        ("19m19p19s1234567z", [0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33]),
+        ("119m19p19s123456z", [33]),
+        ("119m19p19s123455z", []),
+        ("129m19p19s123456z", []),
+    ],
+)
+def test_calculate_waits(hand_str, expected_waits):
+    # Given: hand info of 13 tiles
+    hand_info = HandInfo.create_from_hand(HandParser.parse_hand(hand_str))
+    checker = ThirteenOrphanChecker()
+
+    # When: calculate_waits
+    waits_mask = checker.calculate_waits(hand_info)
+
+    # Then: waits are the missing orphans, as when checking every tile
+    assert [tile for tile in range(34) if waits_mask >> tile & 1] == expected_waits
+    assert waits_mask == BaseHandChecker.calculate_waits(checker, hand_info)
+    assert checker.calculate_waits(hand_info, range(27, 34)) == waits_mask & (
+        ((1 << 7) - 1) << 27
+    )
@@ -0,0 +1,142 @@
+import io
+import json
+
+import pytest
+
+from pymj.enums.call_type import CallType
+from pymj.enums.player_relation import PlayerRelation
+from pymj.hand_checker.normal_form_checker import NormalFormChecker
+from pymj.logs.mjai import MjaiAdapter
+from pymj.tiles.tile_mapping import TileMapping
+
+
+@pytest.fixture
+def start_kyoku_event():
+    return {
+        "type": "start_kyoku",
+        "tehais": [
+            ["1m", "2m", "3m", "4p", "5pr", "6p", "7s", "8s", "9s", "E", "E", "C", "C"],
+            ["?"] * 13,
+            ["?"] * 13,
+            ["?"] * 13,
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "tile_str, expected_str",
+    [("1m", "1m"), ("5pr", "5p"), ("9s", "9s"), ("E", "1z"), ("C", "7z")],
+)
+def test_parse_tile(tile_str, expected_str, tiles):
+    assert MjaiAdapter.parse_tile(tile_str) == tiles[expected_str]
+
+
+@pytest.mark.parametrize("tile_str", ["0m", "10p", "5zr", "X", "?"])
+def test_parse_tile_fail(tile_str):
+    with pytest.raises(ValueError):
+        MjaiAdapter.parse_tile(tile_str)
+
+
+def test_tsumo_and_dahai(start_kyoku_event, tiles):
+    # Given: adapter after start_kyoku
+    adapter = MjaiAdapter()
+    adapter.feed(start_kyoku_event)
+
+    # When: player 0 draws 7z
+    adapter.feed({"type": "tsumo", "actor": 0, "pai": "C"})
+
+    # Then: snapshot is an agari hand with the drawn tile as agari tile
+    hand_info = adapter.hand_info(0, is_tsumo=True)
+    assert hand_info.agari_tile == tiles["7z"]
+    assert NormalFormChecker().check_agari(hand_info)
+
+    # When: player 0 discards 1m from hand
+    adapter.feed({"type": "dahai", "actor": 0, "pai": "1m", "tsumogiri": False})
+
+    # Then: drawn tile joins the concealed tiles
+    hand_info = adapter.hand_info(0)
+    assert hand_info.agari_tile is None
+    assert hand_info.concealed_count[TileMapping.tile_to_index(tiles["1m"])] == 0
+    assert hand_info.concealed_count[TileMapping.tile_to_index(tiles["7z"])] == 3
+    assert hand_info.concealed_count.num_tiles == 13
+
+
+def test_calls(start_kyoku_event, tiles):
+    # Given: adapter after start_kyoku
+    adapter = MjaiAdapter()
+    adapter.feed(start_kyoku_event)
+
+    # When: player 0 pons 1z from player 2 and discards
+    events = [
+        {"type": "tsumo", "actor": 3, "pai": "?"},
+        {"type": "dahai", "actor": 3, "pai": "S", "tsumogiri": True},
+        {"type": "tsumo", "actor": 2, "pai": "?"},
+        {"type": "dahai", "actor": 2, "pai": "E", "tsumogiri": True},
+        {"type": "pon", "actor": 0, "target": 2, "pai": "E", "consumed": ["E", "E"]},
+        {"type": "dahai", "actor": 0, "pai": "1m", "tsumogiri": False},
+    ]
+    lines = io.StringIO("\n".join(json.dumps(event) for event in events))
+    consumed = list(adapter.consume(lines))
+
+    # Then: all events are applied
+    assert consumed == events
+
+    # Then: pon is recorded with relation to the discarder
+    call = adapter.hands[0].calls[0]
+    assert call.call_type is CallType.PON
+    assert call.player_relation is PlayerRelation.ACROSS
+
+    # When: player 0 draws the fourth 1z and adds it to the pon
+    adapter.feed({"type": "tsumo", "actor": 0, "pai": "E"})
+    adapter.feed({"type": "kakan", "actor": 0, "pai": "E", "consumed": ["E"] * 3})
+
+    # Then: pon becomes small melded kan
+    hand_info = adapter.hand_info(0)
+    assert adapter.hands[0].calls[0].call_type is CallType.SMALL_MELDED_KAN
+    call_type, call_count = hand_info.call_counts[0]
+    assert call_type is CallType.SMALL_MELDED_KAN
+    assert call_count[TileMapping.tile_to_index(tiles["1z"])] == 4
+    assert hand_info.concealed_count.num_tiles == 10
+
+
+def test_chi_from_hidden_hand(start_kyoku_event):
+    # Given: adapter after start_kyoku
+    adapter = MjaiAdapter()
+    adapter.feed(start_kyoku_event)
+
+    # When: player 1 chis 3m from player 0 with hidden tiles
+    adapter.feed({"type": "tsumo", "actor": 0, "pai": "9m"})
+    adapter.feed({"type": "dahai", "actor": 0, "pai": "3m", "tsumogiri": False})
+    adapter.feed(
+        {"type": "chi", "actor": 1, "target": 0, "pai": "3m", "consumed": ["4m", "5m"]},
+    )
+
+    # Then: chii is recorded from previous player and hidden tiles are consumed
+    call = adapter.hands[1].calls[0]
+    assert call.call_type is CallType.CHII
+    assert call.player_relation is PlayerRelation.PREV
+    assert adapter.hand_info(1).concealed_count.num_tiles == 0
+
+
+def test_dahai_fail_if_tile_not_in_hand(start_kyoku_event):
+    adapter = MjaiAdapter()
+    adapter.feed(start_kyoku_event)
+
+    with pytest.raises(ValueError):
+        adapter.feed({"type": "dahai", "actor": 0, "pai": "9p", "tsumogiri": False})
+
+
+def test_red_five(start_kyoku_event):
+    # Given: adapter after start_kyoku with red 5p in hand
+    adapter = MjaiAdapter()
+    adapter.feed(start_kyoku_event)
+    assert adapter.hand_info(0).red_mask == 0b010
+
+    # When: player 0 draws plain 5p and discards red 5p
+    adapter.feed({"type": "tsumo", "actor": 0, "pai": "5p"})
+    adapter.feed({"type": "dahai", "actor": 0, "pai": "5pr", "tsumogiri": False})
+
+    # Then: red five is removed while plain 5p is kept
+    hand_info = adapter.hand_info(0)
+    assert hand_info.red_mask == 0
+    assert hand_info.concealed_count[13] == 1
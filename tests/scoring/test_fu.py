@@ -0,0 +1,68 @@
+import pytest
+
+from pymj.enums.scoring_context_data import ScoringContextData
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.scoring.fu import POINTS_TABLE, calculate_fu, lookup_payments
+from pymj.scoring.yaku import calculate_signature
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.hand_parser import HandParser
+
+
+def calculate_signatures(hand_str, agari_tile_str, is_tsumo=False):
+    hand_info = HandInfo.create_from_hand(
+        HandParser.parse_hand(hand_str),
+        HandParser.parse_tile(agari_tile_str),
+        is_tsumo,
+    )
+    return [
+        calculate_signature(division)
+        for division in CombinedHandChecker().calculate_divisions(hand_info)
+    ]
+
+
+@pytest.mark.parametrize(
+    "hand_str, agari_tile_str, is_tsumo, context, expected",
+    [
+        ("23456m234p34566s", "1m", True, ScoringContextData(), [20]),
+        ("23456m234p34566s", "4m", False, ScoringContextData(), [30, 30]),
+        ("112233m445566p7s", "7s", False, ScoringContextData(), [40, 25]),
+        ("234m567p11z23s,c<789p", "4s", False, ScoringContextData(), [30]),
+        ("234m567p11z23s,c<789p", "4s", True, ScoringContextData(), [30]),
+        ("222m333p44s11122z", "2z", False, ScoringContextData(seat_wind=28), [50]),
+        ("123m999m456p7771z", "1z", True, ScoringContextData(seat_wind=29), [50]),
+        ("123m456p789s2z,k_1111z", "2z", False, ScoringContextData(), [70]),
+    ],
+)
+def test_calculate_fu(hand_str, agari_tile_str, is_tsumo, context, expected):
+    # Given: signatures of the divisions of a winning hand
+    signatures = calculate_signatures(hand_str, agari_tile_str, is_tsumo)
+
+    # When: calculate_fu
+    # Then: fu rounded up to a multiple of 10, 25 for seven pairs
+    assert [calculate_fu(signature, context) for signature in signatures] == expected
+
+
+@pytest.mark.parametrize(
+    "han, fu, is_dealer, is_tsumo, expected",
+    [
+        (1, 30, False, False, (1000, 0)),
+        (3, 20, False, True, (1300, 700)),
+        (4, 30, True, False, (11600, 0)),
+        (3, 70, False, False, (8000, 0)),
+        (7, 30, True, True, (0, 6000)),
+        (13, 30, False, True, (16000, 8000)),
+        (26, 30, False, False, (64000, 0)),
+        (13, 160, True, False, (48000, 0)),
+    ],
+)
+def test_lookup_payments(han, fu, is_dealer, is_tsumo, expected):
+    # When: lookup_payments
+    # Then: payments of the discarder or dealer and of each non-dealer
+    assert lookup_payments(han, fu, is_dealer, is_tsumo) == expected
+
+
+def test_points_table_is_immutable():
+    # When: the points table is modified
+    # Then: TypeError is raised
+    with pytest.raises(TypeError):
+        POINTS_TABLE[1, 30, False, False] = (0, 0)  # type: ignore[index]
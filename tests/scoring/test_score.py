@@ -0,0 +1,167 @@
+import pytest
+
+from pymj.enums.scoring_context_data import ScoringContextData
+from pymj.enums.yaku import Yaku
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.scoring.score import (
+    clear_score_cache,
+    score_division,
+    score_divisions,
+    score_hand,
+)
+
+
+def test_score_division(parse_hand_info):
+    # Given: non-dealer riichi pinfu tsumo
+    hand_info = parse_hand_info("23456m234p34566s", "1m", is_tsumo=True)
+    division = CombinedHandChecker().calculate_divisions(hand_info)[0]
+    context = ScoringContextData(seat_wind=28, is_riichi=True, num_dora=1)
+
+    # When: score_division
+    score = score_division(division, context)
+
+    # Then: 4 han 20 fu, paid 2600 by the dealer and 1300 by the others
+    assert score.yaku == ((Yaku.RIICHI, 1), (Yaku.MENZEN_TSUMO, 1), (Yaku.PINFU, 1))
+    assert (score.han, score.fu) == (4, 20)
+    assert score.payments == (2600, 1300)
+    assert score.points == 5200
+
+
+def test_score_division_of_dealer_ron(parse_hand_info):
+    # Given: dealer toitoi ron with dora
+    hand_info = parse_hand_info("222m333p44s11122z", "2z")
+    division = CombinedHandChecker().calculate_divisions(hand_info)[0]
+    context = ScoringContextData(num_dora=3)
+
+    # When: score_division
+    score = score_division(division, context)
+
+    # Then: 9 han makes a dealer baiman
+    assert score.han == 9
+    assert score.points == 24000
+
+
+def test_score_division_without_yaku(parse_hand_info):
+    # Given: open hand without yaku but with dora
+    hand_info = parse_hand_info("234m567p11z23s,c<789p", "4s")
+    division = CombinedHandChecker().calculate_divisions(hand_info)[0]
+
+    # When: score_division
+    score = score_division(division, ScoringContextData(num_dora=2))
+
+    # Then: no han and no points
+    assert score.yaku == ()
+    assert (score.han, score.points) == (0, 0)
+
+
+def test_score_division_of_yakuman(parse_hand_info):
+    # Given: non-dealer thirteen orphans ron on a thirteen-sided wait
+    hand_info = parse_hand_info("19m19p19s1234567z", "1m")
+    division = CombinedHandChecker().calculate_divisions(hand_info)[0]
+
+    # When: score_division with dora
+    score = score_division(division, ScoringContextData(seat_wind=29, num_dora=1))
+
+    # Then: double yakuman ignores dora
+    assert score.han == 26
+    assert score.points == 64000
+
+
+def test_score_hand_picks_best_division(parse_hand_info):
+    # Given: hand divided into three triplets or three identical sequences
+    hand_info = parse_hand_info("111222333m789p5s", "5s")
+    context = ScoringContextData(seat_wind=28)
+
+    # When: score_hand
+    score = score_hand(hand_info, context)
+
+    # Then: three concealed triplets beat one pair of identical sequences
+    assert score.yaku == ((Yaku.SANANKOU, 2),)
+    assert (score.han, score.fu, score.points) == (2, 50, 3200)
+
+
+@pytest.mark.parametrize(
+    "hand_str, agari_tile_str, is_tsumo, context",
+    [
+        ("111222333m789p5s", "5s", True, ScoringContextData(is_riichi=True)),
+        ("112233m445566p7s", "7s", False, ScoringContextData(seat_wind=29)),
+        ("223344m5566778p", "8p", True, ScoringContextData(num_dora=2)),
+        ("1112345678999m", "1m", False, ScoringContextData()),
+        ("23456m234p34566s", "4m", False, ScoringContextData(is_ippatsu=True)),
+    ],
+)
+def test_score_hand_agrees_with_every_division(
+    hand_str,
+    agari_tile_str,
+    is_tsumo,
+    context,
+    parse_hand_info,
+):
+    # Given: winning hand with several divisions
+    hand_info = parse_hand_info(hand_str, agari_tile_str, is_tsumo)
+    divisions = CombinedHandChecker().calculate_divisions(hand_info)
+
+    # When: score_hand with pruning
+    clear_score_cache()
+    score = score_hand(hand_info, context)
+
+    # Then: same points as the best of all divisions
+    assert score.points == max(
+        score_division(division, context).points for division in divisions
+    )
+
+
+@pytest.mark.parametrize(
+    "hand_str, agari_tile_str, context",
+    [
+        ("1112234456678p", "2p", ScoringContextData(seat_wind=28, is_riichi=True)),
+        ("1112234456678p", "5p", ScoringContextData(seat_wind=28, is_riichi=True)),
+        ("111222333m789p5s", "5s", ScoringContextData(seat_wind=28)),
+        ("223344m5566778p", "8p", ScoringContextData(num_dora=2)),
+    ],
+)
+def test_score_divisions_ignores_order(
+    hand_str,
+    agari_tile_str,
+    context,
+    parse_hand_info,
+):
+    # Given: divisions of a winning tsumo hand that tie on points
+    hand_info = parse_hand_info(hand_str, agari_tile_str, is_tsumo=True)
+    divisions = CombinedHandChecker().calculate_divisions(hand_info)
+    best = max(
+        (score.points, score.han, score.fu)
+        for score in (score_division(division, context) for division in divisions)
+    )
+
+    # When: score the divisions in both orders
+    clear_score_cache()
+    forward = score_divisions(divisions, context)
+    backward = score_divisions(reversed(divisions), context)
+
+    # Then: both find the most points, then the most han and fu
+    assert (forward.points, forward.han, forward.fu) == best
+    assert (backward.points, backward.han, backward.fu) == best
+
+
+def test_score_hand_memoizes_scores(parse_hand_info):
+    # Given: hand scored once
+    hand_info = parse_hand_info("23456m234p34566s", "1m")
+    context = ScoringContextData()
+    first = score_hand(hand_info, context)
+
+    # When: the hand is scored again
+    second = score_hand(hand_info, context)
+
+    # Then: the memoized score is returned
+    assert second is first
+
+
+def test_score_hand_rejects_incomplete_hand(parse_hand_info):
+    # Given: hand that does not win on its agari tile
+    hand_info = parse_hand_info("23456m234p34566s", "9m")
+
+    # When: score_hand
+    # Then: ValueError is raised
+    with pytest.raises(ValueError):
+        score_hand(hand_info, ScoringContextData())
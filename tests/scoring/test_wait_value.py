@@ -0,0 +1,74 @@
+import pytest
+
+from pymj.enums.scoring_context_data import ScoringContextData
+from pymj.scoring.score import score_hand
+from pymj.scoring.wait_value import wait_value_table
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.hand_parser import HandParser
+from pymj.tiles.tile_mapping import TileMapping
+
+
+def test_wait_value_table(parse_hand_info):
+    # Given: non-dealer tenpai on 1m, 4m and 7m, where 4m and 7m add tanyao
+    hand_info = parse_hand_info("23456m234p34566s")
+    context = ScoringContextData(seat_wind=28)
+
+    # When: wait_value_table
+    table = wait_value_table(hand_info, context)
+
+    # Then: ron and tsumo points and unseen copies by wait
+    assert table == {0: (1000, 1500, 4), 3: (2000, 2700, 3), 6: (2000, 2700, 4)}
+
+
+@pytest.mark.parametrize(
+    "hand_str, context",
+    [
+        ("1112345678999m", ScoringContextData()),
+        ("1122334455667m", ScoringContextData(is_riichi=True)),
+        ("19m19p19s123456z7z", ScoringContextData(seat_wind=29)),
+        ("111222333m78p55s", ScoringContextData(num_dora=1)),
+        ("234m567p11z23s,c<789p", ScoringContextData()),
+    ],
+)
+def test_wait_value_table_agrees_with_score_hand(hand_str, context, parse_hand_info):
+    # Given: tenpai hand
+    hand_info = parse_hand_info(hand_str)
+
+    # When: wait_value_table
+    table = wait_value_table(hand_info, context)
+
+    # Then: points agree with scoring each wait by itself
+    assert table
+    for tile, (ron_points, tsumo_points, _) in table.items():
+        for is_tsumo, points in ((False, ron_points), (True, tsumo_points)):
+            winning_hand = HandInfo(
+                hand_info.concealed_count,
+                hand_info.call_counts,
+                TileMapping.index_to_tile(tile),
+                is_tsumo,
+            )
+            assert score_hand(winning_hand, context).points == points
+
+
+def test_wait_value_table_skips_fifth_copy(parse_hand_info):
+    # Given: tenpai hand holding four 1m, which would also complete as a fifth 1m
+    hand_info = parse_hand_info("1111234m123p123s")
+
+    # When: wait_value_table
+    table = wait_value_table(hand_info, ScoringContextData())
+
+    # Then: only 4m is a wait
+    assert list(table) == [3]
+
+
+def test_wait_value_table_rejects_complete_hand():
+    # Given: hand of 14 tiles
+    hand_info = HandInfo.create_from_hand(
+        HandParser.parse_hand("23456m234p34566s"),
+        HandParser.parse_tile("1m"),
+    )
+
+    # When: wait_value_table
+    # Then: ValueError is raised
+    with pytest.raises(ValueError):
+        wait_value_table(hand_info, ScoringContextData())
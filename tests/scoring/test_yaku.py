@@ -0,0 +1,161 @@
+import pytest
+
+from pymj.enums.scoring_context_data import ScoringContextData
+from pymj.enums.yaku import Yaku
+from pymj.enums.yaku_feature import YakuFeature
+from pymj.hand_checker.combined_hand_checker import CombinedHandChecker
+from pymj.scoring.yaku import (
+    YAKUMAN_HAN,
+    calculate_signature,
+    evaluate_yaku,
+    find_yaku,
+)
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.hand_parser import HandParser
+
+
+def calculate_divisions(hand_str, agari_tile_str, is_tsumo=False):
+    hand_info = HandInfo.create_from_hand(
+        HandParser.parse_hand(hand_str),
+        HandParser.parse_tile(agari_tile_str),
+        is_tsumo,
+    )
+    return CombinedHandChecker().calculate_divisions(hand_info)
+
+
+@pytest.mark.parametrize(
+    "hand_str, agari_tile_str, is_tsumo, context, expected",
+    [
+        (
+            "23456m234p23455s",
+            "1m",
+            True,
+            ScoringContextData(is_riichi=True),
+            {Yaku.RIICHI: 1, Yaku.MENZEN_TSUMO: 1, Yaku.PINFU: 1},
+        ),
+        (
+            "23456m234p34566s",
+            "4m",
+            False,
+            ScoringContextData(is_double_riichi=True, is_ippatsu=True),
+            {Yaku.DOUBLE_RIICHI: 2, Yaku.IPPATSU: 1, Yaku.PINFU: 1, Yaku.TANYAO: 1},
+        ),
+        (
+            "123456789m1z,p<555z",
+            "1z",
+            False,
+            ScoringContextData(),
+            {Yaku.WHITE_DRAGON: 1, Yaku.ITTSU: 1, Yaku.HONITSU: 2},
+        ),
+        (
+            "123m123p789m9s,c<123s",
+            "9s",
+            False,
+            ScoringContextData(),
+            {Yaku.SANSHOKU_DOUJUN: 1, Yaku.JUNCHAN: 2},
+        ),
+        (
+            "222m333p44s11122z",
+            "2z",
+            False,
+            ScoringContextData(seat_wind=28),
+            {Yaku.SANANKOU: 2, Yaku.TOITOI: 2, Yaku.SEAT_WIND: 1, Yaku.ROUND_WIND: 1},
+        ),
+        (
+            "12366m55577z,p<666z",
+            "6m",
+            True,
+            ScoringContextData(is_last_tile=True),
+            {
+                Yaku.HAITEI: 1,
+                Yaku.WHITE_DRAGON: 1,
+                Yaku.GREEN_DRAGON: 1,
+                Yaku.SHOUSANGEN: 2,
+                Yaku.HONITSU: 2,
+            },
+        ),
+        (
+            "1112345678999m",
+            "5m",
+            True,
+            ScoringContextData(),
+            {Yaku.CHUUREN_POUTOU: YAKUMAN_HAN},
+        ),
+        (
+            "19m19p19s1234567z",
+            "1m",
+            False,
+            ScoringContextData(),
+            {Yaku.KOKUSHI_MUSOU_13_WAIT: 2 * YAKUMAN_HAN},
+        ),
+        (
+            "111m222p333s444z5z",
+            "5z",
+            False,
+            ScoringContextData(),
+            {Yaku.SUUANKOU_TANKI: 2 * YAKUMAN_HAN},
+        ),
+        (
+            "23456m234p23455s",
+            "1m",
+            True,
+            ScoringContextData(seat_wind=28, is_first_draw=True),
+            {Yaku.CHIIHOU: YAKUMAN_HAN},
+        ),
+    ],
+)
+def test_find_yaku(hand_str, agari_tile_str, is_tsumo, context, expected):
+    # Given: divisions of a winning hand
+    divisions = calculate_divisions(hand_str, agari_tile_str, is_tsumo)
+
+    # When: find_yaku on the best division by han
+    results = [dict(find_yaku(division, context)) for division in divisions]
+    best = max(results, key=lambda result: sum(result.values()))
+
+    # Then: yaku found with their han
+    assert best == expected
+
+
+def test_find_yaku_of_each_division():
+    # Given: hand that is both two pairs of identical sequences and seven pairs
+    divisions = calculate_divisions("112233m445566p7s", "7s")
+
+    # When: find_yaku on each division
+    results = [find_yaku(division, ScoringContextData()) for division in divisions]
+
+    # Then: each division has its own yaku
+    assert sorted(results, key=str) == sorted(
+        [[(Yaku.RYANPEIKOU, 3)], [(Yaku.CHIITOITSU, 2)]],
+        key=str,
+    )
+
+
+def test_no_yaku():
+    # Given: open hand without yaku
+    divisions = calculate_divisions("234m567p11z23s,c<789p", "4s")
+
+    # When: find_yaku
+    results = [find_yaku(division, ScoringContextData()) for division in divisions]
+
+    # Then: no yaku
+    assert results == [[]]
+
+
+def test_signature_is_shared_by_equal_divisions():
+    # Given: the same hand won by ron on two different tiles of the same wait
+    first = calculate_divisions("23456m234p34566s", "1m")[0]
+    second = calculate_divisions("23456m234p34566s", "4m")[0]
+
+    # When: calculate_signature
+    signatures = [calculate_signature(first), calculate_signature(second)]
+
+    # Then: signatures differ only by tile features and are hashable
+    assert YakuFeature.SIMPLES_ONLY & signatures[1].features
+    assert not YakuFeature.SIMPLES_ONLY & signatures[0].features
+    assert len({*signatures, calculate_signature(first)}) == 2
+
+    # Then: yaku can be evaluated from the signature alone
+    assert evaluate_yaku(signatures[1], ScoringContextData()) == [
+        (Yaku.PINFU, 1),
+        (Yaku.TANYAO, 1),
+    ]
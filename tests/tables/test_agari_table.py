@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from pymj.hand_checker.normal_form_checker import NormalFormChecker
+from pymj.tables.__main__ import main
+from pymj.tables.agari_table import (
+    AGARI_TABLE_NAME,
+    COMPLETE,
+    COMPLETE_WITH_HEAD,
+    SUIT_SIZE,
+    find_complete_waits,
+    generate_agari_table,
+    get_agari_table,
+    is_complete_hand,
+)
+from pymj.tables.table_file import TABLE_DIR_ENV
+from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.tile_count import TileCount
+from pymj.tiles.tile_mapping import TileMapping
+
+
+@pytest.fixture
+def table_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv(TABLE_DIR_ENV, str(tmp_path))
+    get_agari_table.cache_clear()
+    yield tmp_path
+    get_agari_table.cache_clear()
+
+
+def suit_index(counts):
+    return sum(count * 5**tile for tile, count in enumerate(counts))
+
+
+def test_generate_agari_table():
+    # Given: the generated agari table
+    table = generate_agari_table()
+
+    # Then: entries are flagged by whether the tiles split into sets and a head
+    assert table[suit_index([0] * 9)] == COMPLETE
+    assert table[suit_index([1, 1, 1, 0, 0, 0, 0, 0, 0])] == COMPLETE
+    assert table[suit_index([3, 1, 1, 1, 1, 1, 1, 1, 3])] == 0
+    assert table[suit_index([3, 1, 1, 1, 1, 1, 1, 1, 4])] == COMPLETE_WITH_HEAD
+    assert table[suit_index([1, 1, 0, 0, 0, 0, 0, 0, 0])] == 0
+    assert table[SUIT_SIZE + suit_index([3, 2, 0, 0, 0, 0, 0])] == COMPLETE_WITH_HEAD
+    assert table[SUIT_SIZE + suit_index([1, 1, 1, 0, 0, 0, 0])] == 0
+
+
+def test_is_complete_hand_matches_shanten():
+    # Given: random hands of 13 tiles in few suits, to often be tenpai
+    rng = np.random.default_rng(0)
+    checker = NormalFormChecker()
+    wall = np.repeat(np.concatenate([np.arange(9), np.arange(27, 34)]), 4)
+
+    for _ in range(100):
+        counts = np.bincount(rng.choice(wall, 13, replace=False), minlength=34)
+        hand_info = HandInfo(TileCount([int(count) for count in counts]))
+
+        for tile in range(34):
+            if counts[tile] == 4:
+                continue
+            # When: add each tile
+            hand_info.agari_tile = TileMapping.index_to_tile(tile)
+            completed = list(hand_info.concealed_count)
+            completed[tile] += 1
+
+            # Then: the table agrees with the shanten number
+            assert is_complete_hand(completed) == (
+                checker.calculate_shanten(hand_info) == -1
+            )
+
+
+@pytest.mark.parametrize("tile", [0, 8, 20, 27, 33])
+def test_is_complete_hand_with_fifth_copy(tile):
+    # Given: counts of a hand with five copies of a tile
+    counts = [0] * 34
+    counts[tile] = 5
+    for other in (9, 10, 11, 12, 13, 14, 15, 16, 17):
+        counts[other] += 1
+
+    # When: check if the hand is complete
+    # Then: the hand is not complete, rather than reading another entry
+    assert not is_complete_hand(counts)
+
+
+def test_find_complete_waits_matches_is_complete_hand():
+    # Given: random hands of 13 tiles in few suits, to often be tenpai
+    rng = np.random.default_rng(1)
+    wall = np.repeat(np.concatenate([np.arange(18), np.arange(27, 34)]), 4)
+
+    for _ in range(200):
+        drawn = rng.choice(wall, 13, replace=False)
+        counts = [int(count) for count in np.bincount(drawn, minlength=34)]
+
+        # When: find the waits among all tiles and among the honors
+        waits_mask = find_complete_waits(counts, range(34))
+        honor_waits_mask = find_complete_waits(counts, range(27, 34))
+
+        # Then: a tile is a wait if adding it completes the hand
+        for tile in range(34):
+            completed = counts[:]
+            completed[tile] += 1
+            assert bool(waits_mask >> tile & 1) == is_complete_hand(completed)
+        assert honor_waits_mask == waits_mask & ((1 << 7) - 1) << 27
+
+
+def test_agari_table_falls_back_to_generation(table_dir):
+    # Given: no table file
+    # When: get the agari table
+    table = get_agari_table()
+
+    # Then: the table is generated in the process
+    assert isinstance(table, bytearray)
+    assert not (table_dir / f"{AGARI_TABLE_NAME}.bin").exists()
+
+
+def test_build_and_load_agari_table(table_dir, capsys):
+    # Given: tables built by the command line interface
+    main(["build"])
+    assert str(table_dir / f"{AGARI_TABLE_NAME}.bin") in capsys.readouterr().out
+
+    # When: get the agari table
+    table = get_agari_table()
+
+    # Then: the table is mapped from its file
+    assert isinstance(table, memoryview)
+    assert table == generate_agari_table()
@@ -0,0 +1,58 @@
+import mmap
+
+from pymj.tables.table_file import (
+    HEADER,
+    TABLE_DIR_ENV,
+    load_table,
+    table_directory,
+    write_table,
+)
+
+
+def test_write_and_load_table(tmp_path):
+    # Given: a table written to a file
+    path = tmp_path / "table.bin"
+    table = bytes(range(256)) * 4
+    write_table(path, table, 3)
+
+    # When: load the table with its version
+    loaded = load_table(path, 3)
+
+    # Then: the table is mapped from the file
+    assert isinstance(loaded.obj, mmap.mmap)
+    assert loaded == table
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_load_invalid_table(tmp_path):
+    # Given: a table written to a file
+    path = tmp_path / "table.bin"
+    write_table(path, bytes(range(256)) * 4, 3)
+
+    # When / Then: missing files and other versions are not loaded
+    assert load_table(tmp_path / "missing.bin", 3) is None
+    assert load_table(path, 4) is None
+
+    # When / Then: corrupted files are not loaded
+    data = bytearray(path.read_bytes())
+    data[HEADER.size + 10] ^= 0xFF
+    path.write_bytes(bytes(data))
+    assert load_table(path, 3) is None
+
+    # When / Then: truncated files are not loaded
+    path.write_bytes(bytes(data[:-1]))
+    assert load_table(path, 3) is None
+    path.write_bytes(bytes(data[:5]))
+    assert load_table(path, 3) is None
+
+
+def test_table_directory(monkeypatch, tmp_path):
+    # Given: no table directory in the environment
+    monkeypatch.delenv(TABLE_DIR_ENV, raising=False)
+
+    # When / Then: tables are in the package
+    assert table_directory().parts[-3:] == ("pymj", "tables", "data")
+
+    # When / Then: the environment overrides the directory
+    monkeypatch.setenv(TABLE_DIR_ENV, str(tmp_path))
+    assert table_directory() == tmp_path
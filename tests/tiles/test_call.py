@@ -4,7 +4,9 @@ import pytest
 
 from pymj.enums.call_type import CallType
 from pymj.enums.player_relation import PlayerRelation
+from pymj.enums.tile_type import TileType
 from pymj.tiles.call import Call
+from pymj.tiles.tile import Tile
 
 
 @pytest.mark.parametrize(
@@ -156,3 +158,15 @@ def test_init_fail_if_invalid_player_relation(
     # Then: raise error when initialize
     with pytest.raises(ValueError):
         Call(call_tiles, call_type, player_relation)
+
+
+def test_red_mask(tiles):
+    # Given: pon of 5p including red five
+    red_five_pin = Tile(TileType.PIN, 5, is_red=True)
+    call = Call([red_five_pin, tiles["5p"], tiles["5p"]], CallType.PON)
+
+    # Then: red five of pin is recorded
+    assert call.red_mask == 0b010
+
+    # Then: call without red five has empty mask
+    assert Call([tiles["5p"]] * 3, CallType.PON).red_mask == 0
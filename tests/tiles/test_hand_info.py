@@ -2,6 +2,7 @@ import pytest
 
 from pymj.tiles.hand import Hand
 from pymj.tiles.hand_info import HandInfo
+from pymj.tiles.hand_parser import HandParser
 from pymj.tiles.tile_mapping import TileMapping
 
 
@@ -40,3 +41,17 @@ def test_total_count(tiles):
     # Then: 1
     index_1m = TileMapping.tile_to_index(tile_1m)
     assert total_count[index_1m] == 1
+
+
+def test_red_fives():
+    # Given: hand with red fives in concealed tiles, call and drawn tile
+    hand = HandParser.parse_hand("123m4p06s11z,p^000p")
+    hand.draw_tile(HandParser.parse_tile("0m"))
+
+    # When: create_from_hand
+    hand_info = HandInfo.create_from_hand(hand)
+
+    # Then: all red fives are counted
+    assert hand_info.red_mask == 0b111
+    assert hand_info.num_red_fives == 3
+    assert hand_info.total_count.red_mask == 0b111
@@ -250,3 +250,26 @@ def test_parse_hand(tiles):
     assert actual.calls[1].tiles == hand.calls[1].tiles
     assert actual.calls[1].call_type == hand.calls[1].call_type
     assert actual.calls[1].player_relation == hand.calls[1].player_relation
+
+
+@pytest.mark.parametrize(
+    "tile_str, expected",
+    [
+        ("0m", Tile(TileType.MAN, 5, is_red=True)),
+        ("0p", Tile(TileType.PIN, 5, is_red=True)),
+        ("0s", Tile(TileType.SOU, 5, is_red=True)),
+    ],
+)
+def test_parse_red_five(tile_str, expected):
+    # When: parse_tile
+    actual = HandParser.parse_tile(tile_str)
+
+    # Then: result is red five equal to plain five
+    assert actual == expected
+    assert actual.is_red
+
+
+def test_parse_red_five_fail():
+    # Then: raise error when parse red honor tile
+    with pytest.raises(ValueError):
+        HandParser.parse_tile("0z")
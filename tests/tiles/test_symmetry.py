@@ -0,0 +1,80 @@
+from pymj.enums.call_type import CallType
+from pymj.tiles.hand_parser import HandParser
+from pymj.tiles.symmetry import (
+    TRANSFORMS,
+    canonicalize,
+    create_hand_info,
+    invert_transform,
+)
+
+
+def test_transforms():
+    # Given: the suit permutation and mirroring transforms
+    # Then: there are 12 distinct permutations fixing the honors
+    assert len(set(TRANSFORMS)) == 12
+    assert TRANSFORMS[0] == tuple(range(34))
+    for transform in TRANSFORMS:
+        assert sorted(transform) == list(range(34))
+        assert transform[27:] == tuple(range(27, 34))
+        assert invert_transform(invert_transform(transform)) == transform
+
+
+def test_canonicalize_symmetric_hands(parse_hand_info):
+    # Given: hands differing by suit permutation and mirroring
+    hands = [
+        parse_hand_info("123m456p789s11222z"),
+        parse_hand_info("123p456s789m11222z"),
+        parse_hand_info("987s654m321p11222z"),
+    ]
+
+    # When: canonicalize each hand
+    results = [canonicalize(hand_info) for hand_info in hands]
+
+    # Then: they share a key, and the transform maps each hand to it
+    assert len({key for key, _ in results}) == 1
+    for hand_info, (key, transform) in zip(hands, results, strict=True):
+        counts = list(hand_info.concealed_count)
+        assert all(key[0][transform[tile]] == counts[tile] for tile in range(34))
+
+
+def test_canonicalize_distinguishes_asymmetric_hands(parse_hand_info):
+    # Given: hands not related by a transform
+    hand_info = parse_hand_info("123m456p789s11222z")
+    other_hand_info = parse_hand_info("123m456p789s11223z")
+
+    # When / Then: their keys differ
+    assert canonicalize(hand_info)[0] != canonicalize(other_hand_info)[0]
+
+
+def test_canonicalize_counts_agari_tile_and_calls(parse_hand_info):
+    # Given: hands with the same tiles drawn in different order, and a called hand
+    hand_info = parse_hand_info("123m456p789s1122z", "2z")
+    other_hand_info = parse_hand_info("123m456p789s1222z", "1z")
+    called_hand_info = parse_hand_info("123m456p1122z,c<789s")
+
+    # When: canonicalize the hands
+    key, _ = canonicalize(hand_info)
+    called_key, _ = canonicalize(called_hand_info)
+
+    # Then: the drawn tile does not change the key
+    assert canonicalize(other_hand_info)[0] == key
+
+    # Then: the call is kept in the key and in the recreated hand
+    assert called_key[1] == ((CallType.CHII.value, called_key[1][0][1]),)
+    recreated = create_hand_info(called_key)
+    assert recreated.agari_tile is None
+    assert [call_type for call_type, _ in recreated.call_counts] == [CallType.CHII]
+    assert canonicalize(recreated)[0] == called_key
+
+
+def test_create_hand_info_with_agari_tile(parse_hand_info):
+    # Given: key of a hand with a drawn tile
+    key, _ = canonicalize(parse_hand_info("123m456p789s1122z", "2z"))
+
+    # When: create_hand_info from the key
+    hand_info = create_hand_info(key)
+
+    # Then: the last tile is the winning tile
+    assert hand_info.concealed_count.num_tiles == 13
+    assert hand_info.agari_tile == HandParser.parse_tile("2z")
+    assert canonicalize(hand_info)[0] == key
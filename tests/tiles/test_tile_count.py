@@ -1,5 +1,6 @@
 import pytest
 
+from pymj.tiles.hand_parser import HandParser
 from pymj.tiles.tile_count import TileCount
 
 
@@ -130,3 +131,63 @@ def test_is_containing_only():
     # Then: raise error for invalid index
     with pytest.raises(IndexError):
         tile_count.is_containing_only([0, 1, 34])
+
+
+def test_red_mask():
+    # Given: tiles of "505m05p" parsed with two red fives
+    tiles = HandParser.parse_tile_group("505m") + HandParser.parse_tile_group("05p")
+
+    # When: create_from_tiles
+    tile_count = TileCount.create_from_tiles(tiles)
+
+    # Then: red fives are recorded without changing counts
+    assert tile_count[4] == 3
+    assert tile_count[13] == 2
+    assert tile_count.red_mask == 0b011
+    assert tile_count.num_red_fives == 2
+
+    # Then: red fives are kept when adding counts
+    red_sou_count = TileCount.create_from_tiles(HandParser.parse_tile_group("0s"))
+    assert (tile_count + red_sou_count).red_mask == 0b111
+
+    # Then: red fives are compared
+    assert tile_count != TileCount(list(tile_count))
+
+
+def test_red_mask_follows_counts():
+    # Given: tile count of "05m0p" with red fives of Man and Pin
+    tiles = HandParser.parse_tile_group("05m") + HandParser.parse_tile_group("0p")
+    tile_count = TileCount.create_from_tiles(tiles)
+
+    # When: the count of 5m drops to one and then to zero
+    tile_count[4] = 1
+    assert tile_count.red_mask == 0b011
+    tile_count[4] = 0
+
+    # Then: red five of Man is dropped with its tile
+    assert tile_count.red_mask == 0b010
+    assert tile_count.num_red_fives == 1
+
+    # When: the count of 5p is cleared by a negative index
+    tile_count[13 - 34] = 0
+
+    # Then: tile count equals an empty one
+    assert tile_count == TileCount()
+
+
+def test_pack_and_unpack():
+    # Given: tile count with four copies of a tile and red fives
+    tile_count = TileCount.create_from_tiles(
+        HandParser.parse_tile_group("1111m") + HandParser.parse_tile_group("05p"),
+    )
+
+    # Then: unpack restores packed tile count
+    assert TileCount.unpack(tile_count.pack()) == tile_count
+    assert TileCount().pack() == 0
+
+    # Then: packed tile counts differ by red fives
+    no_red_count = TileCount.create_from_tiles(
+        HandParser.parse_tile_group("1111m") + HandParser.parse_tile_group("55p"),
+    )
+    assert list(no_red_count) == list(tile_count)
+    assert no_red_count.pack() != tile_count.pack()
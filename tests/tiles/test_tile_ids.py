@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from pymj.tiles.tile_ids import (
+    id136_to_index,
+    ids136_to_counts,
+    ids136_to_indices,
+    ids136_to_red_masks,
+    index_to_id136,
+    indices_to_ids136,
+    is_red_id136,
+)
+from pymj.tiles.tile_mapping import TileMapping
+
+
+def test_id136_to_index_and_index_to_id136(tiles):
+    id_tile_map = {
+        0: "1m",
+        16: "5m",
+        35: "9m",
+        52: "5p",
+        88: "5s",
+        108: "1z",
+        135: "7z",
+    }
+    for tile_id, tile_str in id_tile_map.items():
+        index = TileMapping.tile_to_index(tiles[tile_str])
+        assert id136_to_index(tile_id) == index
+        assert index_to_id136(index, tile_id % 4) == tile_id
+
+
+@pytest.mark.parametrize("tile_id", [-1, 136])
+def test_id136_to_index_fail(tile_id):
+    with pytest.raises(ValueError):
+        id136_to_index(tile_id)
+
+
+def test_is_red_id136():
+    assert [tile_id for tile_id in range(136) if is_red_id136(tile_id)] == [16, 52, 88]
+
+
+def test_ids136_to_indices():
+    # Given: ids of two hands
+    ids = np.array([[0, 3, 4, 135], [16, 52, 88, 108]])
+
+    # Then: indices are ids divided by 4
+    assert ids136_to_indices(ids).tolist() == [[0, 0, 1, 33], [4, 13, 22, 27]]
+
+    # Then: raise error for invalid ids
+    with pytest.raises(ValueError):
+        ids136_to_indices([0, 136])
+
+
+def test_indices_to_ids136():
+    # Given: indices of two hands with repeated tiles
+    indices = np.array([[4, 0, 4, 4, 4], [33, 33, 1, 2, 3]])
+
+    # When: indices_to_ids136
+    ids = indices_to_ids136(indices)
+
+    # Then: repeated tiles get distinct copies, and red five is used last
+    assert ids.tolist() == [[19, 3, 18, 17, 16], [135, 134, 7, 11, 15]]
+    assert (ids136_to_indices(ids) == indices).all()
+
+    # Then: raise error for fifth copy of a tile
+    with pytest.raises(ValueError):
+        indices_to_ids136([0] * 5)
+
+
+def test_indices_to_ids136_scalar():
+    # Given: a single tile index
+    # When: indices_to_ids136
+    # Then: it gets the last copy
+    assert indices_to_ids136(4) == 19
+    assert indices_to_ids136(np.array([], dtype=int)).size == 0
+
+
+@pytest.mark.parametrize("indices", [-1, 34, 40, [[0, 34]]])
+def test_indices_to_ids136_fail(indices):
+    with pytest.raises(ValueError):
+        indices_to_ids136(indices)
+
+
+def test_ids136_to_counts():
+    # Given: random hands of 14 tiles from shuffled walls
+    rng = np.random.default_rng(0)
+    ids = np.array([rng.permutation(136)[:14] for _ in range(8)])
+
+    # When: ids136_to_counts
+    counts = ids136_to_counts(ids)
+
+    # Then: counts equal counts of each hand
+    assert counts.shape == (8, 34)
+    for hand_ids, hand_counts in zip(ids, counts, strict=True):
+        expected = np.bincount(hand_ids // 4, minlength=34)
+        assert (hand_counts == expected).all()
+
+    # Then: negative ids are ignored as padding
+    assert ids136_to_counts([0, 1, 135, -1, -1]).tolist() == [2] + [0] * 32 + [1]
+
+
+def test_ids136_to_red_masks():
+    # Given: ids of hands holding red fives of man and sou, and none
+    ids = np.array([[16, 17, 88, 0], [17, 53, 89, 1]])
+
+    # Then: red masks have bits of red fives
+    assert ids136_to_red_masks(ids).tolist() == [0b101, 0]
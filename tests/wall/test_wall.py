@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from pymj.tiles.tile_ids import ids136_to_counts
+from pymj.wall.wall import (
+    Wall,
+    deal_batch,
+    indicator_to_dora,
+    shuffle_batch,
+)
+
+
+def test_shuffle_is_reproducible_by_seed():
+    # Given: walls shuffled with generators of the same seed and another seed
+    wall1 = Wall.shuffle(np.random.default_rng(42))
+    wall2 = Wall.shuffle(np.random.default_rng(42))
+    wall3 = Wall.shuffle(np.random.default_rng(43))
+
+    # Then: walls of the same seed are equal
+    assert (wall1.tile_ids == wall2.tile_ids).all()
+    assert (wall1.tile_ids != wall3.tile_ids).any()
+    assert sorted(wall1.tile_ids.tolist()) == list(range(136))
+
+
+def test_wall_fail():
+    # Then: raise error for walls which are not permutations of 136 tile ids
+    with pytest.raises(ValueError):
+        Wall(range(135))
+    with pytest.raises(ValueError):
+        Wall([0, *range(1, 135), 0])
+
+
+def test_deal():
+    # Given: unshuffled wall
+    wall = Wall(range(136))
+
+    # When: deal
+    hands = wall.deal()
+
+    # Then: each player gets 13 consecutive tiles
+    assert [hand.num_tiles for hand in hands] == [13] * 4
+    assert list(hands[0]) == [4, 4, 4, 1] + [0] * 30
+    assert hands[1][3] == 3
+    assert hands[1].red_mask == 0b001
+    assert wall.deal_ids()[3].tolist() == list(range(39, 52))
+    assert wall.deal_packed() == [hand.pack() for hand in hands]
+
+
+def test_draw():
+    # Given: unshuffled wall
+    wall = Wall(range(136))
+
+    # Then: draws continue after dealt tiles until dead wall
+    assert wall.num_remaining == 70
+    assert wall.draw() == 52
+    assert wall.num_remaining == 69
+    draws = [wall.draw() for _ in range(69)]
+    assert draws[-1] == 121
+    assert wall.num_remaining == 0
+    with pytest.raises(ValueError):
+        wall.draw()
+
+
+def test_draw_replacement_and_dora_indicators():
+    # Given: unshuffled wall
+    wall = Wall(range(136))
+
+    # Then: a dora indicator is revealed from the dead wall
+    assert wall.dora_indicators == [126 // 4]
+    assert wall.ura_dora_indicators == [131 // 4]
+
+    # When: replacement tiles are drawn for four kans
+    replacements = [wall.draw_replacement() for _ in range(4)]
+
+    # Then: a new indicator is revealed for each kan and live wall shrinks
+    assert replacements == [122, 123, 124, 125]
+    assert wall.dora_indicators == [tile_id // 4 for tile_id in range(126, 131)]
+    assert wall.ura_dora_indicators == [tile_id // 4 for tile_id in range(131, 136)]
+    assert wall.num_remaining == 66
+    with pytest.raises(ValueError):
+        wall.draw_replacement()
+
+
+def test_indicator_to_dora():
+    # Then: dora is the next tile within suits, winds and dragons
+    assert indicator_to_dora(0) == 1
+    assert indicator_to_dora(8) == 0
+    assert indicator_to_dora(17) == 9
+    assert indicator_to_dora(26) == 18
+    assert indicator_to_dora(30) == 27
+    assert indicator_to_dora(33) == 31
+
+
+def test_shuffle_batch_and_deal_batch():
+    # Given: batch of walls shuffled with the same seed twice
+    walls = shuffle_batch(100, np.random.default_rng(0))
+    assert (walls == shuffle_batch(100, np.random.default_rng(0))).all()
+
+    # Then: every wall is a permutation of 136 tile ids
+    assert walls.shape == (100, 136)
+    assert (np.sort(walls, axis=1) == np.arange(136)).all()
+
+    # When: deal_batch
+    counts = deal_batch(walls)
+
+    # Then: counts equal hands dealt from each wall
+    assert counts.shape == (100, 4, 34)
+    assert (counts.sum(axis=2) == 13).all()
+    for wall_ids, wall_counts in zip(walls[:5], counts[:5], strict=True):
+        hands = Wall(wall_ids).deal()
+        assert wall_counts.tolist() == [list(hand) for hand in hands]
+    assert (counts[7, 2] == ids136_to_counts(walls[7, 26:39])).all()